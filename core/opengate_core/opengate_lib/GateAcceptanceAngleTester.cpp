@@ -18,6 +18,7 @@ GateAcceptanceAngleTester::GateAcceptanceAngleTester(
   fAASolid = nullptr;
   fAANavigator = nullptr;
   fAARotation = nullptr;
+  fBoundingSphereRadius = 0;
 
   // Retrieve the solid
   auto lvs = G4LogicalVolumeStore::GetInstance();
@@ -47,6 +48,41 @@ void GateAcceptanceAngleTester::UpdateTransform() {
                                          *fAARotation);
   // It is not fully clear why the AffineTransform need the inverse
   fAATransform = G4AffineTransform(fAARotation->inverse(), tr);
+
+  // Bounding sphere of the solid, in world coordinates
+  G4ThreeVector pmin;
+  G4ThreeVector pmax;
+  fAASolid->BoundingLimits(pmin, pmax);
+  fBoundingSphereRadius = (pmax - pmin).mag() / 2.0;
+  fBoundingSphereCenter =
+      fAATransform.Inverse().TransformPoint((pmin + pmax) / 2.0);
+}
+
+double
+GateAcceptanceAngleTester::GetAcceptanceCone(const G4ThreeVector &position,
+                                             G4ThreeVector &axis) const {
+  // all directions by default
+  axis = G4ThreeVector(0, 0, 1);
+  double cos_angle = -1.0;
+  // cone containing the bounding sphere of the volume
+  if (fIntersectionFlag) {
+    auto d = fBoundingSphereCenter - position;
+    auto dist = d.mag();
+    if (dist > fBoundingSphereRadius) {
+      axis = d / dist;
+      auto sin_angle = fBoundingSphereRadius / dist;
+      cos_angle = std::sqrt(1.0 - sin_angle * sin_angle);
+    }
+  }
+  // cone around the normal vector, if it is narrower
+  if (fNormalFlag) {
+    auto cos_tolerance = std::cos(fNormalAngleTolerance);
+    if (cos_tolerance > cos_angle) {
+      axis = fAARotation->inverse() * fNormalVector;
+      cos_angle = cos_tolerance;
+    }
+  }
+  return cos_angle;
 }
 
 bool GateAcceptanceAngleTester::TestIfAccept(
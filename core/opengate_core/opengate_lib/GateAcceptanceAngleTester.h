@@ -23,6 +23,11 @@ public:
 
   void UpdateTransform();
 
+  // Cone (in world coordinates) seen from the position, that contains all
+  // the accepted directions. Return the cosine of its half angle.
+  double GetAcceptanceCone(const G4ThreeVector &position,
+                           G4ThreeVector &axis) const;
+
 protected:
   std::string fAcceptanceAngleVolumeName;
   bool fIntersectionFlag;
@@ -33,6 +38,8 @@ protected:
   G4RotationMatrix *fAARotation;
   G4VSolid *fAASolid;
   G4Navigator *fAANavigator;
+  G4ThreeVector fBoundingSphereCenter;
+  double fBoundingSphereRadius;
 };
 
 #endif // GateAcceptanceAngleTester_h
@@ -9,9 +9,14 @@
 #include "G4RunManager.hh"
 #include "GateAcceptanceAngleTester.h"
 #include "GateHelpersDict.h"
+#include "Randomize.hh"
+#include <cmath>
+#include <limits>
 
 GateAcceptanceAngleTesterManager::GateAcceptanceAngleTesterManager() {
   fEnabledFlag = false;
+  fForcedDirectionFlag = false;
+  fConeProbability = 1.0;
   fNotAcceptedEvents = 0;
   fAALastRunId = -1;
   fPolicy = AASkipEvent;
@@ -39,6 +44,15 @@ void GateAcceptanceAngleTesterManager::Initialize(py::dict puser_info,
     Fatal(oss.str());
   }
 
+  // Sample the directions only toward the volumes (weighted)
+  fForcedDirectionFlag =
+      StrToBool(fAcceptanceAngleParam["forced_direction_flag"]);
+  if (fForcedDirectionFlag && !is_valid_type) {
+    std::ostringstream oss;
+    oss << "Cannot use 'forced_direction_flag' without 'iso' direction type";
+    Fatal(oss.str());
+  }
+
   // Cannot use SkipEvent with not a valid type of source
   if (!is_valid_type && fPolicy == AASkipEvent) {
     std::ostringstream oss;
@@ -83,17 +97,97 @@ bool GateAcceptanceAngleTesterManager::TestIfAccept(
     if (accept)
       return true;
   }
-  fNotAcceptedEvents++;
-  if (fNotAcceptedEvents > fMaxNotAcceptedEvents) {
+  AddNotAcceptedEvent();
+  return false;
+}
+
+void GateAcceptanceAngleTesterManager::AddNotAcceptedEvent() {
+  AddNotAcceptedEvents(1);
+}
+
+void GateAcceptanceAngleTesterManager::AddNotAcceptedEvents(double n) {
+  // (n is a double: it may be very large, or infinite, when it is sampled)
+  if (fNotAcceptedEvents + n > fMaxNotAcceptedEvents) {
     std::ostringstream oss;
-    oss << "Error, in AcceptanceAngleTest: " << fNotAcceptedEvents
+    oss << "Error, in AcceptanceAngleTest: " << fNotAcceptedEvents + n
         << " trials has been tested without accepted angle ; probably no "
            "possible direction here. Abort. ";
     Fatal(oss.str());
   }
+  fNotAcceptedEvents += static_cast<unsigned long>(n);
+}
+
+void GateAcceptanceAngleTesterManager::ComputeForcedDirectionCones(
+    const G4ThreeVector &position) {
+  // cones containing the accepted directions of each volume
+  auto n = fAATesters.size();
+  fConeAxes.resize(n);
+  fConeCosAngles.resize(n);
+  fConeCumulativeSolidAngles.resize(n);
+  double total = 0;
+  for (size_t i = 0; i < n; i++) {
+    fConeCosAngles[i] =
+        fAATesters[i]->GetAcceptanceCone(position, fConeAxes[i]);
+    total += CLHEP::twopi * (1.0 - fConeCosAngles[i]);
+    fConeCumulativeSolidAngles[i] = total;
+  }
+  // (the sum of the solid angles may be larger than 4pi if the cones overlap)
+  fConeProbability = std::min(1.0, total / (2.0 * CLHEP::twopi));
+}
+
+bool GateAcceptanceAngleTesterManager::TestIfInForcedDirectionCones() {
+  if (G4UniformRand() < fConeProbability)
+    return true;
+  AddNotAcceptedEvent();
   return false;
 }
 
+unsigned long
+GateAcceptanceAngleTesterManager::SkipEmissionsOutsideForcedDirectionCones() {
+  // Each emission is in the cones with the probability p, so the number of
+  // emissions before the first one in the cones follows a geometric
+  // distribution: floor(log(u)/log(1-p)), with u uniform in ]0,1[
+  double n = 0;
+  if (fConeProbability <= 0)
+    n = std::numeric_limits<double>::infinity();
+  else if (fConeProbability < 1)
+    n = std::floor(std::log(G4UniformRand()) / std::log1p(-fConeProbability));
+  AddNotAcceptedEvents(n);
+  return static_cast<unsigned long>(n);
+}
+
+G4ThreeVector
+GateAcceptanceAngleTesterManager::GenerateForcedDirection(double &weight) {
+  // choose a cone according to its solid angle
+  auto n = fAATesters.size();
+  auto total = fConeCumulativeSolidAngles[n - 1];
+  auto u = G4UniformRand() * total;
+  size_t k = 0;
+  while (k < n - 1 && u > fConeCumulativeSolidAngles[k])
+    k++;
+
+  // uniform direction in this cone
+  auto cos_theta = 1.0 - G4UniformRand() * (1.0 - fConeCosAngles[k]);
+  auto sin_theta = std::sqrt(std::max(0.0, 1.0 - cos_theta * cos_theta));
+  auto phi = CLHEP::twopi * G4UniformRand();
+  G4ThreeVector direction(sin_theta * std::cos(phi), sin_theta * std::sin(phi),
+                          cos_theta);
+  direction.rotateUz(fConeAxes[k]);
+
+  // The probability of this direction per emission is
+  // p * (number of cones containing it) / total, with p the probability to be
+  // in the cones, instead of 1/4pi for an isotropic source. With p =
+  // total/4pi, the weight is 1 where the cones do not overlap.
+  int m = 0;
+  for (size_t i = 0; i < n; i++) {
+    if (direction.dot(fConeAxes[i]) >= fConeCosAngles[i])
+      m++;
+  }
+  // (m == 0 can only be a rounding issue at the edge of cone k)
+  weight = total / (2.0 * CLHEP::twopi * fConeProbability * std::max(m, 1));
+  return direction;
+}
+
 void GateAcceptanceAngleTesterManager::StartAcceptLoop() {
   if (!fEnabledFlag)
     return;
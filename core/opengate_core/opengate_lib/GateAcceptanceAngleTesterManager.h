@@ -33,12 +33,44 @@ public:
 
   AAPolicyType GetPolicy() const { return fPolicy; }
 
+  bool IsForcedDirection() const {
+    return fEnabledFlag && fForcedDirectionFlag;
+  }
+
+  // Compute the acceptance cones of the volumes seen from this position
+  // (forced direction mode, once per emitted particle)
+  void ComputeForcedDirectionCones(const G4ThreeVector &position);
+
+  // An isotropic emission is in one of the cones with the probability
+  // total_solid_angle / 4pi. Return false if this emission is outside the
+  // cones: it is then counted as not accepted (skipped or zero energy, like
+  // with the rejection method, so the time of the events is the same)
+  bool TestIfInForcedDirectionCones();
+
+  // Number of isotropic emissions outside the cones before the next one
+  // inside (geometric distribution), sampled with a single random draw
+  // instead of one draw per emission. They are counted as not accepted.
+  unsigned long SkipEmissionsOutsideForcedDirectionCones();
+
+  // Sample a direction in the union of the cones, and the weight that
+  // compensates the overlap of the cones (1 if they do not overlap)
+  G4ThreeVector GenerateForcedDirection(double &weight);
+
 protected:
+  void AddNotAcceptedEvent();
+
+  void AddNotAcceptedEvents(double n);
+
   AAPolicyType fPolicy;
   std::map<std::string, std::string> fAcceptanceAngleParam;
   std::vector<GateAcceptanceAngleTester *> fAATesters{};
   std::vector<std::string> fAcceptanceAngleVolumeNames;
   bool fEnabledFlag;
+  bool fForcedDirectionFlag;
+  std::vector<G4ThreeVector> fConeAxes;
+  std::vector<double> fConeCosAngles;
+  std::vector<double> fConeCumulativeSolidAngles;
+  double fConeProbability;
   unsigned long fNotAcceptedEvents;
   unsigned long fMaxNotAcceptedEvents;
   int fAALastRunId;
@@ -18,18 +18,18 @@
 #include "GateHelpersDict.h"
 #include "GateHelpersImage.h"
 
+#include <algorithm>
 #include <cmath>
 #include <iostream>
 #include <itkAddImageFilter.h>
 #include <itkImageRegionIterator.h>
-#include <queue>
+#include <limits>
 #include <vector>
 
 // Mutex that will be used by thread to write in the edep/dose image
+// (SetWorkerEndRunMutex also protects the uncertainty check)
 G4Mutex SetWorkerEndRunMutex = G4MUTEX_INITIALIZER;
 G4Mutex SetPixelMutex = G4MUTEX_INITIALIZER;
-G4Mutex ComputeUncertaintyMutex = G4MUTEX_INITIALIZER;
-G4Mutex SetNbEventMutex = G4MUTEX_INITIALIZER;
 
 GateDoseActor::GateDoseActor(py::dict &user_info)
     : GateVActor(user_info, true) {}
@@ -42,11 +42,14 @@ void GateDoseActor::InitializeUserInfo(py::dict &user_info) {
   fTranslation = DictGetG4ThreeVector(user_info, "translation");
   // Hit type (random, pre, post etc)
   fHitType = DictGetStr(user_info, "hit_type");
+  // Per-thread buffers instead of mutex protected images
+  fThreadLocalScoringFlag = DictGetBool(user_info, "thread_local_scoring");
+  // Stopping powers to water from per-thread tables
+  fStoppingPowerTableFlag = DictGetBool(user_info, "stopping_power_table");
 }
 
 void GateDoseActor::InitializeCpp() {
   GateVActor::InitializeCpp();
-  NbOfThreads = G4Threading::GetNumberOfRunningWorkerThreads();
 
   // Create the image pointers
   // (the size and allocation will be performed on the py side)
@@ -71,8 +74,12 @@ void GateDoseActor::BeginOfRunActionMasterThread(int run_id) {
   NbOfEvent = 0;
 
   // for stop on target uncertainty. As we reset the nb of events, we reset also
-  // this variable
+  // these variables
   NbEventsNextCheck = NbEventsFirstCheck;
+  fNbOfFlushedEvents = 0;
+  fUncertaintyGoalReached = false;
+  fLastCheckTime = std::chrono::steady_clock::now();
+  NbOfThreads = std::max(1, G4Threading::GetNumberOfRunningWorkerThreads());
 
   // Important ! The volume may have moved, so we re-attach each run
   AttachImageToVolume<Image3DType>(cpp_edep_image, fPhysicalVolumeName,
@@ -112,19 +119,48 @@ void GateDoseActor::PrepareLocalDataForRun(threadLocalT &data,
             data.lastid_worker_flatimg.end(), 0);
 }
 
+void GateDoseActor::PrepareThreadLocalBuffersForRun(threadLocalT &data,
+                                                    int numberOfVoxels,
+                                                    bool squared) {
+  data.value_worker_flatimg.assign(numberOfVoxels, 0.0);
+  if (squared) {
+    data.squared_sum_worker_flatimg.assign(numberOfVoxels, 0.0);
+  }
+}
+
 void GateDoseActor::BeginOfRunAction(const G4Run *run) {
   int N_voxels = size_edep[0] * size_edep[1] * size_edep[2];
+  auto &check = fThreadLocalCheck.Get();
+  check.fNbOfEvent = 0;
+  check.fNbOfEventsSinceFlush = 0;
+  check.fLastFlushTime = std::chrono::steady_clock::now();
+  if (fToWaterFlag && fStoppingPowerTableFlag) {
+    auto *water = G4NistManager::Instance()->FindOrBuildMaterial("G4_WATER");
+    fStoppingPowerTables.Get().Initialize(water, false);
+  }
   if (fEdepSquaredFlag) {
     PrepareLocalDataForRun(fThreadLocalDataEdep.Get(), N_voxels);
   }
   if (fDoseSquaredFlag) {
     PrepareLocalDataForRun(fThreadLocalDataDose.Get(), N_voxels);
   }
+  if (fThreadLocalScoringFlag) {
+    PrepareThreadLocalBuffersForRun(fThreadLocalDataEdep.Get(), N_voxels,
+                                    fEdepSquaredFlag);
+    if (fDoseFlag || fDoseSquaredFlag) {
+      PrepareThreadLocalBuffersForRun(fThreadLocalDataDose.Get(), N_voxels,
+                                      fDoseSquaredFlag);
+    }
+    if (fCountsFlag) {
+      PrepareThreadLocalBuffersForRun(fThreadLocalDataCounts.Get(), N_voxels,
+                                      false);
+    }
+  }
 }
 
 void GateDoseActor::BeginOfEventAction(const G4Event *event) {
-  G4AutoLock mutex(&SetNbEventMutex);
-  NbOfEvent++;
+  // no mutex: the counts of all threads are summed at the end of the run
+  fThreadLocalCheck.Get().fNbOfEvent++;
 }
 
 void GateDoseActor::GetVoxelPosition(G4Step *step, G4ThreeVector &position,
@@ -138,7 +174,9 @@ void GateDoseActor::GetVoxelPosition(G4Step *step, G4ThreeVector &position,
   if (fHitType == "pre") {
     position = preGlobal;
   }
-  if (fHitType == "random") {
+  // (track_length is only used by the TLE photons: the other particles
+  // deposit their energy at a random position along the step)
+  if (fHitType == "random" || fHitType == "track_length") {
     auto x = G4UniformRand();
     auto direction = postGlobal - preGlobal;
     position = preGlobal + x * direction;
@@ -194,10 +232,15 @@ void GateDoseActor::SteppingAction(G4Step *step) {
       auto energy = (energy1 + energy2) / 2;
       if (p == G4Gamma::Gamma())
         p = G4Electron::Electron();
-      auto &emc = fThreadLocalDataEdep.Get().emcalc;
-      dedx_currstep =
-          emc.ComputeTotalDEDX(energy, p, current_material, dedx_cut);
-      dedx_water = emc.ComputeTotalDEDX(energy, p, water, dedx_cut);
+      if (fStoppingPowerTableFlag) {
+        fStoppingPowerTables.Get().GetDEDX(energy, p, current_material,
+                                           dedx_currstep, dedx_water);
+      } else {
+        auto &emc = fThreadLocalDataEdep.Get().emcalc;
+        dedx_currstep =
+            emc.ComputeTotalDEDX(energy, p, current_material, dedx_cut);
+        dedx_water = emc.ComputeTotalDEDX(energy, p, water, dedx_cut);
+      }
       if (dedx_currstep == 0 || dedx_water == 0) {
         edep = 0.;
       } else {
@@ -208,7 +251,7 @@ void GateDoseActor::SteppingAction(G4Step *step) {
     if (fDoseFlag || fDoseSquaredFlag) {
       double density;
       if (fToWaterFlag) {
-        auto *water =
+        static G4Material *water =
             G4NistManager::Instance()->FindOrBuildMaterial("G4_WATER");
         density = water->GetDensity();
       } else {
@@ -218,8 +261,17 @@ void GateDoseActor::SteppingAction(G4Step *step) {
       dose = edep / density;
     }
 
-    // all ImageAddValue calls in a mutexed {}-scope
-    {
+    if (fThreadLocalScoringFlag) {
+      // no mutex: the per-thread buffers are reduced at the end of the run
+      ScoreThreadLocalValue(fThreadLocalDataEdep.Get(), edep, index);
+      if (fDoseFlag) {
+        ScoreThreadLocalValue(fThreadLocalDataDose.Get(), dose, index);
+      }
+      if (fCountsFlag) {
+        ScoreThreadLocalValue(fThreadLocalDataCounts.Get(), 1, index);
+      }
+    } else {
+      // all ImageAddValue calls in a mutexed {}-scope
       G4AutoLock mutex(&SetPixelMutex);
       ImageAddValue<Image3DType>(cpp_edep_image, index, edep);
       if (fDoseFlag) {
@@ -230,7 +282,7 @@ void GateDoseActor::SteppingAction(G4Step *step) {
       }
     } // mutex scope
 
-    // ScoreSquaredValue() is thread-safe because it contains a mutex
+    // ScoreSquaredValue() is thread-safe (mutex or thread local buffer)
     if (fEdepSquaredFlag || fDoseSquaredFlag) {
       if (fEdepSquaredFlag) {
         ScoreSquaredValue(fThreadLocalDataEdep.Get(), cpp_edep_squared_image,
@@ -245,84 +297,120 @@ void GateDoseActor::SteppingAction(G4Step *step) {
 }
 
 void GateDoseActor::EndOfEventAction(const G4Event *event) {
+  // if the user didn't set uncertainty goal, do nothing. The check needs the
+  // per-thread buffers (thread local scoring is set on the python side).
+  if (fUncertaintyGoal == 0 || !fThreadLocalScoringFlag ||
+      fUncertaintyGoalReached) {
+    return;
+  }
 
-  // flush thread local data into global image (postponed for now)
+  // Each thread flushes its edep buffers into the images once it has done its
+  // share of the events remaining before the next check, or after the time
+  // interval. The rest of the time, nothing is shared between threads.
+  auto &check = fThreadLocalCheck.Get();
+  check.fNbOfEventsSinceFlush++;
+  auto remaining = NbEventsNextCheck - fNbOfFlushedEvents;
+  bool flush =
+      check.fNbOfEventsSinceFlush >= std::max(1, remaining / NbOfThreads);
+  if (!flush && fCheckIntervalSeconds > 0) {
+    std::chrono::duration<double> elapsed =
+        std::chrono::steady_clock::now() - check.fLastFlushTime;
+    flush = elapsed.count() >= fCheckIntervalSeconds;
+  }
+  if (flush) {
+    FlushEdepForUncertaintyCheck(check);
+  }
+}
 
-  // if the user didn't set uncertainty goal, do nothing
-  if (fUncertaintyGoal == 0) {
-    return;
+void GateDoseActor::FlushEdepForUncertaintyCheck(threadLocalCheckT &check) {
+  auto &data = fThreadLocalDataEdep.Get();
+  // The events of this thread are complete: the pending values can be squared
+  for (size_t i = 0; i < data.squared_worker_flatimg.size(); i++) {
+    auto v = data.squared_worker_flatimg[i];
+    data.squared_sum_worker_flatimg[i] += v * v;
+    data.squared_worker_flatimg[i] = 0;
   }
 
-  // check if we reached the Nb of events for next evaluation
-  if (NbOfEvent >= NbEventsNextCheck) {
-    // get thread idx. Ideally, only one thread should do the uncertainty
-    // calculation don't ask for thread idx if no MT
-    if (!G4Threading::IsMultithreadedApplication() ||
-        G4Threading::G4GetThreadId() == 0) {
-      // check stop criteria
-      std::cout << "NbEventsNextCheck: " << NbEventsNextCheck << std::endl;
-      double UncCurrent = ComputeMeanUncertainty();
-      if (UncCurrent <= fUncertaintyGoal) {
-        // fStopRunFlag = true;
-        fSourceManager->SetRunTerminationFlag(true);
-      } else {
-        // estimate Nevents at which next check should occour
-        NbEventsNextCheck = (UncCurrent / fUncertaintyGoal) *
-                            (UncCurrent / fUncertaintyGoal) * NbOfEvent *
-                            Overshoot;
-      }
-    }
+  G4AutoLock mutex(&SetWorkerEndRunMutex);
+  auto *edep = cpp_edep_image->GetBufferPointer();
+  auto *edep_squared = cpp_edep_squared_image->GetBufferPointer();
+  for (size_t i = 0; i < data.value_worker_flatimg.size(); i++) {
+    edep[i] += data.value_worker_flatimg[i];
+    edep_squared[i] += data.squared_sum_worker_flatimg[i];
   }
+  std::fill(data.value_worker_flatimg.begin(), data.value_worker_flatimg.end(),
+            0.0);
+  std::fill(data.squared_sum_worker_flatimg.begin(),
+            data.squared_sum_worker_flatimg.end(), 0.0);
+  fNbOfFlushedEvents += check.fNbOfEventsSinceFlush;
+  check.fNbOfEventsSinceFlush = 0;
+  check.fLastFlushTime = std::chrono::steady_clock::now();
+
+  // the images now contain exactly fNbOfFlushedEvents events
+  CheckUncertaintyGoal();
 }
 
-double GateDoseActor::ComputeMeanUncertainty() {
-  G4AutoLock mutex(&ComputeUncertaintyMutex);
-  itk::ImageRegionIterator<Image3DType> edep_iterator3D(
-      cpp_edep_image, cpp_edep_image->GetLargestPossibleRegion());
+void GateDoseActor::CheckUncertaintyGoal() {
+  // (called with SetWorkerEndRunMutex locked)
+  if (fUncertaintyGoalReached)
+    return;
+  auto now = std::chrono::steady_clock::now();
+  bool check = fNbOfFlushedEvents >= NbEventsNextCheck;
+  if (!check && fCheckIntervalSeconds > 0) {
+    std::chrono::duration<double> elapsed = now - fLastCheckTime;
+    check = elapsed.count() >= fCheckIntervalSeconds;
+  }
+  if (!check)
+    return;
+  fLastCheckTime = now;
+
+  int n = fNbOfFlushedEvents;
+  double UncCurrent = ComputeMeanUncertainty(n);
+  if (UncCurrent <= fUncertaintyGoal) {
+    // all threads stop generating events. The events of the other threads
+    // that are not flushed yet are added to the images at the end of the run.
+    fUncertaintyGoalReached = true;
+    fSourceManager->SetRunTerminationFlag(true);
+  } else {
+    // estimate Nevents at which next check should occur
+    double next = (UncCurrent / fUncertaintyGoal) *
+                  (UncCurrent / fUncertaintyGoal) * n * Overshoot;
+    NbEventsNextCheck =
+        std::max(n + 1, static_cast<int>(std::min(
+                            next, double(std::numeric_limits<int>::max()))));
+  }
+}
+
+double GateDoseActor::ComputeMeanUncertainty(double n) {
+  // mean relative uncertainty over the voxels above the edep threshold
+  auto *edep = cpp_edep_image->GetBufferPointer();
+  auto *edep_squared = cpp_edep_squared_image->GetBufferPointer();
+  auto nb_voxels =
+      cpp_edep_image->GetLargestPossibleRegion().GetNumberOfPixels();
   double mean_unc = 0.0;
   int n_voxel_unc = 0;
-  double n = 2.0;
-  n = NbOfEvent;
-
   if (n < 2.0) {
     n = 2.0;
   }
   double max_edep = GetMaxValueOfImage(cpp_edep_image);
-
-  for (edep_iterator3D.GoToBegin(); !edep_iterator3D.IsAtEnd();
-       ++edep_iterator3D) {
-    Image3DType::IndexType index_f = edep_iterator3D.GetIndex();
-    double val = cpp_edep_image->GetPixel(index_f);
-
+  for (size_t i = 0; i < nb_voxels; i++) {
+    double val = edep[i];
     if (val > max_edep * fThreshEdepPerc) {
       val /= n;
       n_voxel_unc++;
-      double val_squared_mean = cpp_edep_squared_image->GetPixel(index_f) / n;
-
-      double unc_i = (1.0 / (n - 1.0)) * (val_squared_mean - pow(val, 2));
-      if (unc_i < 0) {
-        std::cout << "unc_i: " << unc_i << std::endl;
-        std::cout << "edep: " << val << std::endl;
-        std::cout << "edep_squared_mean: " << val_squared_mean << std::endl;
-      }
-
-      unc_i = sqrt(unc_i) / (val);
-
-      if (unc_i > 1) {
-        std::cout << "unc_i: " << unc_i << std::endl;
-        std::cout << "edep: " << val << std::endl;
-        std::cout << "edep_squared_mean: " << val_squared_mean << std::endl;
-      }
+      double val_squared_mean = edep_squared[i] / n;
+      double unc_i = (1.0 / (n - 1.0)) * (val_squared_mean - val * val);
+      // (rounding errors may lead to a very small negative variance)
+      unc_i = std::sqrt(std::max(unc_i, 0.0)) / val;
       mean_unc += unc_i;
     }
-  };
+  }
 
   if (n_voxel_unc > 0 && mean_unc > 0) {
     mean_unc = mean_unc / n_voxel_unc;
   } else {
     mean_unc = 1.;
   }
-  std::cout << "unc: " << mean_unc << std::endl;
   return mean_unc;
 }
 
@@ -342,6 +430,10 @@ void GateDoseActor::ind2sub(int index_flat, Image3DType::IndexType &index3D) {
 }
 
 void GateDoseActor::EndOfRunAction(const G4Run *run) {
+  {
+    G4AutoLock mutex(&SetWorkerEndRunMutex);
+    NbOfEvent += fThreadLocalCheck.Get().fNbOfEvent;
+  }
   // FlushSquaredValue() is thread-safe because it contains a mutex
   if (fEdepSquaredFlag) {
     GateDoseActor::FlushSquaredValue(fThreadLocalDataEdep.Get(),
@@ -351,6 +443,34 @@ void GateDoseActor::EndOfRunAction(const G4Run *run) {
     GateDoseActor::FlushSquaredValue(fThreadLocalDataDose.Get(),
                                      cpp_dose_squared_image);
   }
+  // Reduce the per-thread buffers into the (shared) images, once per run
+  if (fThreadLocalScoringFlag) {
+    ReduceThreadLocalBuffer(fThreadLocalDataEdep.Get().value_worker_flatimg,
+                            cpp_edep_image);
+    if (fDoseFlag) {
+      ReduceThreadLocalBuffer(fThreadLocalDataDose.Get().value_worker_flatimg,
+                              cpp_dose_image);
+    }
+    if (fCountsFlag) {
+      ReduceThreadLocalBuffer(fThreadLocalDataCounts.Get().value_worker_flatimg,
+                              cpp_counts_image);
+    }
+  }
+}
+
+void GateDoseActor::ScoreThreadLocalValue(threadLocalT &data, double value,
+                                          Image3DType::IndexType index) {
+  data.value_worker_flatimg[sub2ind(index)] += value;
+}
+
+void GateDoseActor::ReduceThreadLocalBuffer(const std::vector<double> &buffer,
+                                            Image3DType::Pointer cpp_image) {
+  // The flat index (sub2ind) follows the itk buffer order (x fastest)
+  G4AutoLock mutex(&SetWorkerEndRunMutex);
+  auto *pixels = cpp_image->GetBufferPointer();
+  for (size_t i = 0; i < buffer.size(); i++) {
+    pixels[i] += buffer[i];
+  }
 }
 
 void GateDoseActor::ScoreSquaredValue(threadLocalT &data,
@@ -368,7 +488,9 @@ void GateDoseActor::ScoreSquaredValue(threadLocalT &data,
     // Different event : square deposited quantity from the last event ID
     // and start accumulating deposited quantity for this new event ID
     auto v = data.squared_worker_flatimg[index_flat];
-    {
+    if (fThreadLocalScoringFlag) {
+      data.squared_sum_worker_flatimg[index_flat] += v * v;
+    } else {
       G4AutoLock mutex(&SetPixelMutex);
       ImageAddValue<Image3DType>(cpp_image, index, v * v);
     }
@@ -379,6 +501,15 @@ void GateDoseActor::ScoreSquaredValue(threadLocalT &data,
 
 void GateDoseActor::FlushSquaredValue(threadLocalT &data,
                                       Image3DType::Pointer cpp_image) {
+  if (fThreadLocalScoringFlag) {
+    // add the pending values of the last events, then reduce once
+    for (size_t i = 0; i < data.squared_worker_flatimg.size(); i++) {
+      auto v = data.squared_worker_flatimg[i];
+      data.squared_sum_worker_flatimg[i] += v * v;
+    }
+    ReduceThreadLocalBuffer(data.squared_sum_worker_flatimg, cpp_image);
+    return;
+  }
   G4AutoLock mutex(&SetPixelMutex);
   itk::ImageRegionIterator<Image3DType> iterator3D(
       cpp_image, cpp_image->GetLargestPossibleRegion());
@@ -393,23 +524,9 @@ void GateDoseActor::FlushSquaredValue(threadLocalT &data,
 int GateDoseActor::EndOfRunActionMasterThread(int run_id) { return 0; }
 
 double GateDoseActor::GetMaxValueOfImage(Image3DType::Pointer imageP) {
-  itk::ImageRegionIterator<Image3DType> iterator3D(
-      imageP, imageP->GetLargestPossibleRegion());
-  Image3DType::PixelType max = 0;
-  Image3DType::IndexType index_max;
-  // keep track of the 10 highest values of the image
-  std::priority_queue<double, std::vector<double>, std::greater<double>> pq;
-  for (iterator3D.GoToBegin(); !iterator3D.IsAtEnd(); ++iterator3D) {
-    Image3DType::IndexType index_f = iterator3D.GetIndex();
-    Image3DType::PixelType val = imageP->GetPixel(index_f);
-    if (val > max) {
-      max = val;
-      index_max = index_f;
-      pq.push(max);
-      if (pq.size() > 10) {
-        pq.pop();
-      }
-    }
-  }
-  return max;
+  auto *pixels = imageP->GetBufferPointer();
+  auto n = imageP->GetLargestPossibleRegion().GetNumberOfPixels();
+  if (n == 0)
+    return 0;
+  return std::max(0.0, *std::max_element(pixels, pixels + n));
 }
@@ -13,11 +13,14 @@
 #include "GateVActor.h"
 #include "itkImage.h"
 #include <G4Threading.hh>
+#include <atomic>
+#include <chrono>
 #include <iostream>
 #include <pybind11/stl.h>
 
 #include "G4EmCalculator.hh"
 #include "G4NistManager.hh"
+#include "GateStoppingPowerTables.h"
 
 namespace py = pybind11;
 
@@ -68,6 +71,14 @@ public:
 
   inline bool GetCountsFlag() const { return fCountsFlag; }
 
+  inline void SetThreadLocalScoringFlag(const bool b) {
+    fThreadLocalScoringFlag = b;
+  }
+
+  inline bool GetThreadLocalScoringFlag() const {
+    return fThreadLocalScoringFlag;
+  }
+
   inline void SetUncertaintyGoal(const double b) { fUncertaintyGoal = b; }
 
   inline void SetThreshEdepPerc(const double b) { fThreshEdepPerc = b; }
@@ -76,6 +87,10 @@ public:
 
   inline void SetNbEventsFirstCheck(const int b) { NbEventsFirstCheck = b; }
 
+  inline void SetCheckIntervalSeconds(const double b) {
+    fCheckIntervalSeconds = b;
+  }
+
   inline std::string GetPhysicalVolumeName() const {
     return fPhysicalVolumeName;
   }
@@ -90,7 +105,7 @@ public:
   void ind2sub(int index, Image3DType::IndexType &index3D);
 
   double GetMaxValueOfImage(Image3DType::Pointer imageP);
-  double ComputeMeanUncertainty();
+  double ComputeMeanUncertainty(double n);
 
   // The image is accessible on py side (shared by all threads)
   Image3DType::Pointer cpp_edep_image;
@@ -105,6 +120,19 @@ public:
     G4EmCalculator emcalc;
     std::vector<double> squared_worker_flatimg;
     std::vector<int> lastid_worker_flatimg;
+    // only used with thread local scoring: per-thread accumulation of the
+    // value and of the squared value, reduced into the images at end of run
+    std::vector<double> value_worker_flatimg;
+    std::vector<double> squared_sum_worker_flatimg;
+  };
+
+  // Per-thread state of the stop on uncertainty goal
+  struct threadLocalCheckT {
+    // events of this thread in the current run
+    int fNbOfEvent;
+    // events not yet flushed into the shared images
+    int fNbOfEventsSinceFlush;
+    std::chrono::steady_clock::time_point fLastFlushTime;
   };
 
   void ScoreSquaredValue(threadLocalT &data, Image3DType::Pointer cpp_image,
@@ -115,12 +143,29 @@ public:
 
   void PrepareLocalDataForRun(threadLocalT &data, int numberOfVoxels);
 
+  void PrepareThreadLocalBuffersForRun(threadLocalT &data, int numberOfVoxels,
+                                       bool squared);
+
+  void ScoreThreadLocalValue(threadLocalT &data, double value,
+                             Image3DType::IndexType index);
+
+  void ReduceThreadLocalBuffer(const std::vector<double> &buffer,
+                               Image3DType::Pointer cpp_image);
+
+  void FlushEdepForUncertaintyCheck(threadLocalCheckT &check);
+
+  void CheckUncertaintyGoal();
+
   void GetVoxelPosition(G4Step *step, G4ThreeVector &position, bool &isInside,
                         Image3DType::IndexType &index) const;
 
   // Option: indicate we must convert to dose to water
   bool fToWaterFlag{};
 
+  // Option: tabulated stopping powers (per thread) for the conversion to
+  // water, instead of two G4EmCalculator calls per step
+  bool fStoppingPowerTableFlag{};
+
   // Option: indicate if we must compute edep squared
   bool fEdepSquaredFlag{};
 
@@ -131,6 +176,10 @@ public:
   // Option: Are counts to be scored
   bool fCountsFlag{};
 
+  // Option: accumulate in per-thread buffers (no mutex in the stepping
+  // action), the images are only filled at the end of the run
+  bool fThreadLocalScoringFlag{};
+
   double fVoxelVolume{};
 
   // Option: set target statistical uncertainty for each run
@@ -138,15 +187,22 @@ public:
   double fThreshEdepPerc;
   double Overshoot;
 
+  // Number of events of the run, summed over the threads at the end of run
   int NbOfEvent = 0;
   // set from python side. It will be overwritten by an estimation of the Nb of
   // events needed to achieve the goal uncertainty.
   int NbEventsFirstCheck;
-  int NbEventsNextCheck;
+  std::atomic<int> NbEventsNextCheck{};
   int NbOfThreads = 0;
 
-  double goalUncertainty;
-  double threshEdepPerc{};
+  // Option: also check the uncertainty after this time (0 = never)
+  double fCheckIntervalSeconds{};
+
+  // Number of events whose edep (squared) is in the shared images, and time
+  // of the last uncertainty check (written under SetWorkerEndRunMutex)
+  std::atomic<int> fNbOfFlushedEvents{};
+  std::chrono::steady_clock::time_point fLastCheckTime;
+  std::atomic<bool> fUncertaintyGoalReached{};
 
   std::string fPhysicalVolumeName;
 
@@ -154,8 +210,11 @@ public:
   std::string fHitType;
 
 protected:
+  G4Cache<GateStoppingPowerTables> fStoppingPowerTables;
   G4Cache<threadLocalT> fThreadLocalDataEdep;
   G4Cache<threadLocalT> fThreadLocalDataDose;
+  G4Cache<threadLocalT> fThreadLocalDataCounts;
+  G4Cache<threadLocalCheckT> fThreadLocalCheck;
 };
 
 #endif // GateDoseActor_h
@@ -6,6 +6,7 @@
    -------------------------------------------------- */
 
 #include "GateEventAction.h"
+#include "GateProfiler.h"
 
 GateEventAction::GateEventAction() : G4UserEventAction() {}
 
@@ -20,12 +21,14 @@ void GateEventAction::RegisterActor(GateVActor *actor) {
 
 void GateEventAction::BeginOfEventAction(const G4Event *event) {
   for (auto actor : fBeginOfEventAction_actors) {
+    GateProfiler::Timer timer(actor, "BeginOfEventAction");
     actor->BeginOfEventAction(event);
   }
 }
 
 void GateEventAction::EndOfEventAction(const G4Event *event) {
   for (auto actor : fEndOfEventAction_actors) {
+    GateProfiler::Timer timer(actor, "EndOfEventAction");
     actor->EndOfEventAction(event);
   }
 }
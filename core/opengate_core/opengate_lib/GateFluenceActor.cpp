@@ -33,6 +33,8 @@ void GateFluenceActor::InitializeUserInfo(py::dict &user_info) {
   // IMPORTANT: call the base class method
   GateVActor::InitializeUserInfo(user_info);
   fTranslation = DictGetG4ThreeVector(user_info, "translation");
+  fHitType = DictGetStr(user_info, "hit_type");
+  fTrackLengthFlag = fHitType == "track_length";
 }
 
 void GateFluenceActor::InitializeCpp() {
@@ -52,10 +54,31 @@ void GateFluenceActor::BeginOfRunActionMasterThread(int run_id) {
   // Important ! The volume may have moved, so we (re-)attach each run
   AttachImageToVolume<Image3DType>(cpp_fluence_image, fPhysicalVolumeName,
                                    fTranslation);
+  auto spacing = cpp_fluence_image->GetSpacing();
+  fVoxelVolume = spacing[0] * spacing[1] * spacing[2];
   NbOfEvent = 0;
 }
 
 void GateFluenceActor::SteppingAction(G4Step *step) {
+  // track-length estimator: sum of the weighted track lengths in each
+  // voxel, divided by the voxel volume
+  if (fTrackLengthFlag) {
+    const auto &transform =
+        step->GetPreStepPoint()->GetTouchable()->GetHistory()->GetTransform(0);
+    const auto p0 =
+        transform.TransformPoint(step->GetPreStepPoint()->GetPosition());
+    const auto p1 =
+        transform.TransformPoint(step->GetPostStepPoint()->GetPosition());
+    const auto w = step->GetTrack()->GetWeight() / fVoxelVolume;
+    G4AutoLock FluenceMutex(&SetPixelFluenceMutex);
+    ImageTraverseSegment<Image3DType>(
+        cpp_fluence_image, p0, p1,
+        [&](const Image3DType::IndexType &index, const double length) {
+          ImageAddValue<Image3DType>(cpp_fluence_image, index, w * length);
+        });
+    return;
+  }
+
   // same method to consider only entering tracks
   if (step->GetPreStepPoint()->GetStepStatus() == fGeomBoundary) {
     // the pre-position is at the edge
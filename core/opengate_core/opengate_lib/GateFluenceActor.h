@@ -55,6 +55,10 @@ private:
   std::string fPhysicalVolumeName;
   G4ThreeVector fTranslation;
   std::string fHitType;
+  // Option: track-length fluence (per unit area) instead of the number of
+  // entering particles
+  bool fTrackLengthFlag{};
+  double fVoxelVolume{};
 };
 
 #endif // GateFluenceActor_h
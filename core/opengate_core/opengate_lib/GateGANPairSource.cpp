@@ -61,6 +61,22 @@ void GateGANPairSource::SetGeneratorInfo(py::dict &user_info) {
   }
 }
 
+void GateGANPairSource::CheckBatchOfParticles() {
+  GateGANSource::CheckBatchOfParticles();
+  // position, direction and energy are always set by the GAN
+  CheckBatchVectorSize(fPositionX2, "fPositionX2");
+  CheckBatchVectorSize(fPositionY2, "fPositionY2");
+  CheckBatchVectorSize(fPositionZ2, "fPositionZ2");
+  CheckBatchVectorSize(fDirectionX2, "fDirectionX2");
+  CheckBatchVectorSize(fDirectionY2, "fDirectionY2");
+  CheckBatchVectorSize(fDirectionZ2, "fDirectionZ2");
+  CheckBatchVectorSize(fEnergy2, "fEnergy2");
+  if (fTime_is_set_by_GAN)
+    CheckBatchVectorSize(fTime2, "fTime2");
+  if (fWeight_is_set_by_GAN)
+    CheckBatchVectorSize(fWeight2, "fWeight2");
+}
+
 void GateGANPairSource::GeneratePrimaries(G4Event *event,
                                           double current_simulation_time) {
   if (fCurrentIndex >= fCurrentBatchSize)
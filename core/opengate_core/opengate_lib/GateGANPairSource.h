@@ -31,6 +31,8 @@ public:
 
   void GeneratePrimariesPair(G4Event *event, double current_simulation_time);
 
+  void CheckBatchOfParticles() override;
+
   // For pairs of particles
   std::vector<double> fPositionX2;
   std::vector<double> fPositionY2;
@@ -130,21 +130,44 @@ void GateGANSource::GenerateBatchOfParticles() {
 
   // Then, we need to get the exact number of particle in the batch.
   // It depends on what is managed by the GAN
-  if (fPosition_is_set_by_GAN) {
+  if (fPosition_is_set_by_GAN)
     fCurrentBatchSize = fPositionX.size();
-    return;
-  }
-  if (fEnergy_is_set_by_GAN) {
+  else if (fEnergy_is_set_by_GAN)
     fCurrentBatchSize = fEnergy.size();
-    return;
+  else if (fDirection_is_set_by_GAN)
+    fCurrentBatchSize = fDirectionX.size();
+  else if (fTime_is_set_by_GAN)
+    fCurrentBatchSize = fTime.size();
+  CheckBatchOfParticles();
+}
+
+void GateGANSource::CheckBatchOfParticles() {
+  if (fPosition_is_set_by_GAN) {
+    CheckBatchVectorSize(fPositionX, "fPositionX");
+    CheckBatchVectorSize(fPositionY, "fPositionY");
+    CheckBatchVectorSize(fPositionZ, "fPositionZ");
   }
   if (fDirection_is_set_by_GAN) {
-    fCurrentBatchSize = fDirectionX.size();
-    return;
+    CheckBatchVectorSize(fDirectionX, "fDirectionX");
+    CheckBatchVectorSize(fDirectionY, "fDirectionY");
+    CheckBatchVectorSize(fDirectionZ, "fDirectionZ");
   }
-  if (fTime_is_set_by_GAN) {
-    fCurrentBatchSize = fTime.size();
-    return;
+  if (fEnergy_is_set_by_GAN)
+    CheckBatchVectorSize(fEnergy, "fEnergy");
+  if (fTime_is_set_by_GAN)
+    CheckBatchVectorSize(fTime, "fTime");
+  if (fWeight_is_set_by_GAN)
+    CheckBatchVectorSize(fWeight, "fWeight");
+}
+
+void GateGANSource::CheckBatchVectorSize(const std::vector<double> &values,
+                                         const std::string &name) const {
+  if (values.size() != fCurrentBatchSize) {
+    std::ostringstream oss;
+    oss << "Error, the GAN source '" << fName << "' generated a batch of "
+        << fCurrentBatchSize << " particles, but " << name << " contains "
+        << values.size() << " values";
+    Fatal(oss.str());
   }
 }
 
@@ -54,6 +54,12 @@ public:
 
   void GenerateBatchOfParticles();
 
+  // Check that all the vectors set by the GAN have the size of the batch
+  virtual void CheckBatchOfParticles();
+
+  void CheckBatchVectorSize(const std::vector<double> &values,
+                            const std::string &name) const;
+
   bool fPosition_is_set_by_GAN;
   bool fDirection_is_set_by_GAN;
   bool fEnergy_is_set_by_GAN;
@@ -29,6 +29,7 @@ GateGenericSource::GateGenericSource() : GateVSource() {
   fDirectionRelativeToAttachedVolume = false;
   fUserParticleLifeTime = -1;
   fBackToBackMode = false;
+  fSharedVoxelPositionGenerator = nullptr;
 }
 
 GateGenericSource::~GateGenericSource() {
@@ -65,6 +66,11 @@ void GateGenericSource::SetProbabilityCDF(const std::vector<double> &cdf) {
   fProbabilityCDF = cdf;
 }
 
+void GateGenericSource::SetSharedVoxelPositionGenerator(
+    GateSPSVoxelsPosDistribution *pg) {
+  fSharedVoxelPositionGenerator = pg;
+}
+
 void GateGenericSource::SetTAC(const std::vector<double> &times,
                                const std::vector<double> &activities) {
   fTAC_Times = times;
@@ -198,6 +204,13 @@ void GateGenericSource::PrepareNextRun() {
     ang->SetFocusPoint(new_f);
     ang->fDirectionRelativeToAttachedVolume = false;
   }
+
+  // the voxelized distribution (if any) is moved like the volume
+  // (it is shared, but its transform is thread local)
+  if (fSharedVoxelPositionGenerator != nullptr) {
+    fSharedVoxelPositionGenerator->SetGlobalTransform(l.fGlobalRotation,
+                                                      l.fGlobalTranslation);
+  }
 }
 
 void GateGenericSource::UpdateEffectiveEventTime(
@@ -205,6 +218,14 @@ void GateGenericSource::UpdateEffectiveEventTime(
   auto &ll = GetThreadLocalDataGenericSource();
   unsigned long n = 0;
   ll.fEffectiveEventTime = current_simulation_time;
+  // In forced direction mode, the number of skipped particles is sampled at
+  // once, and can be large: the sum of their (exponential) time intervals is
+  // then drawn from a gamma distribution
+  if (ll.fAAManager->IsForcedDirection() && skipped_particle > 0) {
+    ll.fEffectiveEventTime +=
+        G4RandGamma::shoot(static_cast<double>(skipped_particle), fActivity);
+    return;
+  }
   while (n < skipped_particle) {
     ll.fEffectiveEventTime =
         ll.fEffectiveEventTime - log(G4UniformRand()) * (1.0 / fActivity);
@@ -253,16 +274,18 @@ void GateGenericSource::GeneratePrimaries(G4Event *event,
     }
   }
 
-  // weight ?
+  // weight ? (multiplied by the weight of the forced direction, if any)
   if (fWeight > 0) {
     if (fWeightSigma < 0) {
       for (auto i = 0; i < event->GetNumberOfPrimaryVertex(); i++) {
-        event->GetPrimaryVertex(i)->SetWeight(fWeight);
+        auto *vertex = event->GetPrimaryVertex(i);
+        vertex->SetWeight(fWeight * vertex->GetWeight());
       }
     } else { // weight is Gaussian
       for (auto i = 0; i < event->GetNumberOfPrimaryVertex(); i++) {
+        auto *vertex = event->GetPrimaryVertex(i);
         double w = G4RandGauss::shoot(fWeight, fWeightSigma);
-        event->GetPrimaryVertex(i)->SetWeight(w);
+        vertex->SetWeight(w * vertex->GetWeight());
       }
     }
   }
@@ -334,8 +357,21 @@ void GateGenericSource::InitializePosition(py::dict puser_info) {
   auto user_info = py::dict(puser_info["position"]);
   auto *pos = ll.fSPS->GetPosDist();
   auto pos_type = DictGetStr(user_info, "type");
-  std::vector<std::string> l = {"sphere", "point", "box", "disc", "cylinder"};
+  std::vector<std::string> l = {"sphere", "point",    "box",
+                                "disc",   "cylinder", "voxels"};
   CheckIsIn(pos_type, l);
+  if (pos_type == "voxels") {
+    // The voxelized distribution is built once on the py side and shared
+    // (read only) by all threads, so it is not copied here
+    if (fSharedVoxelPositionGenerator == nullptr) {
+      Fatal("The source '" + fName +
+            "' has a 'voxels' position but no voxelized distribution");
+    }
+    ll.fSPS->SetPosGenerator(fSharedVoxelPositionGenerator);
+    pos = fSharedVoxelPositionGenerator;
+    // we set a fake value (not used)
+    pos->SetPosDisType("Point");
+  }
   auto translation = DictGetG4ThreeVector(user_info, "translation");
   fInitTranslation = translation;
   if (pos_type == "point") {
@@ -9,6 +9,7 @@
 #define GateGenericSource_h
 
 #include "GateAcceptanceAngleTesterManager.h"
+#include "GateSPSVoxelsPosDistribution.h"
 #include "GateSingleParticleSource.h"
 #include "GateVSource.h"
 #include <pybind11/stl.h>
@@ -44,6 +45,10 @@ public:
   unsigned long GetTotalSkippedEvents() const;
   unsigned long GetTotalZeroEvents() const;
 
+  // [py side] voxelized position distribution (position type 'voxels'),
+  // built once and shared by all threads and possibly by several sources
+  void SetSharedVoxelPositionGenerator(GateSPSVoxelsPosDistribution *pg);
+
 protected:
   //  We cannot not use a std::unique_ptr
   //  (or maybe by controlling the deletion during the CleanWorkerThread ?)
@@ -97,6 +102,9 @@ protected:
   // bool fInitConfine;
   std::string fConfineVolume;
 
+  // shared voxelized position distribution (read only, not owned)
+  GateSPSVoxelsPosDistribution *fSharedVoxelPositionGenerator;
+
   // for beta plus CDF
   std::vector<double> fEnergyCDF;
   std::vector<double> fProbabilityCDF;
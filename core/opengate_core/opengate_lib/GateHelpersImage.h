@@ -11,6 +11,7 @@
 #include "G4LogicalVolumeStore.hh"
 #include "G4PhysicalVolumeStore.hh"
 #include "GateHelpers.h"
+#include "itkContinuousIndex.h"
 #include "itkImage.h"
 
 template <class ImageType>
@@ -24,6 +25,14 @@ void AttachImageToVolume(typename ImageType::Pointer image,
                          G4ThreeVector initial_translation = G4ThreeVector(),
                          G4RotationMatrix img_rotation = G4RotationMatrix());
 
+// Exact traversal (Siddon) of the voxels crossed by the segment [p0, p1],
+// given in the coordinate system of the image. The callback f(index, length)
+// is called for each crossed voxel with the length of the segment inside it.
+template <class ImageType, class F>
+void ImageTraverseSegment(typename ImageType::Pointer image,
+                          const G4ThreeVector &p0, const G4ThreeVector &p1,
+                          F &&f);
+
 #include "GateHelpersImage.txx"
 
 #endif // OPENGATE_CORE_OPENGATEHELPERSIMAGE_H
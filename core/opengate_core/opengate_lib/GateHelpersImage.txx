@@ -7,6 +7,9 @@
 
 #include "G4LogicalVolume.hh"
 #include "GateHelpersGeometry.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
 
 template<class ImageType>
 void ImageAddValue(typename ImageType::Pointer image,
@@ -53,3 +56,87 @@ void AttachImageToVolume(typename ImageType::Pointer image,
   image->SetOrigin(o);
   image->SetDirection(dir);
 }
+
+template<class ImageType, class F>
+void ImageTraverseSegment(typename ImageType::Pointer image,
+                          const G4ThreeVector &p0, const G4ThreeVector &p1,
+                          F &&f) {
+  const auto length = (p1 - p0).mag();
+  if (length <= 0)
+    return;
+
+  // continuous indices of both ends (the transform is affine, so the
+  // parameter t in [0, 1] along the segment is the same in both spaces)
+  typename ImageType::PointType point0, point1;
+  for (auto i = 0; i < 3; i++) {
+    point0[i] = p0[i];
+    point1[i] = p1[i];
+  }
+  itk::ContinuousIndex<double, 3> c0, c1;
+  image->TransformPhysicalPointToContinuousIndex(point0, c0);
+  image->TransformPhysicalPointToContinuousIndex(point1, c1);
+
+  // shift by half a voxel so that the voxel i spans [i, i+1)
+  // and clip the segment to the image: t in [t_min, t_max]
+  const auto size = image->GetLargestPossibleRegion().GetSize();
+  double a[3], d[3];
+  double t_min = 0.0;
+  double t_max = 1.0;
+  for (auto i = 0; i < 3; i++) {
+    a[i] = c0[i] + 0.5;
+    d[i] = c1[i] - c0[i];
+    const double n = size[i];
+    if (d[i] == 0.0) {
+      if (a[i] < 0.0 || a[i] >= n)
+        return;
+      continue;
+    }
+    const auto ta = -a[i] / d[i];
+    const auto tb = (n - a[i]) / d[i];
+    t_min = std::max(t_min, std::min(ta, tb));
+    t_max = std::min(t_max, std::max(ta, tb));
+  }
+  if (t_min >= t_max)
+    return;
+
+  // first voxel and parametric position of the next boundary on each axis
+  typename ImageType::IndexType index;
+  double t_next[3], t_delta[3];
+  int step[3];
+  for (auto i = 0; i < 3; i++) {
+    const long n = size[i];
+    auto k = static_cast<long>(std::floor(a[i] + t_min * d[i]));
+    index[i] = std::clamp(k, 0L, n - 1);
+    if (d[i] > 0) {
+      step[i] = 1;
+      t_next[i] = (index[i] + 1 - a[i]) / d[i];
+      t_delta[i] = 1.0 / d[i];
+    } else if (d[i] < 0) {
+      step[i] = -1;
+      t_next[i] = (index[i] - a[i]) / d[i];
+      t_delta[i] = -1.0 / d[i];
+    } else {
+      step[i] = 0;
+      t_next[i] = std::numeric_limits<double>::infinity();
+      t_delta[i] = 0.0;
+    }
+  }
+
+  // walk from boundary to boundary
+  auto t = t_min;
+  while (t < t_max) {
+    auto k = 0;
+    if (t_next[1] < t_next[k])
+      k = 1;
+    if (t_next[2] < t_next[k])
+      k = 2;
+    const auto t_exit = std::min(t_next[k], t_max);
+    if (t_exit > t)
+      f(index, (t_exit - t) * length);
+    t = t_exit;
+    index[k] += step[k];
+    t_next[k] += t_delta[k];
+    if (index[k] < 0 || index[k] >= static_cast<long>(size[k]))
+      break;
+  }
+}
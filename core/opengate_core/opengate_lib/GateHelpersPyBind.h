@@ -8,6 +8,7 @@
 #ifndef GateHelpersPyBind_h
 #define GateHelpersPyBind_h
 
+#include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
 namespace py = pybind11;
@@ -17,4 +18,27 @@ template <class T> T *PyBindGetVector(const py::array_t<T> &values) {
   return static_cast<T *>(info.ptr);
 }
 
+// Bind a std::vector<double> member as a property. The setter copies the
+// numpy array with a single memcpy (no element by element conversion),
+// contiguous arrays are not copied before. Only 1D arrays are accepted (a
+// scalar would otherwise be silently converted to a vector of size 1).
+template <class PyClass, class Source>
+void PyBindDefVectorProperty(PyClass &c, const char *name,
+                             std::vector<double> Source::*member) {
+  std::string property_name = name;
+  c.def_property(
+      name, [member](const Source &s) { return s.*member; },
+      [member, property_name](
+          Source &s,
+          const py::array_t<double, py::array::c_style | py::array::forcecast>
+              &values) {
+        if (values.ndim() != 1) {
+          throw py::value_error("Error in the Opengate library (C++): " +
+                                property_name + " must be a 1D array, not a " +
+                                std::to_string(values.ndim()) + "D array");
+        }
+        (s.*member).assign(values.data(), values.data() + values.size());
+      });
+}
+
 #endif // GateHelpersPyBind_h
@@ -49,6 +49,7 @@ void GateLETActor::InitializeUserInfo(py::dict &user_info) {
   fInitialTranslation = DictGetG4ThreeVector(user_info, "translation");
   // Hit type (random, pre, post etc)
   fHitType = DictGetStr(user_info, "hit_type");
+  fStoppingPowerTableFlag = DictGetBool(user_info, "stopping_power_table");
 }
 
 void GateLETActor::InitializeCpp() {
@@ -73,11 +74,15 @@ void GateLETActor::BeginOfRunActionMasterThread(int run_id) {
 }
 
 void GateLETActor::BeginOfRunAction(const G4Run *) {
+  auto &l = fThreadLocalData.Get();
+  l.materialToScoreIn = nullptr;
   if (fScoreInOtherMaterial) {
-    auto &l = fThreadLocalData.Get();
     l.materialToScoreIn =
         G4NistManager::Instance()->FindOrBuildMaterial(fScoreIn);
   }
+  if (fStoppingPowerTableFlag) {
+    l.stoppingPowerTables.Initialize(l.materialToScoreIn, true);
+  }
 }
 
 void GateLETActor::BeginOfEventAction(const G4Event *event) {
@@ -150,14 +155,22 @@ void GateLETActor::SteppingAction(G4Step *step) {
       p = G4Electron::Electron();
     }
     auto &l = fThreadLocalData.Get();
-    auto dedx_currstep =
-        l.emcalc.ComputeElectronicDEDX(energy, p, current_material, dedx_cut) /
-        CLHEP::MeV * CLHEP::mm;
+    double dedx_currstep = 0., dedx_other_material = 0.;
+    if (fStoppingPowerTableFlag) {
+      l.stoppingPowerTables.GetDEDX(energy, p, current_material, dedx_currstep,
+                                    dedx_other_material);
+    } else {
+      dedx_currstep =
+          l.emcalc.ComputeElectronicDEDX(energy, p, current_material, dedx_cut);
+      if (fScoreInOtherMaterial) {
+        dedx_other_material = l.emcalc.ComputeElectronicDEDX(
+            energy, p, l.materialToScoreIn, dedx_cut);
+      }
+    }
+    dedx_currstep = dedx_currstep / CLHEP::MeV * CLHEP::mm;
 
     if (fScoreInOtherMaterial) {
-      auto dedx_other_material = l.emcalc.ComputeElectronicDEDX(
-                                     energy, p, l.materialToScoreIn, dedx_cut) /
-                                 CLHEP::MeV * CLHEP::mm;
+      dedx_other_material = dedx_other_material / CLHEP::MeV * CLHEP::mm;
 
       // Do we not need to consider the density ratio as well?
       //      auto density_other_material = l.materialToScoreIn->GetDensity() /
@@ -12,6 +12,7 @@
 #include "G4EmCalculator.hh"
 #include "G4NistManager.hh"
 #include "G4VPrimitiveScorer.hh"
+#include "GateStoppingPowerTables.h"
 #include "GateVActor.h"
 #include "itkImage.h"
 #include <pybind11/stl.h>
@@ -73,9 +74,13 @@ private:
 
   bool fScoreInOtherMaterial = false;
 
+  // Option: tabulated stopping powers instead of G4EmCalculator calls
+  bool fStoppingPowerTableFlag = false;
+
   struct threadLocalT {
     G4EmCalculator emcalc;
     G4Material *materialToScoreIn;
+    GateStoppingPowerTables stoppingPowerTables;
   };
   G4Cache<threadLocalT> fThreadLocalData;
 };
@@ -10,6 +10,7 @@
 #include "G4UnitsTable.hh"
 #include "GateHelpersDict.h"
 #include "digitizer/GateDigiCollectionManager.h"
+#include "digitizer/GateDigiCollectionsRootManager.h"
 #include "digitizer/GateHelpersDigitizer.h"
 
 G4Mutex TotalEntriesMutex = G4MUTEX_INITIALIZER;
@@ -32,6 +33,8 @@ GatePhaseSpaceActor::GatePhaseSpaceActor(py::dict &user_info)
   fStoreFirstStepInVolume = false;
   fDebug = false;
   fStoreAbsorbedEvent = false;
+  fRootFlushSize = 0;
+  fColumnarOutputFlag = false;
 }
 
 GatePhaseSpaceActor::~GatePhaseSpaceActor() {
@@ -43,6 +46,11 @@ void GatePhaseSpaceActor::InitializeUserInfo(py::dict &user_info) {
   fDigiCollectionName = DictGetStr(user_info, "name");
   fUserDigiAttributeNames = DictGetVecStr(user_info, "attributes");
   fStoreAbsorbedEvent = DictGetBool(user_info, "store_absorbed_event");
+  fRootFlushSize = DictGetInt(user_info, "root_flush_size");
+  fColumnarOutputFlag =
+      DictGetStr(user_info, "root_output_backend") == "columnar";
+  GateDigiCollectionsRootManager::GetInstance()->SetNtupleMergingFlag(
+      !DictGetBool(user_info, "root_output_per_thread"));
   fDebug = DictGetBool(user_info, "debug");
 
   // Special case to store event information even if the event do not step in
@@ -69,6 +77,7 @@ void GatePhaseSpaceActor::StartSimulationAction() {
   } else {
     outputPath = GetOutputPath(fOutputNameRoot);
   }
+  fHits->SetColumnarOutputFlag(fColumnarOutputFlag);
   fHits->SetFilenameAndInitRoot(outputPath);
   fHits->InitDigiAttributesFromNames(fUserDigiAttributeNames);
   fHits->RootInitializeTupleForMaster();
@@ -219,6 +228,16 @@ void GatePhaseSpaceActor::EndOfEventAction(const G4Event *event) {
     // increase the nb of absorbed events
     fNumberOfAbsorbedEvents++;
   }
+
+  // Write the hits during the run, once there are enough of them
+  auto n = fHits->GetSize();
+  if (fRootFlushSize > 0 && n >= (size_t)fRootFlushSize) {
+    {
+      G4AutoLock mutex(&TotalEntriesMutex);
+      fTotalNumberOfEntries += n;
+    }
+    fHits->FillToRootIfNeeded(true);
+  }
 }
 
 // Called every time a Run ends
@@ -81,6 +81,8 @@ protected:
   bool fStoreEnteringStep;
   bool fStoreExitingStep;
   bool fStoreFirstStepInVolume;
+  int fRootFlushSize;
+  bool fColumnarOutputFlag;
 
   int fNumberOfAbsorbedEvents;
   int fTotalNumberOfEntries;
@@ -299,6 +299,22 @@ void GatePhaseSpaceSource::SetDirectionZBatch(
   l.fDirectionZ = PyBindGetVector(fDirectionZ);
 }
 
+void GatePhaseSpaceSource::SetBatch(
+    const py::array_t<std::float_t, py::array::c_style> &batch) const {
+  auto &l = fThreadLocalDataPhsp.Get();
+  // the rows are the columns of the phsp, the array is kept alive on py side
+  auto n = batch.shape(1);
+  auto *data = static_cast<std::float_t *>(batch.request().ptr);
+  l.fPositionX = data;
+  l.fPositionY = data + n;
+  l.fPositionZ = data + 2 * n;
+  l.fDirectionX = data + 3 * n;
+  l.fDirectionY = data + 4 * n;
+  l.fDirectionZ = data + 5 * n;
+  l.fEnergy = data + 6 * n;
+  l.fWeight = data + 7 * n;
+}
+
 bool GatePhaseSpaceSource::ParticleIsPrimary() const {
   auto &l = fThreadLocalDataPhsp.Get();
   // check if particle is primary
@@ -74,6 +74,11 @@ public:
 
   void SetDirectionZBatch(const py::array_t<std::float_t> &fDirectionZ) const;
 
+  // Set all float columns at once from a single contiguous (8, N) array
+  // (rows: position X Y Z, direction X Y Z, energy, weight). No copy.
+  void
+  SetBatch(const py::array_t<std::float_t, py::array::c_style> &batch) const;
+
   // For MT, all threads local variables are gathered here
   struct threadLocalTPhsp {
     G4ParticleDefinition *fParticleDefinition;
@@ -0,0 +1,83 @@
+/* --------------------------------------------------
+   Copyright (C): OpenGATE Collaboration
+   This software is distributed under the terms
+   of the GNU Lesser General  Public Licence (LGPL)
+   See LICENSE.md for further details
+   -------------------------------------------------- */
+
+#include "GateProfiler.h"
+#include "G4AutoLock.hh"
+#include "G4SystemOfUnits.hh"
+#include <sstream>
+
+G4Mutex GateProfilerMutex = G4MUTEX_INITIALIZER;
+
+using namespace pybind11::literals;
+
+GateProfiler *GateProfiler::fInstance = nullptr;
+
+GateProfiler *GateProfiler::GetInstance() {
+  if (fInstance == nullptr)
+    fInstance = new GateProfiler();
+  return fInstance;
+}
+
+GateProfiler::GateProfiler() = default;
+
+void GateProfiler::Register(const void *object, const std::string &kind,
+                            const std::string &name) {
+  G4AutoLock mutex(&GateProfilerMutex);
+  fNames[object] = std::make_pair(kind, name);
+}
+
+void GateProfiler::Add(const void *object, const char *callback,
+                       double duration) {
+  auto &c = fThreadLocalCounters.Get()[{object, callback}];
+  c.fCalls++;
+  c.fDuration += duration;
+}
+
+void GateProfiler::MergeThreadLocal() {
+  auto &counters = fThreadLocalCounters.Get();
+  G4AutoLock mutex(&GateProfilerMutex);
+  for (const auto &[key, c] : counters) {
+    std::string kind = "others";
+    std::string name;
+    auto it = fNames.find(key.first);
+    if (it != fNames.end()) {
+      kind = it->second.first;
+      name = it->second.second;
+    } else {
+      std::ostringstream oss;
+      oss << key.first;
+      name = oss.str();
+    }
+    auto &m = fCounters[kind][name][key.second];
+    m.fCalls += c.fCalls;
+    m.fDuration += c.fDuration;
+  }
+  counters.clear();
+}
+
+void GateProfiler::Reset() {
+  G4AutoLock mutex(&GateProfilerMutex);
+  fCounters.clear();
+}
+
+py::dict GateProfiler::GetResults() {
+  G4AutoLock mutex(&GateProfilerMutex);
+  py::dict results;
+  for (const auto &[kind, names] : fCounters) {
+    py::dict k;
+    for (const auto &[name, callbacks] : names) {
+      py::dict n;
+      for (const auto &[callback, c] : callbacks) {
+        n[py::str(callback)] = py::dict("calls"_a = c.fCalls,
+                                        "duration"_a = c.fDuration * CLHEP::s);
+      }
+      k[py::str(name)] = n;
+    }
+    results[py::str(kind)] = k;
+  }
+  return results;
+}
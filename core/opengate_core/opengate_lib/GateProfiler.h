@@ -0,0 +1,112 @@
+/* --------------------------------------------------
+   Copyright (C): OpenGATE Collaboration
+   This software is distributed under the terms
+   of the GNU Lesser General  Public Licence (LGPL)
+   See LICENSE.md for further details
+   -------------------------------------------------- */
+
+#ifndef GateProfiler_h
+#define GateProfiler_h
+
+#include "G4Cache.hh"
+#include <chrono>
+#include <map>
+#include <pybind11/stl.h>
+#include <string>
+#include <unordered_map>
+
+namespace py = pybind11;
+
+/*
+    Global singleton class that records the cumulative wall time and the
+    number of calls of the actor callbacks, filters and sources.
+
+    Objects (actors, filters, sources) are registered with a kind and a name
+    when they are initialized. During the simulation, the counters are kept
+    per thread (no lock), with the object pointer and the callback name as key.
+    They are merged by name at the end of each run (all threads).
+
+    When profiling is disabled (default), a Timer only tests a boolean.
+ */
+
+class GateProfiler {
+public:
+  static GateProfiler *GetInstance();
+
+  // Enabled by the SimulationStatisticsActor (option "profiling")
+  inline static bool fEnabled = false;
+
+  // Associate a kind ("actors", "filters", "sources") and a name to an object
+  void Register(const void *object, const std::string &kind,
+                const std::string &name);
+
+  // Add one call of the given duration (in seconds), thread local
+  void Add(const void *object, const char *callback, double duration);
+
+  // Merge the counters of the current thread (with lock)
+  void MergeThreadLocal();
+
+  // Clear the merged counters
+  void Reset();
+
+  // Dictionary: kind -> name -> callback -> {calls, duration}
+  // (duration in Geant4 time unit)
+  py::dict GetResults();
+
+  // Measure the time between construction and destruction
+  class Timer {
+  public:
+    Timer(const void *object, const char *callback) {
+      if (!fEnabled)
+        return;
+      fObject = object;
+      fCallback = callback;
+      fStart = std::chrono::steady_clock::now();
+    }
+
+    ~Timer() {
+      if (fObject == nullptr)
+        return;
+      const std::chrono::duration<double> d =
+          std::chrono::steady_clock::now() - fStart;
+      GetInstance()->Add(fObject, fCallback, d.count());
+    }
+
+  protected:
+    const void *fObject = nullptr;
+    const char *fCallback = nullptr;
+    std::chrono::steady_clock::time_point fStart;
+  };
+
+protected:
+  GateProfiler();
+
+  static GateProfiler *fInstance;
+
+  struct Counter {
+    long int fCalls = 0;
+    double fDuration = 0;
+  };
+
+  typedef std::pair<const void *, const char *> KeyType;
+
+  struct KeyHash {
+    size_t operator()(const KeyType &k) const {
+      auto h = std::hash<const void *>()(k.first);
+      return h ^ (std::hash<const void *>()(k.second) + 0x9e3779b9 + (h << 6) +
+                  (h >> 2));
+    }
+  };
+
+  typedef std::unordered_map<KeyType, Counter, KeyHash> ThreadLocalCountersType;
+  G4Cache<ThreadLocalCountersType> fThreadLocalCounters;
+
+  // object -> (kind, name)
+  std::map<const void *, std::pair<std::string, std::string>> fNames;
+
+  // kind -> name -> callback -> counter
+  std::map<std::string, std::map<std::string, std::map<std::string, Counter>>>
+      fCounters;
+};
+
+#endif // GateProfiler_h
@@ -7,6 +7,7 @@
 
 #include "GateRunAction.h"
 #include "GateHelpers.h"
+#include "GateProfiler.h"
 
 GateRunAction::GateRunAction(GateSourceManager *sm) : G4UserRunAction() {
   fSourceManager = sm;
@@ -27,19 +28,25 @@ void GateRunAction::RegisterActor(GateVActor *actor) {
 
 void GateRunAction::BeginOfRunAction(const G4Run *run) {
   for (auto actor : fBeginOfRunAction_actors) {
+    GateProfiler::Timer timer(actor, "BeginOfRunAction");
     actor->BeginOfRunAction(run);
   }
 }
 
 void GateRunAction::EndOfRunAction(const G4Run *run) {
   for (auto actor : fEndOfRunAction_actors) {
+    GateProfiler::Timer timer(actor, "EndOfRunAction");
     actor->EndOfRunAction(run);
   }
   // If the simulation is about to end, we call the callback function for all
   // actors
   if (fSourceManager->IsEndOfSimulationForWorker()) {
     for (auto actor : fEndOfSimulationWorkerAction_actors) {
+      GateProfiler::Timer timer(actor, "EndOfSimulationWorkerAction");
       actor->EndOfSimulationWorkerAction(run);
     }
   }
+  // Merge the profiling counters of this thread
+  if (GateProfiler::fEnabled)
+    GateProfiler::GetInstance()->MergeThreadLocal();
 }
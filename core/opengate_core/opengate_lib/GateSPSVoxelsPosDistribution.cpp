@@ -14,9 +14,12 @@ GateSPSVoxelsPosDistribution::GateSPSVoxelsPosDistribution() {
   // The size and allocation will be performed on the py side
   cpp_image = ImageType::New();
 
-  // default position
-  fGlobalTranslation = G4ThreeVector();
-  fGlobalRotation = G4RotationMatrix();
+  // no alias table by default
+  fUseAliasTable = false;
+  fAliasProbabilities = nullptr;
+  fAliases = nullptr;
+  fAliasIndices = nullptr;
+  fAliasTableSize = 0;
 }
 
 void GateSPSVoxelsPosDistribution::SetCumulativeDistributionFunction(VD vz,
@@ -28,11 +31,47 @@ void GateSPSVoxelsPosDistribution::SetCumulativeDistributionFunction(VD vz,
   fCDFX = vx;
 }
 
-G4ThreeVector GateSPSVoxelsPosDistribution::VGenerateOne() {
+void GateSPSVoxelsPosDistribution::SetAliasTable(ArrayDouble probabilities,
+                                                 ArrayInt64 aliases,
+                                                 ArrayInt64 indices) {
+  if (probabilities.size() != aliases.size() ||
+      probabilities.size() != indices.size() || probabilities.size() == 0) {
+    Fatal("The arrays of the alias table must have the same (non zero) size");
+  }
+  // Keep a reference to the numpy arrays: no copy, only the pointers are used
+  fAliasProbabilitiesArray = probabilities;
+  fAliasesArray = aliases;
+  fAliasIndicesArray = indices;
+  fAliasProbabilities = fAliasProbabilitiesArray.data();
+  fAliases = fAliasesArray.data();
+  fAliasIndices = fAliasIndicesArray.data();
+  fAliasTableSize = probabilities.size();
+  fUseAliasTable = true;
+}
+
+void GateSPSVoxelsPosDistribution::SampleVoxelIndex(int &i, int &j,
+                                                    int &k) const {
   // G4UniformRand : default boundaries ]0.1[ for operator()().
 
+  if (fUseAliasTable) {
+    // Alias table: one column, then the column or its alias, O(1)
+    auto c = (size_t)(G4UniformRand() * fAliasTableSize);
+    if (c >= fAliasTableSize)
+      c = fAliasTableSize - 1;
+    if (G4UniformRand() >= fAliasProbabilities[c])
+      c = fAliases[c];
+    // flat index (numpy order Z Y X) to 3D index
+    auto size = cpp_image->GetLargestPossibleRegion().GetSize();
+    auto index = fAliasIndices[c];
+    k = index % size[0];
+    index /= size[0];
+    j = index % size[1];
+    i = index / size[1];
+    return;
+  }
+
   // Get Cumulative Distribution Function for Z
-  auto i = 0;
+  i = 0;
   do {
     auto p = G4UniformRand();
     auto lower = std::lower_bound(fCDFZ.begin(), fCDFZ.end(), p);
@@ -40,7 +79,7 @@ G4ThreeVector GateSPSVoxelsPosDistribution::VGenerateOne() {
   } while (i >= (int)fCDFX.size());
 
   // Get Cumulative Distribution Function for Y, knowing Z
-  auto j = 0;
+  j = 0;
   do {
     auto p = G4UniformRand();
     auto lower = std::lower_bound(fCDFY[i].begin(), fCDFY[i].end(), p);
@@ -48,12 +87,24 @@ G4ThreeVector GateSPSVoxelsPosDistribution::VGenerateOne() {
   } while (j >= (int)fCDFX[i].size());
 
   // Get Cumulative Distribution Function for X, knowing X and Y
-  auto k = 0;
+  k = 0;
   do {
     auto p = G4UniformRand();
     auto lower = std::lower_bound(fCDFX[i][j].begin(), fCDFX[i][j].end(), p);
     k = std::distance(fCDFX[i][j].begin(), lower);
   } while (k >= (int)fCDFX[i][j].size());
+}
+
+void GateSPSVoxelsPosDistribution::SetGlobalTransform(
+    const G4RotationMatrix &rotation, const G4ThreeVector &translation) {
+  auto &l = fThreadLocalData.Get();
+  l.fGlobalRotation = rotation;
+  l.fGlobalTranslation = translation;
+}
+
+G4ThreeVector GateSPSVoxelsPosDistribution::VGenerateOne() {
+  int i, j, k;
+  SampleVoxelIndex(i, j, k);
 
   // convert to physical coordinate
   // (warning to the numpy order Z Y X)
@@ -68,40 +119,17 @@ G4ThreeVector GateSPSVoxelsPosDistribution::VGenerateOne() {
 
   // convert to G4 vector and move according to mother volume
   G4ThreeVector position(point[0], point[1], point[2]);
-  position = fGlobalRotation * position +
-             fGlobalTranslation; // not global only according to mother ?
+  const auto &l = fThreadLocalData.Get();
+  position = l.fGlobalRotation * position +
+             l.fGlobalTranslation; // not global only according to mother ?
 
   return position;
 }
 
 std::vector<int> GateSPSVoxelsPosDistribution::VGenerateOneDebug() {
-  // G4UniformRand : default boundaries ]0.1[ for operator()().
-
-  // Get Cumulative Distribution Function for Z
-  auto i = 0;
-  do {
-    auto p = G4UniformRand();
-    auto lower = std::lower_bound(fCDFZ.begin(), fCDFZ.end(), p);
-    i = std::distance(fCDFZ.begin(), lower);
-  } while (i >= (int)fCDFX.size());
-
-  // Get Cumulative Distribution Function for Y, knowing Z
-  auto j = 0;
-  do {
-    auto p = G4UniformRand();
-    auto lower = std::lower_bound(fCDFY[i].begin(), fCDFY[i].end(), p);
-    j = std::distance(fCDFY[i].begin(), lower);
-  } while (j >= (int)fCDFX[i].size());
+  int i, j, k;
+  SampleVoxelIndex(i, j, k);
 
-  // Get Cumulative Distribution Function for X, knowing X and Y
-  auto k = 0;
-  do {
-    auto p = G4UniformRand();
-    auto lower = std::lower_bound(fCDFX[i][j].begin(), fCDFX[i][j].end(), p);
-    k = std::distance(fCDFX[i][j].begin(), lower);
-  } while (k >= (int)fCDFX[i][j].size());
-
-  // convert to physical coordinate
   // (warning to the numpy order Z Y X)
   std::vector<int> index = {k, j, i};
 
@@ -10,9 +10,13 @@
 
 #include <utility>
 
+#include "G4Cache.hh"
 #include "G4ParticleDefinition.hh"
 #include "GateSPSPosDistribution.h"
 #include "itkImage.h"
+#include <pybind11/numpy.h>
+
+namespace py = pybind11;
 
 class GateSPSVoxelsPosDistribution : public GateSPSPosDistribution {
 
@@ -34,6 +38,16 @@ public:
 
   void SetCumulativeDistributionFunction(VD vz, VD2 vy, VD3 vx);
 
+  // Flat alias table of the non-zero voxels (see compute_image_3D_alias_table)
+  // The numpy arrays are kept (no copy), they are only read during sampling.
+  typedef py::array_t<double, py::array::c_style> ArrayDouble;
+  typedef py::array_t<int64_t, py::array::c_style> ArrayInt64;
+  void SetAliasTable(ArrayDouble probabilities, ArrayInt64 aliases,
+                     ArrayInt64 indices);
+
+  // Sample the voxel index (numpy order Z Y X)
+  void SampleVoxelIndex(int &i, int &j, int &k) const;
+
   // Image type is 3D float by default (the pixel data are not used
   // nor even allocated. Only useful to convert pixel coordinates
   // to physical coordinates.
@@ -42,14 +56,31 @@ public:
   // The image is accessible from py side
   ImageType::Pointer cpp_image;
 
-  // FIXME : thread local ??
-  G4ThreeVector fGlobalTranslation;
-  G4RotationMatrix fGlobalRotation;
+  // The distribution is shared by all threads: the position of the
+  // attached volume is set by each thread (thread local)
+  void SetGlobalTransform(const G4RotationMatrix &rotation,
+                          const G4ThreeVector &translation);
 
 protected:
+  struct threadLocalT {
+    G4ThreeVector fGlobalTranslation;
+    G4RotationMatrix fGlobalRotation;
+  };
+  G4Cache<threadLocalT> fThreadLocalData;
+
   VD3 fCDFX;
   VD2 fCDFY;
   VD fCDFZ;
+
+  // alias table (used instead of the CDF when set)
+  bool fUseAliasTable;
+  ArrayDouble fAliasProbabilitiesArray;
+  ArrayInt64 fAliasesArray;
+  ArrayInt64 fAliasIndicesArray;
+  const double *fAliasProbabilities;
+  const int64_t *fAliases;
+  const int64_t *fAliasIndices;
+  size_t fAliasTableSize;
 };
 
 #endif // GateSPSVoxelsPosDistribution_h
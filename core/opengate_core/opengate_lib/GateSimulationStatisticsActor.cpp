@@ -8,6 +8,7 @@
 #include "GateSimulationStatisticsActor.h"
 #include "GateHelpers.h"
 #include "GateHelpersDict.h"
+#include "GateProfiler.h"
 #include <chrono>
 #include <iostream>
 #include <sstream>
@@ -29,6 +30,7 @@ GateSimulationStatisticsActor::GateSimulationStatisticsActor(
   fActions.insert("EndSimulationAction");
   fDuration = 0;
   fTrackTypesFlag = false;
+  fProfilingFlag = false;
   fInitDuration = 0;
   fStartRunTimeIsSet = false;
 }
@@ -40,6 +42,7 @@ void GateSimulationStatisticsActor::InitializeUserInfo(py::dict &user_info) {
   GateVActor::InitializeUserInfo(user_info);
 
   fTrackTypesFlag = DictGetBool(user_info, "track_types_flag");
+  fProfilingFlag = DictGetBool(user_info, "profiling");
 }
 
 void GateSimulationStatisticsActor::StartSimulationAction() {
@@ -61,6 +64,12 @@ void GateSimulationStatisticsActor::StartSimulationAction() {
   fCounts["events"] = 0;
   fCounts["tracks"] = 0;
   fCounts["steps"] = 0;
+
+  // Time and number of calls of all actors, filters and sources
+  if (fProfilingFlag) {
+    GateProfiler::GetInstance()->Reset();
+    GateProfiler::fEnabled = true;
+  }
 }
 
 py::dict GateSimulationStatisticsActor::GetCounts() {
@@ -70,6 +79,8 @@ py::dict GateSimulationStatisticsActor::GetCounts() {
       "duration"_a = fCountsD["duration"], "init"_a = fCountsD["init"],
       "start_time"_a = fCountsStr["start_time"],
       "stop_time"_a = fCountsStr["stop_time"], "track_types"_a = fTrackTypes);
+  if (fProfilingFlag)
+    dd["profiling"] = GateProfiler::GetInstance()->GetResults();
   return dd;
 }
 
@@ -151,6 +162,9 @@ void GateSimulationStatisticsActor::EndSimulationAction() {
   fInitDuration = fInitDuration * CLHEP::microsecond;
   fCountsD["duration"] = fDuration;
   fCountsD["init"] = fInitDuration;
+  // all threads have merged their counters at the end of the last run
+  if (fProfilingFlag)
+    GateProfiler::fEnabled = false;
   {
     std::stringstream ss;
     auto t_c = std::chrono::system_clock::to_time_t(fStartTime);
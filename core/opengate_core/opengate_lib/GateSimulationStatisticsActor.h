@@ -64,6 +64,7 @@ protected:
   std::map<std::string, std::string> fCountsStr;
 
   bool fTrackTypesFlag;
+  bool fProfilingFlag;
   std::map<std::string, long int> fTrackTypes;
   double fDuration;
   double fInitDuration;
@@ -32,6 +32,8 @@ GateSingleParticleSource::GateSingleParticleSource(
   fBackToBackMode = false;
   fAccolinearityFlag = false;
   fAccolinearitySigma = 0.0;
+  fAAManager = nullptr;
+  fDirectionWeight = 1.0;
 }
 
 GateSingleParticleSource::~GateSingleParticleSource() {
@@ -62,9 +64,30 @@ GateSingleParticleSource::GenerateDirectionWithAA(const G4ThreeVector &position,
   zero_energy_flag = false;
   G4ParticleMomentum direction;
   fAAManager->StartAcceptLoop();
+  fDirectionWeight = 1.0;
+  bool forced = fAAManager->IsForcedDirection();
+  if (forced)
+    fAAManager->ComputeForcedDirectionCones(position);
   while (!accept_angle) {
-    // direction
-    direction = fDirectionGenerator->VGenerateOne();
+    // direction (isotropic, or toward the volumes with a weight)
+    if (forced) {
+      // the emissions outside the cones are not accepted, without sampling
+      // their direction. With ZeroEnergy, each emission is an event, so only
+      // the current one is tested. Otherwise, all the skipped emissions
+      // before the next one in the cones are drawn at once.
+      if (fAAManager->GetPolicy() ==
+          GateAcceptanceAngleTesterManager::AAZeroEnergy) {
+        if (!fAAManager->TestIfInForcedDirectionCones()) {
+          zero_energy_flag = true;
+          accept_angle = true;
+          direction = fDirectionGenerator->VGenerateOne();
+          continue;
+        }
+      } else
+        fAAManager->SkipEmissionsOutsideForcedDirectionCones();
+      direction = fAAManager->GenerateForcedDirection(fDirectionWeight);
+    } else
+      direction = fDirectionGenerator->VGenerateOne();
 
     // accept ?
     accept_angle = fAAManager->TestIfAccept(position, direction);
@@ -111,6 +134,7 @@ void GateSingleParticleSource::GeneratePrimaryVertex(G4Event *event) {
 
   // set vertex
   vertex->SetPrimary(particle);
+  vertex->SetWeight(fDirectionWeight);
   event->AddPrimaryVertex(vertex);
 }
 
@@ -153,6 +177,7 @@ void GateSingleParticleSource::GeneratePrimaryVertexBackToBack(
   // Associate the two primaries to the vertex
   vertex->SetPrimary(particle1);
   vertex->SetPrimary(particle2);
+  vertex->SetWeight(fDirectionWeight);
   event->AddPrimaryVertex(vertex);
 }
 
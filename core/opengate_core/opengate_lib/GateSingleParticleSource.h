@@ -74,6 +74,8 @@ protected:
 
   // for acceptance angle
   GateAcceptanceAngleTesterManager *fAAManager;
+  // weight of the direction when it is forced toward the volumes
+  double fDirectionWeight;
 };
 
 #endif // GateSingleParticleSource_h
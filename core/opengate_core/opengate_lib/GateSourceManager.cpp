@@ -5,6 +5,9 @@
    See LICENSE.md for further details
    -------------------------------------------------- */
 
+#include <algorithm>
+#include <atomic>
+#include <functional>
 #include <iostream>
 #include <pybind11/numpy.h>
 
@@ -16,6 +19,7 @@
 
 #include "GateHelpers.h"
 #include "GateHelpersDict.h"
+#include "GateProfiler.h"
 #include "GateSignalHandler.h"
 #include "GateSourceManager.h"
 #include "indicators.hpp"
@@ -30,7 +34,8 @@
 
 // Initialisation of static variable
 int GateSourceManager::fVerboseLevel = 0;
-bool fRunTerminationFlag = false;
+// (set by any thread, e.g. when a dose actor reaches its uncertainty goal)
+std::atomic<bool> fRunTerminationFlag{false};
 
 GateSourceManager::GateSourceManager() {
   fUIEx = nullptr;
@@ -47,6 +52,7 @@ GateSourceManager::GateSourceManager() {
   l.fUserEventInformation = nullptr;
   l.fCurrentSimulationTime = 0;
   l.fNextActiveSource = nullptr;
+  l.fNextActiveSourceIndex = 0;
   l.fNextSimulationTime = 0;
   fExpectedNumberOfEvents = 0;
   fProgressBarStep = 1000;
@@ -230,6 +236,7 @@ void GateSourceManager::PrepareRunToStart(int run_id) {
     source->PrepareNextRun();
   }
   // Check next time
+  InitializeNextSourcesHeap();
   PrepareNextSource();
   if (l.fNextActiveSource == nullptr) {
     return;
@@ -241,21 +248,49 @@ void GateSourceManager::PrepareRunToStart(int run_id) {
           : std::to_string(G4Threading::G4GetThreadId()));
 }
 
-void GateSourceManager::PrepareNextSource() {
+void GateSourceManager::InitializeNextSourcesHeap() {
   auto &l = fThreadLocalData.Get();
   l.fNextActiveSource = nullptr;
-  double min_time = l.fCurrentTimeInterval.first;
-  double max_time = l.fCurrentTimeInterval.second;
-  // Ask all sources their next time, keep the closest one
-  for (auto *source : fSources) {
-    auto t = source->PrepareNextTime(l.fCurrentSimulationTime);
-    if ((t >= min_time) && (t < max_time)) {
-      max_time = t;
-      l.fNextActiveSource = source;
-      l.fNextSimulationTime = t;
-    }
+  l.fSourcesHeap.clear();
+  l.fSourcesHeap.reserve(fSources.size());
+  // Ask all sources their first time in this interval
+  for (size_t i = 0; i < fSources.size(); i++) {
+    PushSourceNextTime(i);
+  }
+}
+
+void GateSourceManager::PushSourceNextTime(size_t index) {
+  auto &l = fThreadLocalData.Get();
+  auto t = fSources[index]->PrepareNextTime(l.fCurrentSimulationTime);
+  if ((t >= l.fCurrentTimeInterval.first) &&
+      (t < l.fCurrentTimeInterval.second)) {
+    l.fSourcesHeap.emplace_back(t, index);
+    // greater: the top of the heap is the smallest time, and for equal times,
+    // the first source in the list (as with a linear search)
+    std::push_heap(l.fSourcesHeap.begin(), l.fSourcesHeap.end(),
+                   std::greater<>());
   }
+}
+
+void GateSourceManager::PrepareNextSource() {
+  auto &l = fThreadLocalData.Get();
+  // The source that just fired is the only one whose next time changes:
+  // ask its next time and put it back in the heap. The other sources keep
+  // their time in the heap.
+  if (l.fNextActiveSource != nullptr) {
+    PushSourceNextTime(l.fNextActiveSourceIndex);
+  }
+  l.fNextActiveSource = nullptr;
   // If no next time in the current interval, active source is NULL
+  if (l.fSourcesHeap.empty())
+    return;
+  // Keep the closest one
+  std::pop_heap(l.fSourcesHeap.begin(), l.fSourcesHeap.end(), std::greater<>());
+  auto next = l.fSourcesHeap.back();
+  l.fSourcesHeap.pop_back();
+  l.fNextSimulationTime = next.first;
+  l.fNextActiveSourceIndex = next.second;
+  l.fNextActiveSource = fSources[next.second];
 }
 
 void GateSourceManager::CheckForNextRun() {
@@ -300,7 +335,10 @@ void GateSourceManager::GeneratePrimaries(G4Event *event) {
     // (allocated memory is leaked)
   } else {
     // shoot particle
-    l.fNextActiveSource->GeneratePrimaries(event, l.fCurrentSimulationTime);
+    {
+      GateProfiler::Timer timer(l.fNextActiveSource, "GeneratePrimaries");
+      l.fNextActiveSource->GeneratePrimaries(event, l.fCurrentSimulationTime);
+    }
     // log (after particle creation)
     if (LogLevel_EVENT <= GateSourceManager::fVerboseLevel) {
       auto *prim = event->GetPrimaryVertex(0)->GetPrimary(0);
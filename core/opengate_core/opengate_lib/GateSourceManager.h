@@ -74,9 +74,15 @@ public:
   // Called by G4 fEngine
   void GeneratePrimaries(G4Event *anEvent) override;
 
+  // Fill the heap of sources with their next time (start of a run)
+  void InitializeNextSourcesHeap();
+
   // After an event, prepare for the next
   void PrepareNextSource();
 
+  // Ask a source its next time and push it in the heap if in the interval
+  void PushSourceNextTime(size_t index);
+
   // Check if the current run is terminated
   void CheckForNextRun();
 
@@ -125,6 +131,12 @@ public:
 
     // Next active source
     GateVSource *fNextActiveSource;
+    size_t fNextActiveSourceIndex;
+
+    // Min-heap of the (next time, index) of the sources that have an event
+    // in the current time interval. Only the source that just fired is
+    // updated after an event, so the selection is O(log(nb of sources)).
+    std::vector<std::pair<double, size_t>> fSourcesHeap;
 
     // User information data
     GateUserEventInformation *fUserEventInformation;
@@ -0,0 +1,92 @@
+/* --------------------------------------------------
+   Copyright (C): OpenGATE Collaboration
+   This software is distributed under the terms
+   of the GNU Lesser General  Public Licence (LGPL)
+   See LICENSE.md for further details
+   ------------------------------------ -------------- */
+
+#include "GateStoppingPowerTables.h"
+
+#include <algorithm>
+#include <cfloat>
+#include <cmath>
+
+GateStoppingPowerTables::GateStoppingPowerTables() {
+  fReferenceMaterial = nullptr;
+  fElectronic = false;
+  fNumberOfBins = static_cast<int>(
+      std::lround(std::log10(fEnergyMax / fEnergyMin) * fBinsPerDecade));
+  fLogEnergyMin = std::log(fEnergyMin);
+  fInvLogStep = fNumberOfBins / (std::log(fEnergyMax) - fLogEnergyMin);
+  fLastParticle = nullptr;
+  fLastMaterial = nullptr;
+  fLastTable = nullptr;
+}
+
+void GateStoppingPowerTables::Initialize(const G4Material *reference,
+                                         bool electronic) {
+  // the physics or the materials may change between runs
+  fReferenceMaterial = reference;
+  fElectronic = electronic;
+  fTables.clear();
+  fLastParticle = nullptr;
+  fLastMaterial = nullptr;
+  fLastTable = nullptr;
+}
+
+double
+GateStoppingPowerTables::ComputeDEDX(double energy,
+                                     const G4ParticleDefinition *particle,
+                                     const G4Material *material) {
+  const double cut = DBL_MAX;
+  if (fElectronic)
+    return fEmCalculator.ComputeElectronicDEDX(energy, particle, material, cut);
+  return fEmCalculator.ComputeTotalDEDX(energy, particle, material, cut);
+}
+
+GateStoppingPowerTables::Table &
+GateStoppingPowerTables::GetTable(const G4ParticleDefinition *particle,
+                                  const G4Material *material) {
+  if (particle == fLastParticle && material == fLastMaterial)
+    return *fLastTable;
+
+  auto key = std::make_pair(particle, material);
+  auto it = fTables.find(key);
+  if (it == fTables.end()) {
+    Table table;
+    table.fDEDX.resize(fNumberOfBins + 1);
+    table.fDEDXRef.resize(fNumberOfBins + 1, 0.0);
+    for (int i = 0; i <= fNumberOfBins; i++) {
+      auto energy = std::exp(fLogEnergyMin + i / fInvLogStep);
+      table.fDEDX[i] = ComputeDEDX(energy, particle, material);
+      if (fReferenceMaterial != nullptr)
+        table.fDEDXRef[i] = ComputeDEDX(energy, particle, fReferenceMaterial);
+    }
+    it = fTables.emplace(key, std::move(table)).first;
+  }
+  fLastParticle = particle;
+  fLastMaterial = material;
+  fLastTable = &it->second;
+  return it->second;
+}
+
+void GateStoppingPowerTables::GetDEDX(double energy,
+                                      const G4ParticleDefinition *particle,
+                                      const G4Material *material, double &dedx,
+                                      double &dedx_ref) {
+  // outside the grid: direct computation
+  if (energy < fEnergyMin || energy >= fEnergyMax) {
+    dedx = ComputeDEDX(energy, particle, material);
+    dedx_ref = fReferenceMaterial != nullptr
+                   ? ComputeDEDX(energy, particle, fReferenceMaterial)
+                   : 0.0;
+    return;
+  }
+  const auto &table = GetTable(particle, material);
+  const auto u = (std::log(energy) - fLogEnergyMin) * fInvLogStep;
+  const auto i = std::min(static_cast<int>(u), fNumberOfBins - 1);
+  const auto f = u - i;
+  dedx = table.fDEDX[i] + (table.fDEDX[i + 1] - table.fDEDX[i]) * f;
+  dedx_ref =
+      table.fDEDXRef[i] + (table.fDEDXRef[i + 1] - table.fDEDXRef[i]) * f;
+}
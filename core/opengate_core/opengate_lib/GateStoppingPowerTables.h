@@ -0,0 +1,78 @@
+/* --------------------------------------------------
+   Copyright (C): OpenGATE Collaboration
+   This software is distributed under the terms
+   of the GNU Lesser General  Public Licence (LGPL)
+   See LICENSE.md for further details
+   -------------------------------------------------- */
+
+#ifndef GATE_STOPPING_POWER_TABLES_HH
+#define GATE_STOPPING_POWER_TABLES_HH
+
+#include "G4EmCalculator.hh"
+#include "G4Material.hh"
+#include "G4ParticleDefinition.hh"
+#include "G4SystemOfUnits.hh"
+
+#include <map>
+#include <vector>
+
+/*
+ * Stopping powers tabulated on a regular log(E) grid, for each (particle,
+ * material) met during a run and for one reference material (e.g. G4_WATER).
+ * The lookup is O(1) with a linear interpolation between two nodes, instead of
+ * two G4EmCalculator calls. One object per thread: the tables are built the
+ * first time a (particle, material) pair is used.
+ */
+class GateStoppingPowerTables {
+
+public:
+  GateStoppingPowerTables();
+
+  // Clear the tables. If electronic is true, ComputeElectronicDEDX is used,
+  // otherwise ComputeTotalDEDX (both without cut). The reference material
+  // may be null.
+  void Initialize(const G4Material *reference, bool electronic);
+
+  // dE/dx of the particle at this energy in the material and in the reference
+  // material (0 if there is no reference material)
+  void GetDEDX(double energy, const G4ParticleDefinition *particle,
+               const G4Material *material, double &dedx, double &dedx_ref);
+
+  [[nodiscard]] const G4Material *GetReferenceMaterial() const {
+    return fReferenceMaterial;
+  }
+
+  // Energy grid: 100 bins per decade from 100 eV to 100 GeV
+  static constexpr double fEnergyMin = 100 * CLHEP::eV;
+  static constexpr double fEnergyMax = 100 * CLHEP::GeV;
+  static constexpr int fBinsPerDecade = 100;
+
+protected:
+  struct Table {
+    std::vector<double> fDEDX;
+    std::vector<double> fDEDXRef;
+  };
+
+  Table &GetTable(const G4ParticleDefinition *particle,
+                  const G4Material *material);
+
+  double ComputeDEDX(double energy, const G4ParticleDefinition *particle,
+                     const G4Material *material);
+
+  G4EmCalculator fEmCalculator;
+  const G4Material *fReferenceMaterial;
+  bool fElectronic;
+  int fNumberOfBins;
+  double fLogEnergyMin;
+  double fInvLogStep;
+
+  std::map<std::pair<const G4ParticleDefinition *, const G4Material *>, Table>
+      fTables;
+
+  // most steps use the same table as the previous one
+  const G4ParticleDefinition *fLastParticle;
+  const G4Material *fLastMaterial;
+  Table *fLastTable;
+};
+
+#endif // GATE_STOPPING_POWER_TABLES_HH
@@ -6,6 +6,7 @@
    ------------------------------------ -------------- */
 
 #include "G4EmCalculator.hh"
+#include "G4Gamma.hh"
 #include "G4ParticleDefinition.hh"
 #include "G4RandomTools.hh"
 #include "G4RunManager.hh"
@@ -15,26 +16,118 @@
 #include "GateHelpersDict.h"
 #include "GateHelpersImage.h"
 #include "GateMaterialMuHandler.h"
+#include "GateMuTables.h"
 #include "GateTLEDoseActor.h"
 
+#include <algorithm>
+#include <cmath>
 #include <iostream>
 #include <itkAddImageFilter.h>
 #include <itkImageRegionIterator.h>
 #include <vector>
 
-G4Mutex SetPixelTLEMutex = G4MUTEX_INITIALIZER;
+// defined in GateDoseActor.cpp: both actors write in the same images
+extern G4Mutex SetPixelMutex;
+G4Mutex MaterialMuHandlerMutex = G4MUTEX_INITIALIZER;
 
 GateTLEDoseActor::GateTLEDoseActor(py::dict &user_info)
     : GateDoseActor(user_info) {
   fMultiThreadReady = true;
+  fMuEnTableBins = 0;
+  fTrackLengthFlag = false;
+  fGamma = nullptr;
 }
 
 void GateTLEDoseActor::InitializeUserInfo(py::dict &user_info) {
   GateDoseActor::InitializeUserInfo(user_info);
   fEnergyMin = py::cast<double>(user_info["energy_min"]);
   fEnergyMax = py::cast<double>(user_info["energy_max"]);
+  fMuEnTableBins = py::cast<int>(user_info["mu_en_table_bins"]);
+  fTrackLengthFlag = fHitType == "track_length";
   auto database = py::cast<std::string>(user_info["database"]);
   fMaterialMuHandler = GateMaterialMuHandler::GetInstance(database, fEnergyMax);
+  fGamma = G4Gamma::Gamma();
+}
+
+double GateTLEDoseActor::MuEnTable::GetMuEnOverRho(const double energy) const {
+  const auto u = (std::log(energy) - fLogEnergyMin) * fInvLogStep;
+  if (u <= 0)
+    return std::exp(fLogMuEn.front());
+  const auto i = static_cast<size_t>(u);
+  if (i >= fSlope.size())
+    return std::exp(fLogMuEn.back());
+  return std::exp(fLogMuEn[i] + fSlope[i] * (u - i));
+}
+
+double GateTLEDoseActor::GetMuEnOverRho(const G4MaterialCutsCouple *couple,
+                                        const double energy) {
+  // Without table, the shared handler is used at each step (legacy lookup,
+  // e.g. to check the tables). Its last-call cache is not thread safe.
+  if (fMuEnTableBins == 0) {
+    G4AutoLock mutex(&MaterialMuHandlerMutex);
+    return fMaterialMuHandler->GetMuEnOverRho(couple, energy);
+  }
+  return GetMuEnTable(couple).GetMuEnOverRho(energy);
+}
+
+const GateTLEDoseActor::MuEnTable &
+GateTLEDoseActor::GetMuEnTable(const G4MaterialCutsCouple *couple) {
+  auto &tables = fThreadLocalData.Get().fMuEnTables;
+  auto it = tables.find(couple);
+  if (it != tables.end())
+    return it->second;
+  auto &table = tables[couple];
+  BuildMuEnTable(couple, table);
+  return table;
+}
+
+void GateTLEDoseActor::BuildMuEnTable(const G4MaterialCutsCouple *couple,
+                                      MuEnTable &table) {
+  // The handler (and its last-call cache) is shared by all threads: it is
+  // only used here, once per thread and per couple
+  G4AutoLock mutex(&MaterialMuHandlerMutex);
+  const auto *mu_table = fMaterialMuHandler->GetMuTable(couple);
+  if (mu_table == nullptr) {
+    std::ostringstream oss;
+    oss << "GateTLEDoseActor: no mu_en table for the material "
+        << couple->GetMaterial()->GetName();
+    Fatal(oss.str());
+  }
+
+  // the database tables store log(E) and log(mu_en/rho)
+  const auto *log_e = mu_table->GetEnergies();
+  const auto *log_mu_en = mu_table->GetMuEnTable();
+  const auto n = mu_table->GetSize();
+
+  // no TLE above fEnergyMax: the grid stops there
+  const auto log_e_min = log_e[0];
+  auto log_e_max = std::min(log_e[n - 1], std::log(fEnergyMax));
+  if (log_e_max <= log_e_min)
+    log_e_max = log_e[n - 1];
+  const auto step = (log_e_max - log_e_min) / fMuEnTableBins;
+
+  table.fLogEnergyMin = log_e_min;
+  table.fInvLogStep = 1.0 / step;
+  table.fLogMuEn.resize(fMuEnTableBins + 1);
+  table.fSlope.resize(fMuEnTableBins);
+
+  // Same log-log interpolation as GateMuTable, evaluated at each node
+  int inf = 0;
+  for (int k = 0; k <= fMuEnTableBins; k++) {
+    const auto x = log_e_min + k * step;
+    while (inf < n - 2 && log_e[inf + 1] <= x)
+      inf++;
+    const auto sup = std::min(inf + 1, n - 1);
+    if (x > log_e[inf] && x < log_e[sup]) {
+      table.fLogMuEn[k] = log_mu_en[inf] + (log_mu_en[sup] - log_mu_en[inf]) *
+                                               (x - log_e[inf]) /
+                                               (log_e[sup] - log_e[inf]);
+    } else {
+      table.fLogMuEn[k] = log_mu_en[inf];
+    }
+  }
+  for (int k = 0; k < fMuEnTableBins; k++)
+    table.fSlope[k] = table.fLogMuEn[k + 1] - table.fLogMuEn[k];
 }
 
 void GateTLEDoseActor::BeginOfEventAction(const G4Event *event) {
@@ -50,7 +143,7 @@ void GateTLEDoseActor::PreUserTrackingAction(const G4Track *track) {
   // gamma TID with the number of secondaries created when the particle is in
   // TLE mode
 
-  if (track->GetDefinition()->GetParticleName() == "gamma") {
+  if (track->GetDefinition() == fGamma) {
     l.fIsTLEGamma = false;
     l.fIsTLESecondary = false;
     l.fSecNbWhichDeposit[track->GetTrackID()] = 0;
@@ -70,24 +163,16 @@ void GateTLEDoseActor::PreUserTrackingAction(const G4Track *track) {
   //  gamma, the boolean is set to False at the beginning of the event
 
   else {
-    auto parent_id = track->GetParentID();
-    // std::cout<<"begin"<<std::endl;
-    for (auto it = l.fSecNbWhichDeposit.begin();
-         it != l.fSecNbWhichDeposit.end(); ++it) {
-      // std::cout <<it->first<<"  "<<it->second<<std::endl;
-      if (parent_id == it->first) {
-        if (it->second > 0) {
-          l.fIsTLESecondary = true;
-        }
-        if (it->second == 0) {
-          l.fSecNbWhichDeposit.erase(it);
-          l.fIsTLESecondary = false;
-          break;
-        }
+    auto it = l.fSecNbWhichDeposit.find(track->GetParentID());
+    if (it != l.fSecNbWhichDeposit.end()) {
+      if (it->second > 0) {
+        l.fIsTLESecondary = true;
         it->second--;
+      } else {
+        l.fSecNbWhichDeposit.erase(it);
+        l.fIsTLESecondary = false;
       }
     }
-    // std::cout<<"end"<<std::endl;
   }
 }
 
@@ -98,7 +183,8 @@ void GateTLEDoseActor::SteppingAction(G4Step *step) {
   double energy = 0;
   if (pre_step != 0)
     energy = pre_step->GetKineticEnergy();
-  if (step->GetTrack()->GetDefinition()->GetParticleName() == "gamma") {
+  const bool is_gamma = step->GetTrack()->GetDefinition() == fGamma;
+  if (is_gamma) {
 
     // For too high energy, no TLE
     if (energy > fEnergyMax) {
@@ -121,7 +207,7 @@ void GateTLEDoseActor::SteppingAction(G4Step *step) {
   }
 
   // For non-gamma particle, no TLE
-  if (step->GetTrack()->GetDefinition()->GetParticleName() != "gamma") {
+  if (!is_gamma) {
     if (l.fIsTLESecondary == true) {
       return;
     }
@@ -131,11 +217,31 @@ void GateTLEDoseActor::SteppingAction(G4Step *step) {
   auto weight = step->GetTrack()->GetWeight();
   auto step_length = step->GetStepLength();
   auto density = pre_step->GetMaterial()->GetDensity();
-  auto mu_en_over_rho = fMaterialMuHandler->GetMuEnOverRho(
-      pre_step->GetMaterialCutsCouple(), energy);
+  auto mu_en_over_rho =
+      GetMuEnOverRho(pre_step->GetMaterialCutsCouple(), energy);
   // (0.1 because length is in mm -> cm)
-  auto edep = weight * 0.1 * energy * mu_en_over_rho * step_length * density /
-              (CLHEP::g / CLHEP::cm3);
+  auto edep_per_length = weight * 0.1 * energy * mu_en_over_rho * density /
+                         (CLHEP::g / CLHEP::cm3);
+  auto event_id =
+      G4RunManager::GetRunManager()->GetCurrentEvent()->GetEventID();
+
+  // Distribute the track length over all the voxels crossed by the step
+  if (fTrackLengthFlag && energy > fEnergyMin) {
+    const auto &transform =
+        pre_step->GetTouchable()->GetHistory()->GetTransform(0);
+    const auto p0 = transform.TransformPoint(pre_step->GetPosition());
+    const auto p1 =
+        transform.TransformPoint(step->GetPostStepPoint()->GetPosition());
+    ImageTraverseSegment<Image3DType>(
+        cpp_edep_image, p0, p1,
+        [&](const Image3DType::IndexType &index, const double length) {
+          const auto edep = edep_per_length * length;
+          ScoreTLEValue(edep, edep / density, index, event_id);
+        });
+    return;
+  }
+
+  auto edep = edep_per_length * step_length;
 
   // Kill photon below a given energy
   if (energy <= fEnergyMin) {
@@ -149,24 +255,36 @@ void GateTLEDoseActor::SteppingAction(G4Step *step) {
   bool isInside;
   Image3DType::IndexType index;
   GetVoxelPosition(step, position, isInside, index);
-  auto event_id =
-      G4RunManager::GetRunManager()->GetCurrentEvent()->GetEventID();
   if (isInside) {
-    G4AutoLock mutex(&SetPixelTLEMutex); // mutex is bound to the if-scope
+    ScoreTLEValue(edep, dose, index, event_id);
+  }
+}
+
+void GateTLEDoseActor::ScoreTLEValue(const double edep, const double dose,
+                                     const Image3DType::IndexType &index,
+                                     const int event_id) {
+  if (fThreadLocalScoringFlag) {
+    if (fDoseFlag) {
+      ScoreThreadLocalValue(fThreadLocalDataDose.Get(), dose, index);
+    }
+    ScoreThreadLocalValue(fThreadLocalDataEdep.Get(), edep, index);
+  } else {
+    // same mutex as the conventional scoring of the non-TLE particles
+    G4AutoLock mutex(&SetPixelMutex);
     if (fDoseFlag) {
       ImageAddValue<Image3DType>(cpp_dose_image, index, dose);
     }
     ImageAddValue<Image3DType>(cpp_edep_image, index, edep);
+  }
 
-    if (fEdepSquaredFlag || fDoseSquaredFlag) {
-      if (fEdepSquaredFlag) {
-        ScoreSquaredValue(fThreadLocalDataEdep.Get(), cpp_edep_squared_image,
-                          edep, event_id, index);
-      }
-      if (fDoseSquaredFlag) {
-        ScoreSquaredValue(fThreadLocalDataDose.Get(), cpp_dose_squared_image,
-                          dose, event_id, index);
-      }
+  if (fEdepSquaredFlag || fDoseSquaredFlag) {
+    if (fEdepSquaredFlag) {
+      ScoreSquaredValue(fThreadLocalDataEdep.Get(), cpp_edep_squared_image,
+                        edep, event_id, index);
+    }
+    if (fDoseSquaredFlag) {
+      ScoreSquaredValue(fThreadLocalDataDose.Get(), cpp_dose_squared_image,
+                        dose, event_id, index);
     }
   }
 }
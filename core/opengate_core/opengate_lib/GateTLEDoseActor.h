@@ -17,6 +17,8 @@
 #include "G4VPrimitiveScorer.hh"
 
 #include <pybind11/stl.h>
+#include <unordered_map>
+#include <vector>
 
 namespace py = pybind11;
 
@@ -41,14 +43,46 @@ public:
   // Conventional DoseActor if above this energy
   double fEnergyMax;
 
+  // Option: the track length of a step is distributed over all the voxels
+  // it crosses, instead of one voxel chosen along the step
+  bool fTrackLengthFlag;
+
+  // Number of log(E) bins of the per-thread mu_en tables
+  // (0: no table, the shared mu handler is used at each step, as before)
+  int fMuEnTableBins;
+
+  // Compared by pointer (no string comparison in the stepping action)
+  const G4ParticleDefinition *fGamma;
+
+  // mu_en/rho of one material, tabulated on a regular log(E) grid: the
+  // lookup is O(1) and the log-log interpolation slopes are precomputed
+  struct MuEnTable {
+    double fLogEnergyMin;
+    double fInvLogStep;
+    std::vector<double> fLogMuEn;
+    std::vector<double> fSlope;
+    double GetMuEnOverRho(double energy) const;
+  };
+
   struct threadLocalT {
     // Bool if current track is a TLE gamma or not
     bool fIsTLEGamma;
     bool fIsTLESecondary;
-    std::map<G4int, G4int> fSecNbWhichDeposit;
+    std::unordered_map<G4int, G4int> fSecNbWhichDeposit;
+    // One table per material couple, built the first time it is used
+    std::unordered_map<const G4MaterialCutsCouple *, MuEnTable> fMuEnTables;
   };
   G4Cache<threadLocalT> fThreadLocalData;
 
+  double GetMuEnOverRho(const G4MaterialCutsCouple *couple, double energy);
+
+  const MuEnTable &GetMuEnTable(const G4MaterialCutsCouple *couple);
+
+  void BuildMuEnTable(const G4MaterialCutsCouple *couple, MuEnTable &table);
+
+  void ScoreTLEValue(double edep, double dose,
+                     const Image3DType::IndexType &index, int event_id);
+
   // Database of mu
   std::shared_ptr<GateMaterialMuHandler> fMaterialMuHandler;
 };
@@ -7,6 +7,7 @@
 
 #include "GateTrackingAction.h"
 #include "G4RunManager.hh"
+#include "GateProfiler.h"
 #include "GateUserEventInformation.h"
 
 GateTrackingAction::GateTrackingAction() : G4UserTrackingAction() {
@@ -30,12 +31,14 @@ void GateTrackingAction::PreUserTrackingAction(const G4Track *track) {
     info->PreUserTrackingAction(track);
   }
   for (auto actor : fPreUserTrackingActionActors) {
+    GateProfiler::Timer timer(actor, "PreUserTrackingAction");
     actor->PreUserTrackingAction(track);
   }
 }
 
 void GateTrackingAction::PostUserTrackingAction(const G4Track *track) {
   for (auto actor : fPostUserTrackingActionActors) {
+    GateProfiler::Timer timer(actor, "PostUserTrackingAction");
     actor->PostUserTrackingAction(track);
   }
 }
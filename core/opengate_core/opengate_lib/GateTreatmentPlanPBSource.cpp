@@ -3,7 +3,9 @@
 #include "G4ParticleTable.hh"
 #include "G4RandomTools.hh"
 #include "GateHelpersDict.h"
+#include <CLHEP/Random/RandBinomial.h>
 #include <G4UnitsTable.hh>
+#include <algorithm>
 
 GateTreatmentPlanPBSource::GateTreatmentPlanPBSource() : GateVSource() {
   // fNumberOfGeneratedEvents = 0; // Keeps truck of nb events per RUN
@@ -11,10 +13,7 @@ GateTreatmentPlanPBSource::GateTreatmentPlanPBSource() : GateVSource() {
   fA = 0;
   fZ = 0;
   fE = 0;
-  fEngine = nullptr;
-  fDistriGeneral = nullptr;
   fSortedSpotGenerationFlag = false;
-  fPDF = nullptr;
   fTotalNumberOfSpots = 0;
 }
 
@@ -35,8 +34,7 @@ void GateTreatmentPlanPBSource::InitializeUserInfo(py::dict &user_info) {
 
   // common to all spots
   InitializeParticle(user_info);
-  std::vector<double> mPDFVector = DictGetVecDouble(user_info, "pdf");
-  fPDF = mPDFVector.data(); // returns pointer to first element of the array
+  fPDF = DictGetVecDouble(user_info, "pdf");
   fSortedSpotGenerationFlag = DictGetBool(user_info, "sorted_spot_generation");
 
   // vectors with info for each spot
@@ -53,8 +51,8 @@ void GateTreatmentPlanPBSource::InitializeUserInfo(py::dict &user_info) {
   ll.fNbGeneratedSpots.resize(fTotalNumberOfSpots,
                               0); // keep track for debug
 
-  // Init the random fEngine
-  InitRandomEngine();
+  // Init the alias table used to sample the spots
+  InitAliasTable();
   // assign n_particles to each spot, in case of sorted generation
   if (fSortedSpotGenerationFlag) {
     InitNbPrimariesVec();
@@ -63,17 +61,71 @@ void GateTreatmentPlanPBSource::InitializeUserInfo(py::dict &user_info) {
 
 void GateTreatmentPlanPBSource::InitNbPrimariesVec() {
   auto &ll = GetThreadLocalDataTPSource();
-  // Initialize all spots to zero particles
-  ll.fNbIonsToGenerate.resize(fTotalNumberOfSpots, 0);
-  for (long int i = 0; i < fMaxN; i++) {
-    int bin = fTotalNumberOfSpots * fDistriGeneral->fire();
-    ++ll.fNbIonsToGenerate[bin];
+  // Multinomial draw of the nb of particles of all spots, as a sequence of
+  // binomial draws (conditional on the particles not yet allocated)
+  ll.fNbIonsToGenerate.assign(fTotalNumberOfSpots, 0);
+  auto *engine = G4Random::getTheEngine();
+  long int remaining_n = fMaxN;
+  double remaining_p = 1.0;
+  for (int i = 0; i < fTotalNumberOfSpots && remaining_n > 0; i++) {
+    long int n = remaining_n;
+    if (i < fTotalNumberOfSpots - 1 && fPDF[i] < remaining_p) {
+      double p = std::max(0.0, fPDF[i] / remaining_p);
+      n = (long int)CLHEP::RandBinomial::shoot(engine, remaining_n, p);
+    }
+    ll.fNbIonsToGenerate[i] = n;
+    remaining_n -= n;
+    remaining_p -= fPDF[i];
+  }
+}
+
+void GateTreatmentPlanPBSource::InitAliasTable() {
+  // Vose's alias method: each bin i is selected with probability
+  // fAliasProbability[i], otherwise the spot fAliasIndex[i] is used.
+  int n = fTotalNumberOfSpots;
+  fAliasProbability.assign(n, 1.0);
+  fAliasIndex.resize(n);
+  if (n == 0) {
+    return;
+  }
+  double sum = 0;
+  for (int i = 0; i < n; i++) {
+    sum += fPDF[i];
   }
+  std::vector<double> scaled(n);
+  std::vector<int> small;
+  std::vector<int> large;
+  for (int i = 0; i < n; i++) {
+    fAliasIndex[i] = i;
+    scaled[i] = fPDF[i] * n / sum;
+    if (scaled[i] < 1.0) {
+      small.push_back(i);
+    } else {
+      large.push_back(i);
+    }
+  }
+  while (!small.empty() && !large.empty()) {
+    int s = small.back();
+    small.pop_back();
+    int l = large.back();
+    fAliasProbability[s] = scaled[s];
+    fAliasIndex[s] = l;
+    scaled[l] = (scaled[l] + scaled[s]) - 1.0;
+    if (scaled[l] < 1.0) {
+      large.pop_back();
+      small.push_back(l);
+    }
+  }
+  // remaining bins (rounding errors) keep a probability of 1
 }
-void GateTreatmentPlanPBSource::InitRandomEngine() {
-  fEngine = new CLHEP::HepJamesRandom();
-  fDistriGeneral =
-      new CLHEP::RandGeneral(fEngine, fPDF, fTotalNumberOfSpots, 0);
+
+int GateTreatmentPlanPBSource::SampleSpotIndex() const {
+  double u = G4UniformRand() * fTotalNumberOfSpots;
+  int bin = std::min((int)u, fTotalNumberOfSpots - 1);
+  if (u - bin < fAliasProbability[bin]) {
+    return bin;
+  }
+  return fAliasIndex[bin];
 }
 
 double GateTreatmentPlanPBSource::CalcNextTime(double current_simulation_time) {
@@ -152,8 +204,7 @@ void GateTreatmentPlanPBSource::FindNextSpot() {
 
   } else {
     // select random spot according to PDF
-    int bin = fTotalNumberOfSpots * fDistriGeneral->fire();
-    ll.fCurrentSpot = bin;
+    ll.fCurrentSpot = SampleSpotIndex();
   }
 }
 
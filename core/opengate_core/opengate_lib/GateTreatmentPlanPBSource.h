@@ -49,13 +49,14 @@ protected:
   threadLocalTPSource &GetThreadLocalDataTPSource();
 
   // variables common to all spots
-  CLHEP::HepRandomEngine *fEngine;
-  CLHEP::RandGeneral *fDistriGeneral;
   G4String fParticleType;
   bool fSortedSpotGenerationFlag;
 
   // vectors collecting spot-specific variables
-  double *fPDF;
+  std::vector<double> fPDF;
+  // alias table (Walker/Vose) to sample the spot index in O(1) per event
+  std::vector<double> fAliasProbability;
+  std::vector<int> fAliasIndex;
   std::vector<double> fSpotWeight;
   std::vector<double> fSpotEnergy;
   std::vector<double> fSigmaEnergy;
@@ -79,7 +80,8 @@ protected:
                          const G4RotationMatrix &localRot);
   void InitializeParticle(py::dict &user_info);
   void InitializeIon(py::dict &user_info);
-  void InitRandomEngine();
+  void InitAliasTable();
+  int SampleSpotIndex() const;
   void InitNbPrimariesVec();
 };
 #endif // GateTreatmentPlanPBSource_h
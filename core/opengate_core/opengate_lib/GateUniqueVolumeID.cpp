@@ -140,3 +140,11 @@ std::string GateUniqueVolumeID::GetIdUpToDepth(int depth) {
   fCachedIdDepth[depth] = s;
   return s;
 }
+
+int GateUniqueVolumeID::GetNumericIdUpToDepth(int depth) const {
+  if (fNumericIdUpToDepth.empty())
+    return -1;
+  if (depth == -1 || depth >= (int)fNumericIdUpToDepth.size())
+    return fNumericIdUpToDepth.back();
+  return fNumericIdUpToDepth[depth];
+}
@@ -74,10 +74,15 @@ public:
 
   std::string GetIdUpToDepth(int depth);
 
+  // Integer equivalent of GetIdUpToDepth, set by GateUniqueVolumeIDManager
+  // (-1 if this ID was not created by the manager)
+  int GetNumericIdUpToDepth(int depth) const;
+
   std::vector<VolumeDepthID> fVolumeDepthID;
   IDArrayType fArrayID{};
   std::string fID;
   std::map<int, std::string> fCachedIdDepth;
+  std::vector<int> fNumericIdUpToDepth;
 };
 
 #endif // GateUniqueVolumeID_h
@@ -21,18 +21,40 @@ GateUniqueVolumeIDManager *GateUniqueVolumeIDManager::GetInstance() {
 
 GateUniqueVolumeIDManager::GateUniqueVolumeIDManager() = default;
 
+size_t GateUniqueVolumeIDManager::TouchableKeyHash::operator()(
+    const TouchableKey &k) const {
+  auto h = std::hash<const void *>()(k.fVolume);
+  for (auto i : k.fArrayID) {
+    if (i == -1)
+      break;
+    h ^= std::hash<int>()(i) + 0x9e3779b9 + (h << 6) + (h >> 2);
+  }
+  return h;
+}
+
 GateUniqueVolumeID::Pointer
 GateUniqueVolumeIDManager::GetVolumeID(const G4VTouchable *touchable) {
+  // Fast path: the volume has already been met by this thread. The cache is
+  // thread local, no lock is needed.
+  const auto id = GateUniqueVolumeID::ComputeArrayID(touchable);
+  auto &cache = fThreadLocalCache.Get();
+  const TouchableKey key{touchable->GetVolume(), id};
+  auto it = cache.find(key);
+  if (it != cache.end())
+    return it->second;
+  auto uid = GetOrCreateVolumeID(touchable, id);
+  cache[key] = uid;
+  return uid;
+}
+
+GateUniqueVolumeID::Pointer GateUniqueVolumeIDManager::GetOrCreateVolumeID(
+    const G4VTouchable *touchable, const GateUniqueVolumeID::IDArrayType &id) {
   // Since this function can be called from different threads,
   // the map fToVolumeID must be protected against concurrent modifications.
   // Concurrent reads of fToVolumeID are allowed, however.
 
-  // Since this function is potentially called a large number of times (every
-  // hit), locks need to be in place as briefly as possible.
-
   // https://geant4-forum.web.cern.ch/t/identification-of-unique-physical-volumes-with-ids/2568/3
   const auto name = touchable->GetVolume()->GetName();
-  const auto id = GateUniqueVolumeID::ComputeArrayID(touchable);
 
   // Gain read access before checking if the touchable has already
   // been associated with a unique volume ID.
@@ -54,12 +76,35 @@ GateUniqueVolumeIDManager::GetVolumeID(const G4VTouchable *touchable) {
       return it->second;
     } else {
       // Add the new ID to the map and return it.
+      SetNumericIDs(uid);
       fToVolumeID[{name, id}] = uid;
       return uid;
     }
   }
 }
 
+void GateUniqueVolumeIDManager::SetNumericIDs(GateUniqueVolumeID::Pointer uid) {
+  // (called with the write lock)
+  // One integer per depth: the same as GetIdUpToDepth, but without strings
+  const auto &depths = uid->GetVolumeDepthID();
+  uid->fNumericIdUpToDepth.resize(depths.size());
+  GateUniqueVolumeID::IDArrayType a{};
+  a.fill(-1);
+  for (size_t d = 0; d < depths.size(); d++) {
+    a[d] = uid->fArrayID[d];
+    auto key = std::make_pair(depths[d].fVolumeName, a);
+    auto it = fToNumericID.find(key);
+    if (it == fToNumericID.end())
+      it = fToNumericID.emplace(key, (int)fToNumericID.size()).first;
+    uid->fNumericIdUpToDepth[d] = it->second;
+  }
+}
+
+int GateUniqueVolumeIDManager::GetNumberOfNumericIDs() const {
+  std::shared_lock<std::shared_mutex> readLock(GetVolumeIDMutex);
+  return (int)fToNumericID.size();
+}
+
 std::vector<GateUniqueVolumeID::Pointer>
 GateUniqueVolumeIDManager::GetAllVolumeIDs() const {
   std::vector<GateUniqueVolumeID::Pointer> l;
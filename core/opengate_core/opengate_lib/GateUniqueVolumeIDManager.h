@@ -8,14 +8,21 @@
 #ifndef GateUniqueVolumeIDManager_h
 #define GateUniqueVolumeIDManager_h
 
+#include "G4Cache.hh"
 #include "G4VTouchable.hh"
 #include "GateUniqueVolumeID.h"
 #include <string>
+#include <unordered_map>
 #include <utility>
 
 /*
     Global singleton class that manage a correspondence between touchable
     pointer and unique volume ID.
+
+    Each unique volume ID gets dense integer IDs (one per depth), assigned
+    when it is created. A per-thread cache, keyed by the physical volume
+    pointer and the copy numbers, avoids the string comparisons and the lock
+    of the shared map for the volumes already met by the thread.
  */
 
 class GateUniqueVolumeIDManager {
@@ -26,9 +33,35 @@ public:
 
   std::vector<GateUniqueVolumeID::Pointer> GetAllVolumeIDs() const;
 
+  // Number of integer IDs assigned so far (all depths)
+  int GetNumberOfNumericIDs() const;
+
 protected:
   GateUniqueVolumeIDManager();
 
+  GateUniqueVolumeID::Pointer
+  GetOrCreateVolumeID(const G4VTouchable *touchable,
+                      const GateUniqueVolumeID::IDArrayType &id);
+
+  void SetNumericIDs(GateUniqueVolumeID::Pointer uid);
+
+  struct TouchableKey {
+    const G4VPhysicalVolume *fVolume;
+    GateUniqueVolumeID::IDArrayType fArrayID;
+    bool operator==(const TouchableKey &k) const {
+      return fVolume == k.fVolume && fArrayID == k.fArrayID;
+    }
+  };
+
+  struct TouchableKeyHash {
+    size_t operator()(const TouchableKey &k) const;
+  };
+
+  typedef std::unordered_map<TouchableKey, GateUniqueVolumeID::Pointer,
+                             TouchableKeyHash>
+      ThreadLocalCacheType;
+  G4Cache<ThreadLocalCacheType> fThreadLocalCache;
+
   static GateUniqueVolumeIDManager *fInstance;
 
   // Index of name + ID array to VolumeID
@@ -36,6 +69,10 @@ protected:
   std::map<std::pair<std::string, GateUniqueVolumeID::IDArrayType>,
            GateUniqueVolumeID::Pointer>
       fToVolumeID;
+
+  // Index of name + ID array (truncated at a given depth) to integer ID
+  std::map<std::pair<std::string, GateUniqueVolumeID::IDArrayType>, int>
+      fToNumericID;
 };
 
 #endif // GateUniqueVolumeIDManager_h
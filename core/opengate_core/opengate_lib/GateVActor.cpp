@@ -11,6 +11,7 @@
 #include "GateHelpers.h"
 #include "GateHelpersDict.h"
 #include "GateMultiFunctionalDetector.h"
+#include "GateProfiler.h"
 #include "GateSourceManager.h"
 
 GateVActor::GateVActor(py::dict &user_info, bool MT_ready)
@@ -26,6 +27,10 @@ GateVActor::~GateVActor() = default;
 
 void GateVActor::InitializeCpp() {
   GateActorManager::AddActor(this);
+  // names used by the profiler (see SimulationStatisticsActor)
+  GateProfiler::GetInstance()->Register(this, "actors", GetName());
+  for (auto f : fFilters)
+    GateProfiler::GetInstance()->Register(f, "filters", f->fName);
   // Complain if the actor is not (yet) ready for multi-threading
   if (!fMultiThreadReady && G4Threading::IsMultithreadedApplication()) {
     std::ostringstream oss;
@@ -135,15 +140,17 @@ G4bool GateVActor::ProcessHits(G4Step *step, G4TouchableHistory *) {
   // are true (If only one is false, we stop and return)
   if (fOperatorIsAnd) {
     for (auto f : fFilters) {
-      if (!f->Accept(step))
+      if (!AcceptStep(f, step))
         return true;
     }
+    GateProfiler::Timer timer(this, "SteppingAction");
     SteppingAction(step);
     return true;
   }
   // if the operator is OR, we accept as soon as one filter is OK
   for (auto f : fFilters) {
-    if (f->Accept(step)) {
+    if (AcceptStep(f, step)) {
+      GateProfiler::Timer timer(this, "SteppingAction");
       SteppingAction(step);
       return true;
     }
@@ -151,6 +158,11 @@ G4bool GateVActor::ProcessHits(G4Step *step, G4TouchableHistory *) {
   return true;
 }
 
+bool GateVActor::AcceptStep(GateVFilter *filter, G4Step *step) {
+  GateProfiler::Timer timer(filter, "Accept");
+  return filter->Accept(step);
+}
+
 void GateVActor::RegisterSD(G4LogicalVolume *lv) {
   // Look is a SD already exist for this LV
   auto currentSD = lv->GetSensitiveDetector();
@@ -51,6 +51,9 @@ public:
   // Take care about the filters
   G4bool ProcessHits(G4Step *, G4TouchableHistory *) override;
 
+  // Call the filter for this step (timed when profiling is enabled)
+  static bool AcceptStep(GateVFilter *filter, G4Step *step);
+
   /*
 
    ************ WARNING ************
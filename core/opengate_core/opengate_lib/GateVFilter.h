@@ -31,6 +31,9 @@ public:
   virtual bool Accept(const G4Track *track) const;
 
   virtual bool Accept(G4Step *step) const;
+
+  // Name of the filter (set on the python side)
+  std::string fName;
 };
 
 #endif // GateVFilter_h
@@ -11,6 +11,7 @@
 #include "GateHelpers.h"
 #include "GateHelpersDict.h"
 #include "GateHelpersGeometry.h"
+#include "GateProfiler.h"
 
 GateVSource::GateVSource() {
   fName = "";
@@ -35,6 +36,7 @@ GateVSource::threadLocalT &GateVSource::GetThreadLocalData() {
 void GateVSource::InitializeUserInfo(py::dict &user_info) {
   // get info from the dict
   fName = DictGetStr(user_info, "name");
+  GateProfiler::GetInstance()->Register(this, "sources", fName);
   fStartTime = DictGetDouble(user_info, "start_time");
   fEndTime = DictGetDouble(user_info, "end_time");
   fAttachedToVolumeName = DictGetStr(user_info, "attached_to");
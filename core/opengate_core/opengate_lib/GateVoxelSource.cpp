@@ -35,8 +35,8 @@ void GateVoxelSource::PrepareNextRun() {
   pos->SetPosRot2(r2);
 
   // auto &l = fThreadLocalData.Get();
-  fVoxelPositionGenerator->fGlobalRotation = l.fGlobalRotation;
-  fVoxelPositionGenerator->fGlobalTranslation = l.fGlobalTranslation;
+  fVoxelPositionGenerator->SetGlobalTransform(l.fGlobalRotation,
+                                              l.fGlobalTranslation);
   // the direction is 'isotropic' so we don't care about rotating the direction.
 }
 
@@ -193,6 +193,19 @@ void GateDigiAttributeManager::InitializeAllDigiAttributes() {
         auto uid = m->GetVolumeID(step->GetPostStepPoint()->GetTouchable());
         att->FillUValue(uid);
       });
+  DefineDigiAttribute(
+      "PreStepUniqueVolumeIDAsInt", 'I', FILLF {
+        // integer equivalent of PreStepUniqueVolumeID (as used by the adder)
+        auto *m = GateUniqueVolumeIDManager::GetInstance();
+        auto uid = m->GetVolumeID(step->GetPreStepPoint()->GetTouchable());
+        att->FillIValue(uid->GetNumericIdUpToDepth(-1));
+      });
+  DefineDigiAttribute(
+      "PostStepUniqueVolumeIDAsInt", 'I', FILLF {
+        auto *m = GateUniqueVolumeIDManager::GetInstance();
+        auto uid = m->GetVolumeID(step->GetPostStepPoint()->GetTouchable());
+        att->FillIValue(uid->GetNumericIdUpToDepth(-1));
+      });
   DefineDigiAttribute(
       "PDGCode", 'I', FILLF {
         att->FillIValue(
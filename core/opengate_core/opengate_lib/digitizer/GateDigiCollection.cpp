@@ -10,12 +10,17 @@
 #include "GateDigiAttributeManager.h"
 #include "GateDigiCollectionIterator.h"
 #include "GateDigiCollectionsRootManager.h"
+#include <algorithm>
+#include <filesystem>
+#include <fstream>
 
 GateDigiCollection::GateDigiCollection(const std::string &collName)
     : G4VHitsCollection("", collName), fDigiCollectionName(collName) {
   fTupleId = -1;
   fDigiCollectionTitle = "Digi collection";
   fCurrentDigiAttributeId = 0;
+  fRootFlushSize = 0;
+  fColumnarOutputFlag = false;
   SetFilenameAndInitRoot("");
   threadLocalData.Get().fBeginOfEventIndex = 0;
 }
@@ -52,7 +57,7 @@ void GateDigiCollection::InitDigiAttributesFromNames(
 }
 
 void GateDigiCollection::RootStartInitialization() {
-  if (!fWriteToRootFlag)
+  if (!fWriteToRootFlag || fColumnarOutputFlag)
     return;
   auto *am = GateDigiCollectionsRootManager::GetInstance();
   auto id = am->DeclareNewTuple(fDigiCollectionName);
@@ -62,12 +67,16 @@ void GateDigiCollection::RootStartInitialization() {
 void GateDigiCollection::RootInitializeTupleForMaster() {
   if (!fWriteToRootFlag)
     return;
+  if (fColumnarOutputFlag) {
+    ColumnarOutputInitialization();
+    return;
+  }
   auto *am = GateDigiCollectionsRootManager::GetInstance();
   am->CreateRootTuple(this);
 }
 
 void GateDigiCollection::RootInitializeTupleForWorker() {
-  if (!fWriteToRootFlag)
+  if (!fWriteToRootFlag || fColumnarOutputFlag)
     return;
   // no need if not multi-thread
   if (!G4Threading::IsMultithreadedApplication())
@@ -82,6 +91,8 @@ void GateDigiCollection::FillToRootIfNeeded(bool clear) {
       Policy :
       - can write to root or not according to the flag
       - can clear every N calls
+      - can keep the digis in memory until there are at least
+        fRootFlushSize of them, to write them in large blocks
    */
   if (!fWriteToRootFlag) {
     // need to set the index before (in case we don't clear)
@@ -91,18 +102,33 @@ void GateDigiCollection::FillToRootIfNeeded(bool clear) {
       SetBeginOfEventIndex();
     return;
   }
-  FillToRoot();
+  if (!clear && GetSize() < fRootFlushSize) {
+    SetBeginOfEventIndex();
+    return;
+  }
+  if (fColumnarOutputFlag)
+    FillToColumns();
+  else
+    FillToRoot();
 }
 
 void GateDigiCollection::FillToRoot() {
   /*
-   * maybe not very efficient to loop that way (row then column)
-   * but I don't manage to do elsewhere
+   * The G4 ntuples are filled row by row (all columns then AddNtupleRow).
+   * The column fillers are prepared once for all the rows, so that the
+   * thread local vectors and the analysis manager are not looked up for
+   * every single value.
    */
   auto *am = GateDigiCollectionsRootManager::GetInstance();
-  for (size_t i = 0; i < GetSize(); i++) {
-    for (auto *att : fDigiAttributes) {
-      att->FillToRoot(i);
+  std::vector<GateVDigiAttribute::RootFillerFunctionType> fillers;
+  fillers.reserve(fDigiAttributes.size());
+  for (auto *att : fDigiAttributes) {
+    fillers.push_back(att->GetRootFiller());
+  }
+  auto n = GetSize();
+  for (size_t i = 0; i < n; i++) {
+    for (auto &filler : fillers) {
+      filler(i);
     }
     am->AddNtupleRow(fTupleId);
   }
@@ -110,6 +136,57 @@ void GateDigiCollection::FillToRoot() {
   Clear();
 }
 
+std::string GateDigiCollection::GetColumnarOutputFolder() const {
+  std::filesystem::path folder(fFilename);
+  folder.replace_extension(".columns");
+  return (folder / fDigiCollectionName).string();
+}
+
+void GateDigiCollection::ColumnarOutputInitialization() const {
+  // remove the columns of a previous simulation
+  std::filesystem::path folder(GetColumnarOutputFolder());
+  std::filesystem::remove_all(folder);
+  std::filesystem::create_directories(folder);
+  // list of the columns (name and type), in the order of the attributes
+  std::ofstream f(folder / "columns.txt");
+  for (auto *att : fDigiAttributes) {
+    auto name = att->GetDigiAttributeName();
+    auto type = att->GetDigiAttributeType();
+    if (type == '3') {
+      f << name << "_X D\n" << name << "_Y D\n" << name << "_Z D\n";
+    } else {
+      // the unique volume ids are written as strings
+      f << name << " " << (type == 'U' ? 'S' : type) << "\n";
+    }
+  }
+  if (!f) {
+    std::ostringstream oss;
+    oss << "Error, cannot write the columns of the DigiCollection '"
+        << fDigiCollectionName << "' in " << folder;
+    Fatal(oss.str());
+  }
+}
+
+void GateDigiCollection::FillToColumns() {
+  /*
+   * Columnar output: the values of each attribute are appended as a single
+   * block to a binary file per attribute and per thread (one write per
+   * column instead of one fill per value). The files are converted to a root
+   * tree at the end of the simulation (python side).
+   */
+  if (GetSize() > 0) {
+    std::ostringstream oss;
+    oss << GetColumnarOutputFolder() << "/t"
+        << std::max(0, G4Threading::G4GetThreadId());
+    auto folder = oss.str();
+    std::filesystem::create_directories(folder);
+    for (auto *att : fDigiAttributes) {
+      att->FillToColumns(folder);
+    }
+  }
+  Clear();
+}
+
 void GateDigiCollection::Clear() {
   for (auto *att : fDigiAttributes) {
     att->Clear();
@@ -118,14 +195,14 @@ void GateDigiCollection::Clear() {
 }
 
 void GateDigiCollection::Write() const {
-  if (!fWriteToRootFlag)
+  if (!fWriteToRootFlag || fColumnarOutputFlag)
     return;
   auto *am = GateDigiCollectionsRootManager::GetInstance();
   am->Write(fTupleId);
 }
 
 void GateDigiCollection::Close() const {
-  if (!fWriteToRootFlag)
+  if (!fWriteToRootFlag || fColumnarOutputFlag)
     return;
   auto *am = GateDigiCollectionsRootManager::GetInstance();
   am->CloseFile(fTupleId);
@@ -33,8 +33,14 @@ class GateDigiCollectionIterator;
       3) RootInitializeTupleForWorker in RunAction  !! ONLY DURING FIRST RUN !!
       4) FillToRoot to copy the values in the root file
           Can be, e.g., each Event or each Run
+          With SetRootFlushSize, the digis are kept in memory until there are
+          enough of them, and written all at once.
           Clear is needed once FillToRootIfNeeded.
  *        This function also sets the internal event index (needed).
+ *        With SetColumnarOutputFlag (before SetFilenameAndInitRoot), the
+ *        G4 ntuples are not used: the values of each attribute are written
+ *        as one block per flush in a binary column file (one per thread),
+ *        converted to a root file at the end of the simulation (python side).
  *    5) Write
  *       If MT, need Write for all threads (EndOfRunAction) and for Master
  *       (EndSimulationAction) *
@@ -76,6 +82,22 @@ public:
 
   void SetFilenameAndInitRoot(std::string filename);
 
+  // Minimal number of digis kept in memory before they are written to root
+  // (0 = written at each event)
+  void SetRootFlushSize(size_t n) { fRootFlushSize = n; }
+
+  size_t GetRootFlushSize() const { return fRootFlushSize; }
+
+  // Write the digis in binary column files instead of the G4 ntuples
+  // (must be set before SetFilenameAndInitRoot)
+  void SetColumnarOutputFlag(bool b) { fColumnarOutputFlag = b; }
+
+  bool GetColumnarOutputFlag() const { return fColumnarOutputFlag; }
+
+  // Folder of the column files of this collection (in the folder named as
+  // the root file, with the '.columns' extension)
+  std::string GetColumnarOutputFolder() const;
+
   std::string GetFilename() const { return fFilename; }
 
   std::string GetTitle() const { return fDigiCollectionTitle; }
@@ -124,6 +146,8 @@ protected:
   int fTupleId;
   int fCurrentDigiAttributeId;
   bool fWriteToRootFlag;
+  size_t fRootFlushSize;
+  bool fColumnarOutputFlag;
 
   // thread local: the index of the beginning
   // of event is specific for each thread
@@ -133,6 +157,10 @@ protected:
   G4Cache<threadLocal_t> threadLocalData;
 
   void FillToRoot();
+
+  void ColumnarOutputInitialization() const;
+
+  void FillToColumns();
 };
 
 #endif // GateDigiCollection_h
@@ -19,7 +19,13 @@ GateDigiCollectionsRootManager *GateDigiCollectionsRootManager::GetInstance() {
   return fInstance;
 }
 
-GateDigiCollectionsRootManager::GateDigiCollectionsRootManager() {}
+GateDigiCollectionsRootManager::GateDigiCollectionsRootManager() {
+  fNtupleMergingFlag = true;
+}
+
+void GateDigiCollectionsRootManager::SetNtupleMergingFlag(bool b) {
+  fNtupleMergingFlag = b;
+}
 
 void GateDigiCollectionsRootManager::OpenFile(int tupleId,
                                               std::string filename) {
@@ -33,7 +39,9 @@ void GateDigiCollectionsRootManager::OpenFile(int tupleId,
     // SetNtupleMerging must be called before OpenFile
     // To avoid a warning, the flag is only set for the master thread
     // and for the first opened tuple only.
-    if (G4Threading::IsMultithreadedApplication()) {
+    // Without merging, each worker thread writes its own file (with a _tN
+    // suffix), merged at the end of the simulation from the python side.
+    if (G4Threading::IsMultithreadedApplication() && fNtupleMergingFlag) {
       auto *run = G4RunManager::GetRunManager()->GetCurrentRun();
       if (run) {
         if (run->GetRunID() == 0 && tupleId == 0)
@@ -91,6 +99,9 @@ void GateDigiCollectionsRootManager::Write(int tupleId) {
   if (shouldWrite) {
     auto *ram = G4RootAnalysisManager::Instance();
     ram->Write();
+    // without merging, the worker files are complete and can be closed now
+    if (!G4Threading::IsMasterThread() && !fNtupleMergingFlag)
+      ram->CloseFile();
     // reset flags (not sure needed)
     for (auto &m : tupleShouldBeWritten)
       m.second = false;
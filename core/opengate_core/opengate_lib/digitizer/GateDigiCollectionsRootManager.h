@@ -46,6 +46,11 @@ public:
 
   void AddNtupleRow(int tupleId);
 
+  // If false, in MT mode, each thread writes its own root file
+  void SetNtupleMergingFlag(bool b);
+
+  bool GetNtupleMergingFlag() const { return fNtupleMergingFlag; }
+
 protected:
   GateDigiCollectionsRootManager();
 
@@ -62,6 +67,7 @@ protected:
   G4Cache<threadLocal_t> threadLocalData;
 
   std::map<std::string, int> fTupleNameIdMap;
+  bool fNtupleMergingFlag;
   // std::map<int, bool> fAlreadyWrite;
 };
 
@@ -156,7 +156,7 @@ void GateDigitizerAdderActor::AddDigiPerVolume() {
     return;
   // uid and fGroupVolumeDepth are only used for repeated volume (such as in
   // PET)
-  auto uid = l.volID->get()->GetIdUpToDepth(fGroupVolumeDepth);
+  auto uid = l.volID->get()->GetNumericIdUpToDepth(fGroupVolumeDepth);
   if (l.fMapOfDigiInVolume.count(uid) == 0) {
     // l.fMapOfDigiInVolume[uid] =
     // std::make_shared<GateDigiAdderInVolume>(fPolicy, fTimeDifferenceFlag);
@@ -82,9 +82,8 @@ protected:
 
   // During computation (thread local)
   struct threadLocalT {
-    // std::map<std::string, std::shared_ptr<GateDigiAdderInVolume>>
-    // fMapOfDigiInVolume;
-    std::map<std::string, GateDigiAdderInVolume *> fMapOfDigiInVolume;
+    // key is the integer volume ID (see GetNumericIdUpToDepth)
+    std::map<int, GateDigiAdderInVolume *> fMapOfDigiInVolume;
     double *edep;
     G4ThreeVector *pos;
     GateUniqueVolumeID::Pointer *volID;
@@ -8,6 +8,7 @@
 #include "GateDigitizerEnergyWindowsActor.h"
 #include "../GateHelpersDict.h"
 #include "GateDigiCollectionManager.h"
+#include "GateDigiCollectionsRootManager.h"
 #include <iostream>
 
 GateDigitizerEnergyWindowsActor::GateDigitizerEnergyWindowsActor(
@@ -29,6 +30,11 @@ void GateDigitizerEnergyWindowsActor::InitializeUserInfo(py::dict &user_info) {
   fInputDigiCollectionName = DictGetStr(user_info, "input_digi_collection");
   fUserSkipDigiAttributeNames = DictGetVecStr(user_info, "skip_attributes");
   fClearEveryNEvents = DictGetInt(user_info, "clear_every");
+  fRootFlushSize = DictGetInt(user_info, "root_flush_size");
+  fColumnarOutputFlag =
+      DictGetStr(user_info, "root_output_backend") == "columnar";
+  GateDigiCollectionsRootManager::GetInstance()->SetNtupleMergingFlag(
+      !DictGetBool(user_info, "root_output_per_thread"));
 
   // Get information for all channels
   auto dv = DictGetVecDict(user_info, "channels");
@@ -65,7 +71,9 @@ void GateDigitizerEnergyWindowsActor::StartSimulationAction() {
     } else {
       outputPath = GetOutputPath(fOutputNameRoot);
     }
+    hc->SetColumnarOutputFlag(fColumnarOutputFlag);
     hc->SetFilenameAndInitRoot(outputPath);
+    hc->SetRootFlushSize(fRootFlushSize);
     // hc->InitDigiAttributesFromNames(names);
     hc->InitDigiAttributesFromCopy(fInputDigiCollection,
                                    fUserSkipDigiAttributeNames);
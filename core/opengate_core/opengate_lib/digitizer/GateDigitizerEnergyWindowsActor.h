@@ -63,6 +63,8 @@ protected:
   std::vector<double> fChannelMin;
   std::vector<double> fChannelMax;
   int fClearEveryNEvents;
+  int fRootFlushSize;
+  bool fColumnarOutputFlag;
 
   void ApplyThreshold(size_t i, double min, double max);
 
@@ -9,6 +9,7 @@
 #include "../GateHelpersDict.h"
 #include "G4RunManager.hh"
 #include "GateDigiCollectionManager.h"
+#include "GateDigiCollectionsRootManager.h"
 
 GateDigitizerHitsCollectionActor::GateDigitizerHitsCollectionActor(
     py::dict &user_info)
@@ -35,6 +36,11 @@ void GateDigitizerHitsCollectionActor::InitializeUserInfo(py::dict &user_info) {
   fUserDigiAttributeNames = DictGetVecStr(user_info, "attributes");
   fDebug = DictGetBool(user_info, "debug");
   fClearEveryNEvents = DictGetInt(user_info, "clear_every");
+  fRootFlushSize = DictGetInt(user_info, "root_flush_size");
+  fColumnarOutputFlag =
+      DictGetStr(user_info, "root_output_backend") == "columnar";
+  GateDigiCollectionsRootManager::GetInstance()->SetNtupleMergingFlag(
+      !DictGetBool(user_info, "root_output_per_thread"));
   fKeepZeroEdep = DictGetBool(user_info, "keep_zero_edep");
 }
 
@@ -55,7 +61,9 @@ void GateDigitizerHitsCollectionActor::StartSimulationAction() {
   } else {
     outputPath = GetOutputPath(fOutputNameRoot);
   }
+  fHits->SetColumnarOutputFlag(fColumnarOutputFlag);
   fHits->SetFilenameAndInitRoot(outputPath);
+  fHits->SetRootFlushSize(fRootFlushSize);
   fHits->InitDigiAttributesFromNames(fUserDigiAttributeNames);
   fHits->RootInitializeTupleForMaster();
 }
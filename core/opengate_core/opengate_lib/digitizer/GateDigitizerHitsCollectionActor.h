@@ -53,6 +53,8 @@ protected:
   bool fDebug{};
   bool fKeepZeroEdep{};
   int fClearEveryNEvents{};
+  int fRootFlushSize{};
+  bool fColumnarOutputFlag{};
 };
 
 #endif // GateHitsCollectionActor_h
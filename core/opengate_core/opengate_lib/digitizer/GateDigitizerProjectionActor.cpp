@@ -19,7 +19,9 @@ GateDigitizerProjectionActor::GateDigitizerProjectionActor(py::dict &user_info)
   fActions.insert("StartSimulationAction");
   fActions.insert("EndOfEventAction");
   fActions.insert("BeginOfRunAction");
+  fActions.insert("EndOfRunAction");
   fPhysicalVolumeName = "None";
+  fUseWeights = false;
 }
 
 GateDigitizerProjectionActor::~GateDigitizerProjectionActor() = default;
@@ -30,6 +32,7 @@ void GateDigitizerProjectionActor::InitializeUserInfo(py::dict &user_info) {
   fDetectorOrientationMatrix = ConvertToG4RotationMatrix(r);
   fInputDigiCollectionNames =
       DictGetVecStr(user_info, "input_digi_collections");
+  fUseWeights = DictGetBool(user_info, "use_weights");
 }
 
 void GateDigitizerProjectionActor::InitializeCpp() {
@@ -48,6 +51,8 @@ void GateDigitizerProjectionActor::StartSimulationAction() {
     auto *hc = hcm->GetDigiCollection(name);
     fInputDigiCollections.push_back(hc);
     CheckRequiredAttribute(hc, "PostPosition");
+    if (fUseWeights)
+      CheckRequiredAttribute(hc, "Weight");
   }
 }
 
@@ -67,19 +72,36 @@ void GateDigitizerProjectionActor::BeginOfRunAction(const G4Run *run) {
           fInputDigiCollections[slice]->GetDigiAttribute("PostPosition");
       l.fInputPos[slice] = &att_pos->Get3Values();
     }
+    if (fUseWeights) {
+      l.fInputWeights.resize(fInputDigiCollectionNames.size());
+      for (size_t slice = 0; slice < fInputDigiCollections.size(); slice++) {
+        auto *att_w = fInputDigiCollections[slice]->GetDigiAttribute("Weight");
+        l.fInputWeights[slice] = &att_w->GetDValues();
+      }
+    }
   }
+  // The counts of this run are accumulated in a buffer of this thread (no
+  // mutex needed) and added to the image at the end of the run
+  auto size = fImage->GetLargestPossibleRegion().GetSize();
+  l.fProjection.assign(size[0] * size[1] * fInputDigiCollections.size(), 0.0);
 }
 
 void GateDigitizerProjectionActor::EndOfEventAction(const G4Event * /*event*/) {
+  for (size_t channel = 0; channel < fInputDigiCollections.size(); channel++)
+    ProcessSlice(channel);
+}
+
+void GateDigitizerProjectionActor::EndOfRunAction(const G4Run *run) {
+  // add the projection of this thread to the slices of this run
+  auto &l = fThreadLocalData.Get();
+  auto offset = run->GetRunID() * l.fProjection.size();
   G4AutoLock mutex(&DigitizerProjectionActorMutex);
-  auto run = G4RunManager::GetRunManager()->GetCurrentRun()->GetRunID();
-  for (size_t channel = 0; channel < fInputDigiCollections.size(); channel++) {
-    auto slice = channel + run * fInputDigiCollections.size();
-    ProcessSlice(slice, channel);
-  }
+  auto *pixels = fImage->GetBufferPointer() + offset;
+  for (size_t i = 0; i < l.fProjection.size(); i++)
+    pixels[i] += l.fProjection[i];
 }
 
-void GateDigitizerProjectionActor::ProcessSlice(long slice, size_t channel) {
+void GateDigitizerProjectionActor::ProcessSlice(size_t channel) {
   auto &l = fThreadLocalData.Get();
   auto *hc = fInputDigiCollections[channel];
   auto index = hc->GetBeginOfEventIndex();
@@ -92,6 +114,8 @@ void GateDigitizerProjectionActor::ProcessSlice(long slice, size_t channel) {
   const auto &pos = *l.fInputPos[channel];
   ImageType::PointType point;
   ImageType::IndexType pindex;
+  auto size = fImage->GetLargestPossibleRegion().GetSize();
+  auto *projection = l.fProjection.data() + channel * size[0] * size[1];
 
   // loop on channels
   for (size_t i = index; i < hc->GetSize(); i++) {
@@ -101,9 +125,10 @@ void GateDigitizerProjectionActor::ProcessSlice(long slice, size_t channel) {
 
     bool isInside = fImage->TransformPhysicalPointToIndex(point, pindex);
     if (isInside) {
-      // force the slice according to the channel
-      pindex[2] = slice;
-      ImageAddValue<ImageType>(fImage, pindex, 1);
+      // the slice is the channel (the run is taken into account at the end
+      // of the run)
+      double w = fUseWeights ? (*l.fInputWeights[channel])[i] : 1.0;
+      projection[pindex[0] + pindex[1] * size[0]] += w;
     } else {
       // Should never be here (?)
       /*DDDV(pos);
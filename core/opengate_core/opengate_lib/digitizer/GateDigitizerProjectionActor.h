@@ -45,6 +45,9 @@ public:
   // Called every time an Event ends (all threads)
   void EndOfEventAction(const G4Event *event) override;
 
+  // Called every time a Run ends (all threads)
+  void EndOfRunAction(const G4Run *run) override;
+
   void SetPhysicalVolumeName(std::string name);
 
   // Image type is 3D float by default
@@ -56,8 +59,9 @@ protected:
   std::vector<std::string> fInputDigiCollectionNames;
   std::vector<GateDigiCollection *> fInputDigiCollections;
   G4RotationMatrix fDetectorOrientationMatrix;
+  bool fUseWeights;
 
-  void ProcessSlice(long slice, size_t channel);
+  void ProcessSlice(size_t channel);
 
   G4ThreeVector fPreviousTranslation;
   G4RotationMatrix fPreviousRotation;
@@ -65,6 +69,9 @@ protected:
   // During computation
   struct threadLocalT {
     std::vector<std::vector<G4ThreeVector> *> fInputPos;
+    std::vector<std::vector<double> *> fInputWeights;
+    // projection of the current run for this thread (one slice per channel)
+    std::vector<double> fProjection;
   };
   G4Cache<threadLocalT> fThreadLocalData;
 };
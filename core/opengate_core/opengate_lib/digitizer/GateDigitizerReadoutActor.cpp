@@ -77,18 +77,18 @@ void GateDigitizerReadoutActor::EndOfEventAction(const G4Event * /*unused*/) {
       G4TouchableHistory fTouchableHistory;
       lro.fNavigator->LocateGlobalPointAndUpdateTouchable(digi->fFinalPosition,
                                                           &fTouchableHistory);
-      auto vid = GateUniqueVolumeID::New(&fTouchableHistory);
+      const auto hist_depth = fTouchableHistory.GetHistoryDepth();
 
       /* When computing the centroid, the final position maybe outside the
        * DiscretizeVolume. In that case, we ignore the hits */
-      if (fDiscretizeVolumeDepth >= vid->GetDepth()) {
+      if ((int)fDiscretizeVolumeDepth > hist_depth) {
         lro.fIgnoredHitsCount++;
         continue;
       }
-      auto tr = vid->GetLocalToWorldTransform(fDiscretizeVolumeDepth);
-      G4ThreeVector c; // 0,0,0 is the center of the shape
-      tr->ApplyPointTransform(c);
-      digi->fFinalPosition.set(c.getX(), c.getY(), c.getZ());
+      // The center of the shape (0,0,0) in world coordinates is the
+      // translation of the volume (depth counted from the world)
+      digi->fFinalPosition = fTouchableHistory.GetTranslation(
+          hist_depth - (int)fDiscretizeVolumeDepth);
 
       // (all "Fill" calls are thread local)
       fOutputEdepAttribute->FillDValue(digi->fFinalEdep);
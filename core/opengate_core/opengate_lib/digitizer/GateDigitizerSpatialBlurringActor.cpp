@@ -106,14 +106,12 @@ void GateDigitizerSpatialBlurringActor::BlurCurrentThreeVectorValue() {
   if (fKeepInSolidLimits) {
     G4TouchableHistory fTouchableHistory;
     l.fNavigator->LocateGlobalPointAndUpdateTouchable(vec, &fTouchableHistory);
-    auto vid = GateUniqueVolumeID::New(&fTouchableHistory);
-    phys_vol = vid->GetVolumeDepthID().back().fVolume;
+    phys_vol = fTouchableHistory.GetVolume(0);
     // If the volume is parameterised, we consider the parent volume to compute
     // the extent (otherwise the keep in solid will consider one single instance
     // of the repeated solid, instead of the whole parameterised volume).
     if (phys_vol->IsParameterised()) {
-      auto n = vid->GetVolumeDepthID().size();
-      phys_vol = vid->GetVolumeDepthID()[n - 2].fVolume;
+      phys_vol = fTouchableHistory.GetVolume(1);
     }
   }
 
@@ -8,6 +8,26 @@
 #include "GateTDigiAttribute.h"
 #include "G4RootAnalysisManager.hh"
 #include "GateDigiCollectionsRootManager.h"
+#include <fstream>
+
+void AppendDigiColumnBlock(const std::string &filename, const char *data,
+                           size_t size) {
+  // one single write for the whole block of values
+  std::ofstream f(filename, std::ios::binary | std::ios::app);
+  f.write(data, size);
+  if (!f) {
+    std::ostringstream oss;
+    oss << "Error, cannot write the digi column file " << filename;
+    Fatal(oss.str());
+  }
+}
+
+template <class T>
+void AppendDigiColumnBlock(const std::string &filename,
+                           const std::vector<T> &values) {
+  AppendDigiColumnBlock(filename, reinterpret_cast<const char *>(values.data()),
+                        values.size() * sizeof(T));
+}
 
 template <class T>
 GateTDigiAttribute<T>::GateTDigiAttribute(std::string vname)
@@ -117,6 +137,20 @@ void GateTDigiAttribute<T>::FillToRoot(size_t /*index*/) const {
       "Must not be here, FillToRootIfNeeded must be specialized for this type");
 }
 
+template <class T>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<T>::GetRootFiller() const {
+  return GateVDigiAttribute::GetRootFiller();
+}
+
+template <class T>
+void GateTDigiAttribute<T>::FillToColumns(
+    const std::string & /*folder*/) const {
+  DDE(fDigiAttributeType);
+  DDE(fDigiAttributeName);
+  Fatal("Must not be here, FillToColumns must be specialized for this type");
+}
+
 template <class T> std::string GateTDigiAttribute<T>::Dump(int i) const {
   std::ostringstream oss;
   oss << threadLocalData.Get().fValues[i];
@@ -236,6 +270,124 @@ void GateTDigiAttribute<GateUniqueVolumeID::Pointer>::FillToRoot(
   ram->FillNtupleSColumn(fTupleId, fDigiAttributeId, v);
 }
 
+template <>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<double>::GetRootFiller() const {
+  auto *ram = G4RootAnalysisManager::Instance();
+  const auto &values = threadLocalData.Get().fValues;
+  auto tid = fTupleId;
+  auto cid = fDigiAttributeId;
+  return [ram, &values, tid, cid](size_t index) {
+    ram->FillNtupleDColumn(tid, cid, values[index]);
+  };
+}
+
+template <>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<int>::GetRootFiller() const {
+  auto *ram = G4RootAnalysisManager::Instance();
+  const auto &values = threadLocalData.Get().fValues;
+  auto tid = fTupleId;
+  auto cid = fDigiAttributeId;
+  return [ram, &values, tid, cid](size_t index) {
+    ram->FillNtupleIColumn(tid, cid, values[index]);
+  };
+}
+
+template <>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<std::string>::GetRootFiller() const {
+  auto *ram = G4RootAnalysisManager::Instance();
+  const auto &values = threadLocalData.Get().fValues;
+  auto tid = fTupleId;
+  auto cid = fDigiAttributeId;
+  return [ram, &values, tid, cid](size_t index) {
+    ram->FillNtupleSColumn(tid, cid, values[index]);
+  };
+}
+
+template <>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<G4ThreeVector>::GetRootFiller() const {
+  auto *ram = G4RootAnalysisManager::Instance();
+  const auto &values = threadLocalData.Get().fValues;
+  auto tid = fTupleId;
+  auto cid = fDigiAttributeId;
+  return [ram, &values, tid, cid](size_t index) {
+    const auto &v = values[index];
+    ram->FillNtupleDColumn(tid, cid, v[0]);
+    ram->FillNtupleDColumn(tid, cid + 1, v[1]);
+    ram->FillNtupleDColumn(tid, cid + 2, v[2]);
+  };
+}
+
+template <>
+GateVDigiAttribute::RootFillerFunctionType
+GateTDigiAttribute<GateUniqueVolumeID::Pointer>::GetRootFiller() const {
+  auto *ram = G4RootAnalysisManager::Instance();
+  const auto &values = threadLocalData.Get().fValues;
+  auto tid = fTupleId;
+  auto cid = fDigiAttributeId;
+  return [ram, &values, tid, cid](size_t index) {
+    ram->FillNtupleSColumn(tid, cid, values[index]->fID);
+  };
+}
+
+template <>
+void GateTDigiAttribute<double>::FillToColumns(
+    const std::string &folder) const {
+  const auto &values = threadLocalData.Get().fValues;
+  AppendDigiColumnBlock(folder + "/" + fDigiAttributeName + ".bin", values);
+}
+
+template <>
+void GateTDigiAttribute<int>::FillToColumns(const std::string &folder) const {
+  const auto &values = threadLocalData.Get().fValues;
+  AppendDigiColumnBlock(folder + "/" + fDigiAttributeName + ".bin", values);
+}
+
+template <>
+void GateTDigiAttribute<std::string>::FillToColumns(
+    const std::string &folder) const {
+  // the strings are separated by a null character
+  std::string block;
+  for (const auto &v : threadLocalData.Get().fValues) {
+    block += v;
+    block += '\0';
+  }
+  AppendDigiColumnBlock(folder + "/" + fDigiAttributeName + ".bin",
+                        block.data(), block.size());
+}
+
+template <>
+void GateTDigiAttribute<G4ThreeVector>::FillToColumns(
+    const std::string &folder) const {
+  // one column per component
+  const auto &values = threadLocalData.Get().fValues;
+  std::vector<double> component(values.size());
+  for (int c = 0; c < 3; c++) {
+    for (size_t i = 0; i < values.size(); i++)
+      component[i] = values[i][c];
+    auto suffix = std::string("_") + "XYZ"[c] + ".bin";
+    AppendDigiColumnBlock(folder + "/" + fDigiAttributeName + suffix,
+                          component);
+  }
+}
+
+template <>
+void GateTDigiAttribute<GateUniqueVolumeID::Pointer>::FillToColumns(
+    const std::string &folder) const {
+  // the unique volume ids are written as strings, separated by a null
+  // character
+  std::string block;
+  for (const auto &v : threadLocalData.Get().fValues) {
+    block += v->fID;
+    block += '\0';
+  }
+  AppendDigiColumnBlock(folder + "/" + fDigiAttributeName + ".bin",
+                        block.data(), block.size());
+}
+
 template <> std::vector<double> &GateTDigiAttribute<double>::GetDValues() {
   return threadLocalData.Get().fValues;
 }
@@ -33,6 +33,10 @@ public:
 
   void FillToRoot(size_t index) const override;
 
+  RootFillerFunctionType GetRootFiller() const override;
+
+  void FillToColumns(const std::string &folder) const override;
+
   void FillDValue(double v) override;
 
   void FillSValue(std::string v) override;
@@ -51,3 +51,9 @@ std::vector<GateUniqueVolumeID::Pointer> &GateVDigiAttribute::GetUValues() {
 void GateVDigiAttribute::FillDigiWithEmptyValue() {
   Fatal("Must never be there ! FillDigiWithEmptyValue");
 }
+
+GateVDigiAttribute::RootFillerFunctionType
+GateVDigiAttribute::GetRootFiller() const {
+  // default: one call to FillToRoot per value
+  return [this](size_t index) { FillToRoot(index); };
+}
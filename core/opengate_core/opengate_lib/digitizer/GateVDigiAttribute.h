@@ -33,6 +33,19 @@ public:
 
   virtual void FillToRoot(size_t) const {}
 
+  // Function that fills the root columns with the value of a given index.
+  // It is prepared once before writing many rows (see
+  // GateDigiCollection::FillToRoot), so that the thread local values are not
+  // looked up for every value.
+  typedef std::function<void(size_t)> RootFillerFunctionType;
+
+  virtual RootFillerFunctionType GetRootFiller() const;
+
+  // Append all the (thread local) values as one block to the binary column
+  // file(s) of this attribute in the given folder (columnar output, see
+  // GateDigiCollection::FillToColumns)
+  virtual void FillToColumns(const std::string & /*folder*/) const {}
+
   virtual void FillDValue(double) {}
 
   virtual void FillSValue(std::string) {}
@@ -8,6 +8,7 @@
 #include "GateVDigitizerWithOutputActor.h"
 #include "../GateHelpersDict.h"
 #include "GateDigiCollectionManager.h"
+#include "GateDigiCollectionsRootManager.h"
 #include <iostream>
 
 GateVDigitizerWithOutputActor::GateVDigitizerWithOutputActor(
@@ -27,6 +28,8 @@ GateVDigitizerWithOutputActor::GateVDigitizerWithOutputActor(
   fInputDigiCollection = nullptr;
   fInitializeRootTupleForMasterFlag = true;
   fClearEveryNEvents = 1e5;
+  fRootFlushSize = 0;
+  fColumnarOutputFlag = false;
 }
 
 GateVDigitizerWithOutputActor::~GateVDigitizerWithOutputActor() = default;
@@ -46,6 +49,11 @@ void GateVDigitizerWithOutputActor::InitializeUserInfo(py::dict &user_info) {
   fOutputDigiCollectionName = DictGetStr(user_info, "name");
   fUserSkipDigiAttributeNames = DictGetVecStr(user_info, "skip_attributes");
   fClearEveryNEvents = DictGetInt(user_info, "clear_every");
+  fRootFlushSize = DictGetInt(user_info, "root_flush_size");
+  fColumnarOutputFlag =
+      DictGetStr(user_info, "root_output_backend") == "columnar";
+  GateDigiCollectionsRootManager::GetInstance()->SetNtupleMergingFlag(
+      !DictGetBool(user_info, "root_output_per_thread"));
 }
 
 void GateVDigitizerWithOutputActor::StartSimulationAction() {
@@ -61,7 +69,9 @@ void GateVDigitizerWithOutputActor::StartSimulationAction() {
   } else {
     outputPath = GetOutputPath(fOutputNameRoot);
   }
+  fOutputDigiCollection->SetColumnarOutputFlag(fColumnarOutputFlag);
   fOutputDigiCollection->SetFilenameAndInitRoot(outputPath);
+  fOutputDigiCollection->SetRootFlushSize(fRootFlushSize);
   fOutputDigiCollection->InitDigiAttributesFromCopy(
       fInputDigiCollection, fUserSkipDigiAttributeNames);
 
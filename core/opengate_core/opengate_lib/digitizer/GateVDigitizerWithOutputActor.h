@@ -60,6 +60,8 @@ protected:
   GateDigiCollection *fInputDigiCollection;
   std::vector<std::string> fUserSkipDigiAttributeNames;
   int fClearEveryNEvents;
+  int fRootFlushSize;
+  bool fColumnarOutputFlag;
 
   bool fInitializeRootTupleForMasterFlag;
 
@@ -47,10 +47,15 @@ void init_GateDoseActor(py::module &m) {
       .def("SetToWaterFlag", &GateDoseActor::SetToWaterFlag)
       .def("GetCountsFlag", &GateDoseActor::GetCountsFlag)
       .def("SetCountsFlag", &GateDoseActor::SetCountsFlag)
+      .def("GetThreadLocalScoringFlag",
+           &GateDoseActor::GetThreadLocalScoringFlag)
+      .def("SetThreadLocalScoringFlag",
+           &GateDoseActor::SetThreadLocalScoringFlag)
       .def("SetUncertaintyGoal", &GateDoseActor::SetUncertaintyGoal)
       .def("SetThreshEdepPerc", &GateDoseActor::SetThreshEdepPerc)
       .def("SetOvershoot", &GateDoseActor::SetOvershoot)
       .def("SetNbEventsFirstCheck", &GateDoseActor::SetNbEventsFirstCheck)
+      .def("SetCheckIntervalSeconds", &GateDoseActor::SetCheckIntervalSeconds)
       .def("GetPhysicalVolumeName", &GateDoseActor::GetPhysicalVolumeName)
       .def("SetPhysicalVolumeName", &GateDoseActor::SetPhysicalVolumeName)
       .def_readwrite("NbOfEvent", &GateDoseActor::NbOfEvent)
@@ -12,24 +12,26 @@
 namespace py = pybind11;
 
 #include "GateGANSource.h"
+#include "GateHelpersPyBind.h"
 
 void init_GateGANSource(py::module &m) {
 
-  py::class_<GateGANSource, GateGenericSource>(m, "GateGANSource")
-      .def(py::init())
+  auto c = py::class_<GateGANSource, GateGenericSource>(m, "GateGANSource");
+  c.def(py::init())
       .def("InitializeUserInfo", &GateGANSource::InitializeUserInfo)
       .def("SetGeneratorFunction", &GateGANSource::SetGeneratorFunction)
-      .def("SetGeneratorInfo", &GateGANSource::SetGeneratorInfo)
+      .def("SetGeneratorInfo", &GateGANSource::SetGeneratorInfo);
 
-      .def_readwrite("fPositionX", &GateGANSource::fPositionX)
-      .def_readwrite("fPositionY", &GateGANSource::fPositionY)
-      .def_readwrite("fPositionZ", &GateGANSource::fPositionZ)
+  // arrays of the generated particles
+  PyBindDefVectorProperty(c, "fPositionX", &GateGANSource::fPositionX);
+  PyBindDefVectorProperty(c, "fPositionY", &GateGANSource::fPositionY);
+  PyBindDefVectorProperty(c, "fPositionZ", &GateGANSource::fPositionZ);
 
-      .def_readwrite("fDirectionX", &GateGANSource::fDirectionX)
-      .def_readwrite("fDirectionY", &GateGANSource::fDirectionY)
-      .def_readwrite("fDirectionZ", &GateGANSource::fDirectionZ)
+  PyBindDefVectorProperty(c, "fDirectionX", &GateGANSource::fDirectionX);
+  PyBindDefVectorProperty(c, "fDirectionY", &GateGANSource::fDirectionY);
+  PyBindDefVectorProperty(c, "fDirectionZ", &GateGANSource::fDirectionZ);
 
-      .def_readwrite("fEnergy", &GateGANSource::fEnergy)
-      .def_readwrite("fWeight", &GateGANSource::fWeight)
-      .def_readwrite("fTime", &GateGANSource::fTime);
+  PyBindDefVectorProperty(c, "fEnergy", &GateGANSource::fEnergy);
+  PyBindDefVectorProperty(c, "fWeight", &GateGANSource::fWeight);
+  PyBindDefVectorProperty(c, "fTime", &GateGANSource::fTime);
 }
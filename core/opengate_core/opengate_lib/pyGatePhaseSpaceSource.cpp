@@ -29,5 +29,7 @@ void init_GatePhaseSpaceSource(py::module &m) {
 
       .def("SetDirectionXBatch", &GatePhaseSpaceSource::SetDirectionXBatch)
       .def("SetDirectionYBatch", &GatePhaseSpaceSource::SetDirectionYBatch)
-      .def("SetDirectionZBatch", &GatePhaseSpaceSource::SetDirectionZBatch);
+      .def("SetDirectionZBatch", &GatePhaseSpaceSource::SetDirectionZBatch)
+
+      .def("SetBatch", &GatePhaseSpaceSource::SetBatch);
 }
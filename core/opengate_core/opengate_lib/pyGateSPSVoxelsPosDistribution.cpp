@@ -20,6 +20,7 @@ void init_GateSPSVoxelsPosDistribution(py::module &m) {
       .def(py::init())
       .def("SetCumulativeDistributionFunction",
            &GateSPSVoxelsPosDistribution::SetCumulativeDistributionFunction)
+      .def("SetAliasTable", &GateSPSVoxelsPosDistribution::SetAliasTable)
       .def("VGenerateOne", &GateSPSVoxelsPosDistribution::VGenerateOne)
       .def("VGenerateOneDebug",
            &GateSPSVoxelsPosDistribution::VGenerateOneDebug)
@@ -56,5 +56,6 @@ void init_GateVFilter(py::module &m) {
 
   py::class_<GateVFilter, PyGateVFilter>(m, "GateVFilter")
       .def(py::init())
-      .def("InitializeUserInfo", &GateVFilter::InitializeUserInfo);
+      .def("InitializeUserInfo", &GateVFilter::InitializeUserInfo)
+      .def_readwrite("fName", &GateVFilter::fName);
 }
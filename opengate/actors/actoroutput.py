@@ -3,6 +3,7 @@ import inspect
 from box import Box
 from typing import Optional
 import sys
+from pathlib import Path
 
 import opengate_core as g4
 from ..base import GateObject, process_cls
@@ -460,6 +461,15 @@ class ActorOutputBase(GateObject):
             f"but it should be implemented in the specific derived class"
         )
 
+    def merge_output_from_subprocesses(self, outputs):
+        """Merge the outputs of the same actor obtained in several subprocesses
+        (see Simulation.run) into this output, and write them if requested.
+        Derived classes implement this if their data can be merged.
+        """
+        raise NotImplementedError(
+            f"Merging subprocess outputs is not implemented in {type(self).__name__}."
+        )
+
 
 class ActorOutputUsingDataItemContainer(ActorOutputBase):
     # hints for IDE
@@ -783,6 +793,30 @@ class ActorOutputUsingDataItemContainer(ActorOutputBase):
     def merge_data_from_runs(self):
         self.merged_data = merge_data(list(self.data_per_run.values()))
 
+    def _merge_data_containers(self, containers):
+        containers = [c for c in containers if c is not None]
+        if len(containers) == 0:
+            return None
+        data_container = merge_data(containers)
+        data_container.belongs_to = self
+        return data_container
+
+    def merge_output_from_subprocesses(self, outputs):
+        run_indices = sorted(set(ri for o in outputs for ri in o.get_run_indices()))
+        for ri in run_indices:
+            self.data_per_run[ri] = self._merge_data_containers(
+                [o.data_per_run.get(ri) for o in outputs]
+            )
+        self.merged_data = self._merge_data_containers([o.merged_data for o in outputs])
+        if self.merged_data is None and len(self.data_per_run) == 0:
+            self.warn_user(
+                f"No data in memory to merge for the output {self.name} "
+                f"of actor {self.belongs_to}. With keep_data_in_memory=False, "
+                f"the data of each subprocess are only in its own output folder."
+            )
+            return
+        self.write_data_if_requested()
+
     def end_of_run(self, run_index):
         if self.merge_data_after_simulation is True:
             self.merged_data.inplace_merge_with(self.data_per_run[run_index])
@@ -955,6 +989,19 @@ class ActorOutputRoot(ActorOutputBase):
                 self.name, self.get_output_path_as_string()
             )
 
+    def merge_output_from_subprocesses(self, outputs):
+        # concatenate the trees written by each subprocess (in its own folder).
+        # The EventID of each process are shifted to stay unique, the RunID
+        # is the index of the run, the same in all processes.
+        from .digitizers import merge_root_files
+
+        if self.output_filename == "" or self.output_filename is None:
+            return
+        paths = [o.get_output_path() for o in outputs if o.write_to_disk]
+        paths = [p for p in paths if p is not None and Path(p).exists()]
+        if len(paths) > 0:
+            merge_root_files(self.get_output_path(), paths, offset_event_id=True)
+
 
 process_cls(ActorOutputBase)
 process_cls(ActorOutputUsingDataItemContainer)
@@ -2,6 +2,7 @@ from box import Box
 import numpy as np
 import itk
 import threading
+import queue
 
 import opengate_core as g4
 from ..utility import g4_units, LazyModuleLoader
@@ -9,6 +10,7 @@ from ..exception import fatal
 from .base import ActorBase
 from .digitizers import (
     DigitizerEnergyWindowsActor,
+    merge_root_files_per_thread,
 )
 from .actoroutput import ActorOutputSingleImage, ActorOutputRoot
 from ..base import process_cls
@@ -74,6 +76,22 @@ class ARFTrainingDatasetActor(ActorBase, g4.GateARFTrainingDatasetActor):
             },
         ),
         "russian_roulette": (1, {"doc": "Russian roulette factor. "}),
+        # duplicated because cpp part inherit from HitsCollectionActor
+        "root_flush_size": (
+            0,
+            {
+                "doc": "Number of hits kept in memory before they are written to the root file. "
+                "The hits are also written every 'clear_every' events, whatever their number.",
+            },
+        ),
+        # duplicated because cpp part inherit from HitsCollectionActor
+        "root_output_per_thread": (
+            False,
+            {
+                "doc": "Each thread writes its own root file, merged at the end of the simulation "
+                "(see DigitizerWithRootOutput).",
+            },
+        ),
     }
 
     user_output_config = {
@@ -139,6 +157,10 @@ class ARFTrainingDatasetActor(ActorBase, g4.GateARFTrainingDatasetActor):
         g4.GateARFTrainingDatasetActor.EndSimulationAction(self)
         ActorBase.EndSimulationAction(self)
 
+    def post_simulation_action(self):
+        if self.root_output_per_thread and self.simulation.multithreaded:
+            merge_root_files_per_thread(self.get_output_path("root_output"))
+
 
 def _setter_hook_image_spacing(self, image_spacing):
     # force float
@@ -152,6 +174,11 @@ class ARFActor(ActorBase, g4.GateARFActor):
     It runs the neural network model to provide the probability of detection in all energy windows.
 
     Output is an ITK image that can be retrieved with self.output_image
+
+    By default, the thread that fills a batch runs the neural network, and the other threads wait
+    for it. With the option 'inference_thread', the batches of all threads are put in a queue and
+    the network is applied by a dedicated thread on merged batches, so the tracking never waits
+    for the network.
     """
 
     user_info_defaults = {
@@ -211,6 +238,20 @@ class ARFActor(ActorBase, g4.GateARFActor):
             "auto",
             {"doc": "FIXME", "allowed_values": ("cpu", "gpu", "auto")},
         ),
+        "inference_thread": (
+            False,
+            {
+                "doc": "If True, the batches of projected points of all threads are queued and the "
+                "neural network is applied in a dedicated thread, on merged batches.",
+            },
+        ),
+        "inference_batch_size": (
+            1e6,
+            {
+                "doc": "With inference_thread, maximum number of points merged before "
+                "applying the neural network.",
+            },
+        ),
     }
 
     user_output_config = {
@@ -232,6 +273,13 @@ class ARFActor(ActorBase, g4.GateARFActor):
         self.detected_particles = 0
         # need a lock when the ARF is applied
         self.lock = None
+        # queue of the points and thread that applies the ARF (inference_thread)
+        self.inference_queue = None
+        self.inference_worker = None
+        self.inference_error = None
+        # number of times the network is applied (less than batch_nb when
+        # the inference thread merges the batches)
+        self.inference_nb = 0
         # local variables
         self.image_plane_spacing = None
         self.image_plane_size_pixel = None
@@ -262,8 +310,17 @@ class ARFActor(ActorBase, g4.GateARFActor):
         return_dict["nn"] = None
         return_dict["lock"] = None
         return_dict["model"] = None
+        return_dict["inference_queue"] = None
+        return_dict["inference_worker"] = None
         return return_dict
 
+    def recover_user_output(self, actor):
+        super().recover_user_output(actor)
+        # also recover the batch counters when the simulation ran in a subprocess
+        self.batch_nb = actor.batch_nb
+        self.inference_nb = actor.inference_nb
+        self.detected_particles = actor.detected_particles
+
     def initialize(self):
         # call the initialize() method from the super class (python-side)
         ActorBase.initialize(self)
@@ -278,6 +335,10 @@ class ARFActor(ActorBase, g4.GateARFActor):
 
         self.output_array = np.zeros(self.output_size, dtype=np.float64)
 
+        # start the thread that applies the ARF
+        if self.inference_thread:
+            self.start_inference_thread()
+
         # initialize C++ side
         self.InitializeUserInfo(self.user_info)
         self.InitializeCpp()
@@ -337,6 +398,13 @@ class ARFActor(ActorBase, g4.GateARFActor):
         self.output_image = np.zeros(self.output_size, dtype=np.float64)
 
     def apply(self, actor):
+        # with the inference thread, the points are only queued
+        if self.inference_thread:
+            px = self.get_projected_points(actor)
+            if px is not None:
+                self.inference_queue.put((actor.GetCurrentRunId(), px))
+            return
+
         # we need a lock when the ARF is applied
         if self.simulation.use_multithread:
             with self.lock:
@@ -345,7 +413,11 @@ class ARFActor(ActorBase, g4.GateARFActor):
             self.arf_build_image_from_projected_points(actor)
 
     def arf_build_image_from_projected_points(self, actor):
+        px = self.get_projected_points(actor)
+        if px is not None:
+            self.add_points_to_image(px, actor.GetCurrentRunId())
 
+    def get_projected_points(self, actor):
         # get values from cpp side
         energy = np.array(actor.GetEnergy())
         pos_x = np.array(actor.GetPositionX())
@@ -356,28 +428,29 @@ class ARFActor(ActorBase, g4.GateARFActor):
 
         # do nothing if no hits
         if energy.size == 0:
-            return
+            return None
 
         # convert direction in angles
         degree = g4_units.degree
         theta = np.arccos(dir_y) / degree
         phi = np.arccos(dir_x) / degree
 
-        # update
-        self.batch_nb += 1
-        self.detected_particles += energy.shape[0]
-
         # build the data
         if len(weights) == 0:
-            px = np.column_stack((pos_x, pos_y, theta, phi, energy))
-        else:
-            px = np.column_stack((pos_x, pos_y, theta, phi, energy, weights))
+            return np.column_stack((pos_x, pos_y, theta, phi, energy))
+        return np.column_stack((pos_x, pos_y, theta, phi, energy, weights))
+
+    def add_points_to_image(self, px, run_id, nb_batches=1):
+        # update
+        self.batch_nb += nb_batches
+        self.inference_nb += 1
+        self.detected_particles += px.shape[0]
         self.debug_nb_hits_before += len(px)
 
         # verbose current batch
         if self.verbose_batch:
             print(
-                f"Apply ARF to {energy.shape[0]} hits (device = {self.model_data['current_gpu_mode']})"
+                f"Apply ARF to {px.shape[0]} hits (device = {self.model_data['current_gpu_mode']})"
             )
 
         # from projected points to image counts
@@ -393,7 +466,6 @@ class ARFActor(ActorBase, g4.GateARFActor):
 
         # do nothing if there is no hit in the image
         if u.shape[0] != 0:
-            run_id = actor.GetCurrentRunId()
             s = self.nb_ene * run_id
             img = self.output_array[s : s + self.nb_ene]
             garf.image_from_coordinates_add_numpy(
@@ -401,9 +473,80 @@ class ARFActor(ActorBase, g4.GateARFActor):
             )
             self.debug_nb_hits += u.shape[0]
 
+    def start_inference_thread(self):
+        self.inference_batch_size = int(float(self.inference_batch_size))
+        # the threads wait if too many batches are queued (limit the memory)
+        self.inference_queue = queue.Queue(
+            maxsize=2 * max(1, self.simulation.number_of_threads)
+        )
+        self.inference_error = None
+        self.inference_worker = threading.Thread(
+            target=self.inference_loop, name=f"{self.name}_inference", daemon=True
+        )
+        self.inference_worker.start()
+
+    def inference_loop(self):
+        """
+        Run by the inference thread: merge the points queued by all threads
+        (for the same run) and apply the ARF on the merged batch.
+        The output_array is only modified by this thread.
+        """
+        pending = None
+        while True:
+            item = pending if pending is not None else self.inference_queue.get()
+            pending = None
+            # None is the signal to stop
+            if item is None:
+                self.inference_queue.task_done()
+                return
+            run_id, px = item
+            points = [px]
+            n = len(px)
+            while n < self.inference_batch_size:
+                try:
+                    item = self.inference_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None or item[0] != run_id:
+                    pending = item
+                    break
+                points.append(item[1])
+                n += len(item[1])
+            try:
+                if self.inference_error is None:
+                    self.add_points_to_image(
+                        np.concatenate(points), run_id, len(points)
+                    )
+            except Exception as e:
+                # the error is raised in the main thread
+                self.inference_error = e
+            finally:
+                for _ in points:
+                    self.inference_queue.task_done()
+
+    def wait_inference_thread(self):
+        # wait until all the queued points are in the output array
+        self.inference_queue.join()
+        if self.inference_error is not None:
+            fatal(
+                f"Error in the inference thread of the actor '{self.name}': "
+                f"{self.inference_error}"
+            )
+
+    def stop_inference_thread(self):
+        if self.inference_worker is None:
+            return
+        self.inference_queue.put(None)
+        self.inference_worker.join()
+        self.inference_worker = None
+
     def EndOfRunActionMasterThread(self, run_index):
         nb_slice = self.nb_ene
 
+        # all the points of this run must have been processed
+        if self.inference_thread:
+            self.wait_inference_thread()
+
         # convert to itk image
         # FIXME: this should probably go into EndOfRunAction
         output_image = itk.image_from_array(self.output_array)
@@ -434,6 +577,7 @@ class ARFActor(ActorBase, g4.GateARFActor):
     def EndSimulationAction(self):
         g4.GateARFActor.EndSimulationAction(self)
         ActorBase.EndSimulationAction(self)
+        self.stop_inference_thread()
         # process the remaining elements in the batch
         # self.apply()
         # warning('SHOULD call apply here ???')
@@ -464,6 +464,8 @@ class ActorBase(GateObject):
             v.initialize()
 
         # initialize filters
+        for f in self.filters:
+            f.fName = f.name
         try:
             self.fFilters = self.filters
         except AttributeError:
@@ -596,5 +598,10 @@ class ActorBase(GateObject):
         """Default virtual method for inheritance"""
         pass
 
+    def post_simulation_action(self):
+        """Called after the EndSimulationAction of all actors (master thread only).
+        Default virtual method for inheritance"""
+        pass
+
 
 process_cls(ActorBase)
@@ -1,7 +1,15 @@
 import awkward as ak
-from tqdm import tqdm
+import numpy as np
+import uproot
 from ..exception import fatal
 
+coincidences_policies = (
+    "keepAll",
+    "takeAllGoods",
+    "removeMultiples",
+    "takeWinnerOfGoods",
+)
+
 
 def coincidences_sorter(
     singles_tree, time_window, minSecDiff, policy, chunk_size=10000
@@ -13,98 +21,163 @@ def coincidences_sorter(
     :param chunk_size: events are managed by this chunk size
     :return: the coincidences as a dict of events
 
-    Chunk size is important for very large root file to avoid loading everything in memory
+    Chunk size is important for very large root file to avoid loading everything in memory.
+    For very large files, prefer coincidences_sorter_to_root that writes the coincidences
+    chunk by chunk instead of keeping them all in memory.
 
     DEV NOTES:
-    1) potential bug while having several chunks: couple of coincidences too much
-    2) filtering during sorting or after? so far done after but maybe better do during for execution speed
-    3) removeMultiples policy is applied on EventID maybe should be done differently: checking while time window is open
+    1) minSecDiff is not used yet
+    2) removeMultiples and takeWinnerOfGoods are applied on EventID, maybe should be done
+       differently: checking while time window is open
+    """
+    keys = singles_tree.keys()
+    chunks = list(
+        coincidences_sorter_iterate(singles_tree, time_window, policy, chunk_size)
+    )
+    if len(chunks) == 0:
+        return {f"{k}{n}": np.array([]) for k in keys for n in (1, 2)}
+    return {k: ak.concatenate([c[k] for c in chunks]) for k in chunks[0].keys()}
+
+
+def coincidences_sorter_to_root(
+    singles_tree,
+    output_filename,
+    time_window,
+    policy,
+    chunk_size=10000,
+    tree_name="Coincidences",
+):
+    """
+    Same as coincidences_sorter, but the coincidences of each chunk are written
+    to the output root file as soon as they are found.
+    :return: the number of coincidences
+    """
+    n = 0
+    with uproot.recreate(output_filename) as output_file:
+        for coincidences in coincidences_sorter_iterate(
+            singles_tree, time_window, policy, chunk_size
+        ):
+            if tree_name in output_file:
+                output_file[tree_name].extend(coincidences)
+            else:
+                output_file[tree_name] = coincidences
+            n += len(coincidences["EventID1"])
+    return n
 
 
+def coincidences_sorter_iterate(singles_tree, time_window, policy, chunk_size=10000):
     """
-    # prepare the "coincidences" tree (dict)
-    # with the same branches as the singles
-    coincidences = {}
-    for k in singles_tree.keys():
-        coincidences[f"{k}1"] = []
-        coincidences[f"{k}2"] = []
-
-    # Iterate over chunks of the ROOT file
-    previous_chunk_tail = None
+    Generator that yields the coincidences (dict of arrays) chunk by chunk.
+
+    Every single opens a time window, and is paired with all the following
+    singles in the window, until a single in the same volume is found.
+    The singles are sorted by GlobalTime in each chunk; the chunks themselves are
+    expected to be (roughly) in time order, as the singles written by Gate.
+    The singles whose window is still open at the end of a chunk are carried to
+    the next one, so no pair is lost or counted twice across chunks.
+    """
+    if policy not in coincidences_policies:
+        fatal(
+            f"Error in Coincidence Sorter {policy} is unknown. "
+            f"Available policies are: {coincidences_policies}"
+        )
+    group_policy = policy in ("removeMultiples", "takeWinnerOfGoods")
+    if group_policy and "EventID" not in singles_tree.keys():
+        fatal(f"Error in Coincidence Sorter, the policy {policy} needs EventID")
 
+    keys = singles_tree.keys()
+    tail = None
+    pending = None
     for chunk in singles_tree.iterate(step_size=chunk_size):
+        if len(chunk) == 0:
+            continue
         # Combine the tail of the previous chunk with the current chunk
-        if previous_chunk_tail is not None:
-            chunk = ak.concatenate([previous_chunk_tail, chunk], axis=0)
+        if tail is not None:
+            chunk = ak.concatenate([tail, chunk], axis=0)
+        chunk = chunk[np.argsort(ak.to_numpy(chunk["GlobalTime"]), kind="stable")]
+
+        # Only the singles whose window is closed in this chunk open a window now
+        times = ak.to_numpy(chunk["GlobalTime"])
+        n_open = np.searchsorted(times, times[-1] - time_window, side="left")
+        coincidences = process_chunk(keys, chunk, time_window, n_open)
+        tail = chunk[n_open:]
+
+        # the pairs of the events that may still receive pairs are kept for later
+        if group_policy:
+            if pending is not None:
+                coincidences = concatenate_coincidences(pending, coincidences)
+            later = np.isin(
+                ak.to_numpy(coincidences["EventID1"]), ak.to_numpy(tail["EventID"])
+            )
+            pending = {k: v[later] for k, v in coincidences.items()}
+            coincidences = {k: v[~later] for k, v in coincidences.items()}
+
+        yield apply_policy(coincidences, policy)
+
+    # last chunk: all remaining singles open a window
+    if tail is not None:
+        coincidences = process_chunk(keys, tail, time_window, len(tail))
+        if pending is not None:
+            coincidences = concatenate_coincidences(pending, coincidences)
+        yield apply_policy(coincidences, policy)
+
+
+def find_coincidence_pairs(times, volume_ids, time_window, n_open):
+    """
+    Return the indices (i, j) of all pairs of singles (i<j) such that the
+    single j is in the window opened by the single i (times must be sorted).
+    A single in the same volume as the single i closes the window of i.
+    Only the n_open first singles open a window.
+    """
+    i = np.arange(n_open)
+    end = np.searchsorted(times, times[:n_open] + time_window, side="right")
+    counts = end - i - 1
+    starts = np.cumsum(counts) - counts
+    ii = np.repeat(i, counts)
+    jj = ii + 1 + np.arange(counts.sum()) - np.repeat(starts, counts)
+
+    # remove the pair in the same volume and all the following ones in the window
+    same = np.cumsum(volume_ids[ii] == volume_ids[jj])
+    same_before = np.concatenate(([0], same))[starts]
+    keep = (same - np.repeat(same_before, counts)) == 0
+    return ii[keep], jj[keep]
+
+
+def process_chunk(keys, chunk, time_window, n_open):
+    times = ak.to_numpy(chunk["GlobalTime"])
+    # integer labels of the volumes, to compare them without strings
+    _, volume_ids = np.unique(
+        ak.to_numpy(chunk["PreStepUniqueVolumeID"]), return_inverse=True
+    )
+    ii, jj = find_coincidence_pairs(times, volume_ids, time_window, n_open)
+
+    # TODO: apply minRingDiff
 
-        # Process the current combined chunk
-        current_chunk_tail = process_chunk(
-            singles_tree.keys(), chunk, coincidences, time_window, policy
-        )
+    coincidences = {}
+    for k in keys:
+        coincidences[f"{k}1"] = chunk[k][ii]
+        coincidences[f"{k}2"] = chunk[k][jj]
+    return coincidences
 
-        # Store the tail of the current chunk for the next iteration
-        previous_chunk_tail = current_chunk_tail
 
-    # prepare coincidences_filtered
-    coincidences_filtered = {}
-    for k in coincidences.keys():
-        coincidences_filtered[f"{k}"] = []
+def concatenate_coincidences(coincidences1, coincidences2):
+    return {
+        k: ak.concatenate([coincidences1[k], coincidences2[k]])
+        for k in coincidences1.keys()
+    }
 
-    if policy == "removeMultiples":
-        ids_to_keep = remove_multiples(coincidences)
-    # TODO add other filters
 
-    elif policy == "keepAll":
+def apply_policy(coincidences, policy):
+    if policy == "keepAll" or policy == "takeAllGoods":
+        # pairs in the same volume are never formed, so all pairs are goods
         return coincidences
+    if policy == "removeMultiples":
+        ids_to_keep = remove_multiples(coincidences)
+    elif policy == "takeWinnerOfGoods":
+        ids_to_keep = take_winner_of_goods(coincidences)
     else:
-        fatal(f"Error in Coincidence Sorter" f" {policy} is unknown")
-
-    print("-----Filtering------")
-    for i in tqdm(range(len(coincidences["EventID1"]))):
-        for j in ids_to_keep:
-            if coincidences["EventID1"][i] == j:
-                for k in coincidences.keys():
-                    coincidences_filtered[f"{k}"].append(coincidences[f"{k}"][i])
-
-    return coincidences_filtered
-
-
-def process_chunk(keys, chunk, coincidences, time_window, policy):
-    singles = chunk
-    coinc_events = []
-    nsingles = len(singles)
-
-    print("-----Sorting------")
-    for i in tqdm(range(nsingles - 1)):
-        time_window_open = singles[i]["GlobalTime"]
-        for j in range(i + 1, nsingles):
-
-            time = singles[j]["GlobalTime"]
-            coinc_events = []
-
-            if abs(time - time_window_open) <= time_window:
-
-                # remove if in the same volume
-                if (
-                    singles[i]["PreStepUniqueVolumeID"]
-                    == singles[j]["PreStepUniqueVolumeID"]
-                ):
-                    break
-
-                # TODO: apply minRingDiff
-                # if distance<defined_distance:
-                #    break
-
-                coinc_events.append(singles[i])
-                coinc_events.append(singles[j])
-                for k in keys:
-                    coincidences[f"{k}1"].append(coinc_events[0][k])
-                    coincidences[f"{k}2"].append(coinc_events[1][k])
-
-            else:
-                break  # if the time difference exceeds the time window, break the inner loop
-
-    return coinc_events
+        fatal(f"Error in Coincidence Sorter {policy} is unknown")
+    return {k: v[ids_to_keep] for k, v in coincidences.items()}
 
 
 def copy_tree_for_dump(input_tree):
@@ -115,7 +188,23 @@ def copy_tree_for_dump(input_tree):
 
 
 def remove_multiples(coincidences):
-    # return EventID1 to keep
-    ids = coincidences["EventID1"]
-    ids = [i for i in ids if ids.count(i) == 1]
-    return ids
+    # return a mask of the coincidences whose EventID1 is unique
+    ids = ak.to_numpy(coincidences["EventID1"])
+    _, inverse, counts = np.unique(ids, return_inverse=True, return_counts=True)
+    return counts[inverse] == 1
+
+
+def take_winner_of_goods(coincidences):
+    # return the indices of the pair with the highest energy for each EventID1
+    if "TotalEnergyDeposit1" not in coincidences:
+        fatal(
+            "Error in Coincidence Sorter, the policy takeWinnerOfGoods needs TotalEnergyDeposit"
+        )
+    ids = ak.to_numpy(coincidences["EventID1"])
+    energy = ak.to_numpy(coincidences["TotalEnergyDeposit1"]) + ak.to_numpy(
+        coincidences["TotalEnergyDeposit2"]
+    )
+    order = np.lexsort((-energy, ids))
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = ids[order][1:] != ids[order][:-1]
+    return np.sort(order[first])
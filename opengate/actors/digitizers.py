@@ -1,6 +1,14 @@
 from typing import List
-
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import os
+import re
+import shutil
+
+import awkward as ak
 import numpy as np
+import uproot
 from scipy.spatial.transform import Rotation
 
 import opengate_core as g4
@@ -137,6 +145,218 @@ def get_simplified_digitizer_channels_rad(spect_name, rad, scatter_flag):
     return available_rad[rad](spect_name, scatter_flag)
 
 
+def get_root_files_per_thread(filename):
+    """
+    Return the list of root files written by the worker threads for the given
+    output filename (Geant4 inserts '_t<thread id>' before the extension),
+    sorted by thread id.
+    """
+    filename = Path(filename)
+    pattern = re.compile(
+        re.escape(filename.stem) + r"_t(\d+)" + re.escape(filename.suffix)
+    )
+    files = []
+    for f in filename.parent.glob(f"{filename.stem}_t*{filename.suffix}"):
+        m = pattern.fullmatch(f.name)
+        if m:
+            files.append((int(m.group(1)), f))
+    return [f for _, f in sorted(files)]
+
+
+def merge_root_files(
+    output_filename,
+    input_filenames,
+    chunk_size=100000,
+    number_of_workers=4,
+    offset_event_id=False,
+):
+    """
+    Merge the trees of several root files (e.g. one per thread) into one file.
+    The trees are read chunk by chunk (several chunks are read in parallel)
+    and written in the order of the input files, so the memory is bounded
+    by the chunk size, whatever the size of the files.
+    If offset_event_id is True (files written by independent processes, where
+    the event ids all start at zero), the EventID of each file is shifted by
+    the largest EventID of the previous files + 1, so that they stay unique.
+    :return: a dict with the number of entries of each merged tree
+    """
+    input_filenames = [Path(f) for f in input_filenames]
+
+    # list of the tree names, in the order of the first file where they appear
+    tree_names = []
+    for f in input_filenames:
+        with uproot.open(f) as root_file:
+            for name in root_file.keys(filter_classname="TTree", cycle=False):
+                if name not in tree_names:
+                    tree_names.append(name)
+
+    # EventID offset of each file
+    event_id_offsets = {f: 0 for f in input_filenames}
+    if offset_event_id:
+        offset = 0
+        for f in input_filenames:
+            event_id_offsets[f] = offset
+            last_event_id = -1
+            with uproot.open(f) as root_file:
+                for name in tree_names:
+                    if name not in root_file or "EventID" not in root_file[name]:
+                        continue
+                    ids = root_file[name]["EventID"].array(library="np")
+                    if len(ids) > 0:
+                        last_event_id = max(last_event_id, int(ids.max()))
+            offset += last_event_id + 1
+
+    def read_chunk(filename, tree_name, start, stop):
+        with uproot.open(filename) as root_file:
+            return root_file[tree_name].arrays(
+                entry_start=start, entry_stop=stop, library="ak"
+            )
+
+    # all the chunks to read, in the final order
+    tasks = []
+    for tree_name in tree_names:
+        for f in input_filenames:
+            with uproot.open(f) as root_file:
+                if tree_name not in root_file:
+                    continue
+                n = root_file[tree_name].num_entries
+            for start in range(0, n, int(chunk_size)):
+                tasks.append((f, tree_name, start, min(start + int(chunk_size), n)))
+
+    entries = {name: 0 for name in tree_names}
+    with uproot.recreate(output_filename) as output_file:
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            # only a few chunks are read in advance
+            futures = deque()
+            tasks = iter(tasks)
+            for task in tasks:
+                futures.append((task, executor.submit(read_chunk, *task)))
+                if len(futures) >= 2 * number_of_workers:
+                    break
+            while futures:
+                (filename, tree_name, _, _), future = futures.popleft()
+                chunk = future.result()
+                task = next(tasks, None)
+                if task is not None:
+                    futures.append((task, executor.submit(read_chunk, *task)))
+                if tree_name not in output_file:
+                    create_root_tree(output_file, tree_name, chunk)
+                arrays = {k: chunk[k] for k in chunk.fields}
+                if event_id_offsets[filename] > 0 and "EventID" in arrays:
+                    arrays["EventID"] = arrays["EventID"] + event_id_offsets[filename]
+                output_file[tree_name].extend(arrays)
+                entries[tree_name] += len(chunk)
+        # trees without any entry are kept (empty)
+        for tree_name in tree_names:
+            if tree_name not in output_file:
+                for f in input_filenames:
+                    with uproot.open(f) as root_file:
+                        if tree_name in root_file:
+                            arrays = root_file[tree_name].arrays(
+                                entry_start=0, entry_stop=0, library="ak"
+                            )
+                            create_root_tree(output_file, tree_name, arrays)
+                            break
+    return entries
+
+
+def create_root_tree(output_file, tree_name, arrays):
+    # explicit TTree (same branch types as the input arrays)
+    types = {k: arrays[k].type.content for k in arrays.fields}
+    output_file.mktree(tree_name, types)
+
+
+def merge_root_files_per_thread(
+    filename, chunk_size=100000, number_of_workers=4, remove_thread_files=True
+):
+    """
+    Merge the root files written by each thread (see get_root_files_per_thread)
+    into the given filename. Nothing is done if there is no thread file.
+    """
+    thread_files = get_root_files_per_thread(filename)
+    if len(thread_files) == 0:
+        return None
+    entries = merge_root_files(filename, thread_files, chunk_size, number_of_workers)
+    if remove_thread_files:
+        for f in thread_files:
+            os.remove(f)
+    return entries
+
+
+def get_root_columns_folder(filename):
+    """
+    Return the folder of the binary column files written by the digitizers
+    with the 'columnar' root output backend, for the given output filename
+    (same name, with the '.columns' extension). It contains one folder per
+    digi collection (with the list of columns in 'columns.txt'), with one
+    folder per thread ('t<thread id>'), with one file per column.
+    """
+    return Path(filename).with_suffix(".columns")
+
+
+def convert_root_columns(filename, chunk_size=100000, remove_column_files=True):
+    """
+    Convert the binary column files (see get_root_columns_folder) into the
+    trees of the given root filename. Each column is read and written chunk by
+    chunk, in the order of the threads, so the memory is bounded by the chunk
+    size (except for the string columns that are read at once for each thread).
+    Nothing is done if there is no column folder.
+    :return: a dict with the number of entries of each tree
+    """
+    folder = get_root_columns_folder(filename)
+    if not folder.is_dir():
+        return None
+    dtypes = {"D": np.dtype(np.float64), "I": np.dtype(np.int32)}
+    entries = {}
+    with uproot.recreate(filename) as output_file:
+        for tree_folder in sorted(p for p in folder.iterdir() if p.is_dir()):
+            tree_name = tree_folder.name
+            with open(tree_folder / "columns.txt") as f:
+                columns = [line.split() for line in f if line.strip()]
+            output_file.mktree(
+                tree_name, {name: dtypes.get(t, "string") for name, t in columns}
+            )
+            entries[tree_name] = 0
+            thread_folders = sorted(
+                (p for p in tree_folder.iterdir() if p.is_dir()),
+                key=lambda p: int(p.name[1:]),
+            )
+            for thread_folder in thread_folders:
+                strings = {}
+                n = 0
+                for name, t in columns:
+                    column_file = thread_folder / f"{name}.bin"
+                    if t == "S":
+                        # null separated strings
+                        strings[name] = column_file.read_bytes().split(b"\0")[:-1]
+                        n = len(strings[name])
+                    else:
+                        n = column_file.stat().st_size // dtypes[t].itemsize
+                for start in range(0, n, int(chunk_size)):
+                    count = min(int(chunk_size), n - start)
+                    arrays = {}
+                    for name, t in columns:
+                        if t == "S":
+                            arrays[name] = ak.Array(
+                                [
+                                    v.decode()
+                                    for v in strings[name][start : start + count]
+                                ]
+                            )
+                        else:
+                            arrays[name] = np.fromfile(
+                                thread_folder / f"{name}.bin",
+                                dtype=dtypes[t],
+                                count=count,
+                                offset=start * dtypes[t].itemsize,
+                            )
+                    output_file[tree_name].extend(arrays)
+                entries[tree_name] += n
+    if remove_column_files:
+        shutil.rmtree(folder)
+    return entries
+
+
 class Digitizer:
     """
     Simple helper class to reduce the code size when creating a digitizer.
@@ -245,6 +465,7 @@ class DigitizerBase(ActorBase):
 
     def initialize(self):
         ActorBase.initialize(self)
+        self._check_root_output_per_thread()
         if self.authorize_repeated_volumes is True:
             return
         att = self.attached_to
@@ -262,15 +483,95 @@ class DigitizerBase(ActorBase):
                     )
                 current = current.parent
 
+    def _check_root_output_per_thread(self):
+        """Nothing to do in the base class."""
+
 
 class DigitizerWithRootOutput(DigitizerBase):
 
+    # hints for IDE
+    root_flush_size: int
+    root_output_per_thread: bool
+    root_output_backend: str
+
+    user_info_defaults = {
+        "root_flush_size": (
+            0,
+            {
+                "doc": "Number of digis kept in memory before they are written to the root file "
+                "all at once. With 0, the digis are written at the end of each event "
+                "(at the end of each run for the PhaseSpaceActor). "
+                "Larger values reduce the time spent writing the root output, "
+                "at the cost of memory. "
+                "For the digitizers with a 'clear_every' option, the digis are also written "
+                "every 'clear_every' events (default 1e5), whatever their number: a block "
+                "never contains more than the digis of 'clear_every' events, so "
+                "'clear_every' must be increased too for very large values.",
+            },
+        ),
+        "root_output_per_thread": (
+            False,
+            {
+                "doc": "In multithread mode, each thread writes its own root file "
+                "(with a '_t<thread id>' suffix) instead of sending its data to the master thread. "
+                "The files are merged (chunk by chunk) at the end of the simulation. "
+                "The thread files are complete as soon as the thread has finished; "
+                "they cannot be read while the thread is running (partial results "
+                "are not available). "
+                "This option applies to all root outputs of the simulation, so it must be the "
+                "same for all digitizers.",
+            },
+        ),
+        "root_output_backend": (
+            "geant4",
+            {
+                "doc": "How the root output is written. With 'geant4', the digis are written "
+                "in the Geant4 ntuples, value by value and row by row. With 'columnar', "
+                "each thread writes, at each flush (see root_flush_size), the values of each "
+                "attribute as one block in a binary column file (in a folder with the same "
+                "name as the root file and the '.columns' extension). The column files "
+                "are converted to the root file (column by column, chunk by chunk) "
+                "at the end of the simulation and removed. The entries are in thread order, "
+                "as with root_output_per_thread (that is not needed in this case). "
+                "As the root files may be shared by several actors, this option must be "
+                "the same for all digitizers.",
+                "allowed_values": ("geant4", "columnar"),
+            },
+        ),
+    }
+
     user_output_config = {
         "root_output": {
             "actor_output_class": ActorOutputRoot,
         },
     }
 
+    def _check_root_output_per_thread(self):
+        # the Geant4 merging mode is common to all the root outputs,
+        # and the root files may be shared by several actors
+        for option in ["root_output_per_thread", "root_output_backend"]:
+            for actor in self.simulation.actor_manager.actors.values():
+                if option not in actor.user_info:
+                    continue
+                if actor.user_info[option] != self.user_info[option]:
+                    fatal(
+                        f"The option {option} must be the same for all actors, "
+                        f"while it is {self.user_info[option]} for '{self.name}' and "
+                        f"{actor.user_info[option]} for '{actor.name}'."
+                    )
+
+    def post_simulation_action(self):
+        if not self.write_to_disk:
+            return
+        # (nothing done if the files have already been converted or merged
+        # by another actor)
+        if self.root_output_backend == "columnar":
+            convert_root_columns(self.get_output_path("root_output"))
+            return
+        if not self.root_output_per_thread or not self.simulation.multithreaded:
+            return
+        merge_root_files_per_thread(self.get_output_path("root_output"))
+
 
 class DigitizerAdderActor(DigitizerWithRootOutput, g4.GateDigitizerAdderActor):
     """Equivalent to Gate "adder": gather all hits of an event in the same volume.
@@ -878,6 +1179,15 @@ class DigitizerProjectionActor(DigitizerBase, g4.GateDigitizerProjectionActor):
                 "doc": "FIXME",
             },
         ),
+        "use_weights": (
+            False,
+            {
+                "doc": "If True, the 'Weight' attribute of the digis is added in the projection "
+                "(instead of 1). The input digi collections must contain this attribute. "
+                "Required with weighted sources, e.g. with the acceptance angle "
+                "option 'forced_direction_flag'.",
+            },
+        ),
     }
 
     user_output_config = {
@@ -417,7 +417,7 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
         "uncertainty_goal": (
             None,
             {
-                "doc": "If set, it defines the statistical uncertainty goal. The simulation will stop once the statistical uncertainty is smaller or equal this value.",
+                "doc": "If set, it defines the statistical uncertainty goal. The simulation (the current run) will stop once the mean relative statistical uncertainty of the edep image, over the voxels above uncertainty_voxel_edep_threshold, is smaller or equal this value. Implies thread_local_scoring.",
                 "setter_hook": _setter_hook_uncertainty_goal,
             },
         ),
@@ -440,6 +440,14 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
                 "doc": "Only applies if uncertainty_goal is set True: Factor multiplying the estimated N events needed to achieve the uncertainty goal, to ensure convergence.",
             },
         ),
+        "uncertainty_check_interval_seconds": (
+            None,
+            {
+                "doc": "Only applies if uncertainty_goal is set: if set, the uncertainty is also "
+                "evaluated when this time (in seconds, wall clock) has elapsed since the last "
+                "evaluation, even if the estimated number of events is not reached yet. ",
+            },
+        ),
         "dose_calc_on_the_fly": (
             False,
             {
@@ -447,6 +455,25 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
                 "deactivated": True,
             },
         ),
+        "thread_local_scoring": (
+            False,
+            {
+                "doc": "If True, each thread accumulates the deposited quantities in its own buffer "
+                "(no mutex in the stepping action) and the buffers are summed into the output images "
+                "at the end of each run. This is faster with many threads, but requires one copy "
+                "of each scored image per thread in memory. "
+                "Always True when uncertainty_goal is set.",
+            },
+        ),
+        "stopping_power_table": (
+            True,
+            {
+                "doc": "Only used with score_in='G4_WATER'. If True, each thread tabulates the stopping powers "
+                "of each (particle, material) and of water on a log energy grid the first time they are needed, "
+                "and interpolates in these tables at each step. If False, G4EmCalculator is called twice per step "
+                "(slower).",
+            },
+        ),
     }
 
     user_output_config = {
@@ -543,6 +570,10 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
 
         VoxelDepositActor.initialize(self)
 
+        # the stop on uncertainty goal relies on the per-thread buffers
+        if self.uncertainty_goal is not None:
+            self.thread_local_scoring = True
+
         # the edep component has to be active in any case
         self.user_output.edep_with_uncertainty.set_active(True, item=0)
 
@@ -610,6 +641,10 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
         self.SetThreshEdepPerc(self.uncertainty_voxel_edep_threshold)
         self.SetOvershoot(self.uncertainty_overshoot_factor_N_events)
         self.SetNbEventsFirstCheck(int(self.uncertainty_first_check_after_n_events))
+        if self.uncertainty_check_interval_seconds is None:
+            self.SetCheckIntervalSeconds(0)
+        else:
+            self.SetCheckIntervalSeconds(self.uncertainty_check_interval_seconds)
 
         # Set the physical volume name on the C++ side
         self.SetPhysicalVolumeName(self.get_physical_volume_name())
@@ -695,9 +730,6 @@ class DoseActor(VoxelDepositActor, g4.GateDoseActor):
             )
 
         VoxelDepositActor.EndOfRunActionMasterThread(self, run_index)
-
-        # FIXME: should check if uncertainty goal is reached (return value: 0),
-        # but the current mechanism is quite hacky and it is therefore temporarily not in use!
         return 0
 
     def EndSimulationAction(self):
@@ -711,6 +743,7 @@ class TLEDoseActor(DoseActor, g4.GateTLEDoseActor):
     energy_min: float
     energy_max: float
     database: str
+    mu_en_table_bins: int
 
     user_info_defaults = {
         "energy_min": (
@@ -730,6 +763,32 @@ class TLEDoseActor(DoseActor, g4.GateTLEDoseActor):
                 "allowed_values": ("EPDL", "NIST"),  # "simulated" does not work
             },
         ),
+        "mu_en_table_bins": (
+            4000,
+            {
+                "doc": "Each thread tabulates mu_en/rho of each material on this number of "
+                "log-spaced energy bins (up to energy_max), for a constant-time lookup at each step. "
+                "With 0, there is no table: mu_en/rho is read in the database tables at each step "
+                "(shared by all threads, slower), as in the previous versions.",
+            },
+        ),
+        "hit_type": (
+            "random",
+            {
+                "doc": "Same as for the DoseActor, with one more option for the TLE photons: "
+                "'track_length' distributes the track length of each step over all the voxels it "
+                "crosses (exact ray-voxel traversal of the dose grid), so that the photons do not "
+                "need to stop at the voxel boundaries. The other particles use 'random'.",
+                "allowed_values": ("random", "pre", "post", "middle", "track_length"),
+            },
+        ),
+        "thread_local_scoring": (
+            True,
+            {
+                "doc": "Same as for the DoseActor, but True by default: each thread scores in its "
+                "own buffer, without mutex.",
+            },
+        ),
     }
 
     def __initcpp__(self):
@@ -742,6 +801,7 @@ class TLEDoseActor(DoseActor, g4.GateTLEDoseActor):
                 "EndOfRunAction",
                 "BeginOfEventAction",
                 "SteppingAction",
+                "EndOfEventAction",
                 "PreUserTrackingAction",
             }
         )
@@ -751,6 +811,11 @@ class TLEDoseActor(DoseActor, g4.GateTLEDoseActor):
             fatal(
                 f"TLEDoseActor cannot score in {self.score_in}, only 'material' is allowed."
             )
+        if self.mu_en_table_bins < 0:
+            fatal(
+                f"The actor {self.name} needs mu_en_table_bins >= 0, "
+                f"while it is {self.mu_en_table_bins}."
+            )
         super().initialize(args)
 
 
@@ -768,6 +833,7 @@ class LETActor(VoxelDepositActor, g4.GateLETActor):
     # hints for IDE
     averaging_method: str
     score_in: str
+    stopping_power_table: bool
 
     user_info_defaults = {
         "averaging_method": (
@@ -798,6 +864,15 @@ class LETActor(VoxelDepositActor, g4.GateLETActor):
                 "deprecated": "Denominator and numerator images are automatically handled and stored. ",
             },
         ),
+        "stopping_power_table": (
+            True,
+            {
+                "doc": "If True, each thread tabulates the electronic stopping powers of each "
+                "(particle, material) and of the score_in material on a log energy grid the first time "
+                "they are needed, and interpolates in these tables at each step. "
+                "If False, G4EmCalculator is called at each step (slower).",
+            },
+        ),
     }
 
     user_output_config = {
@@ -969,6 +1044,16 @@ class FluenceActor(VoxelDepositActor, g4.GateFluenceActor):
     scatter: bool
 
     user_info_defaults = {
+        "hit_type": (
+            "entering",
+            {
+                "doc": "'entering': count the (weighted) particles entering each voxel. "
+                "'track_length': sum the (weighted) track lengths of the steps in each voxel "
+                "(exact ray-voxel traversal of the grid), divided by the voxel volume, "
+                "i.e. the fluence per unit area (mm^-2).",
+                "allowed_values": ("entering", "track_length"),
+            },
+        ),
         "uncertainty": (
             False,
             {
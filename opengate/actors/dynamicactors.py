@@ -1,4 +1,5 @@
 from typing import Optional
+import time
 
 import opengate_core as g4
 from ..definitions import __world_name__
@@ -7,6 +8,7 @@ from ..geometry.utility import rot_np_as_g4, vec_np_as_g4
 from ..exception import fatal
 from .base import ActorBase
 from ..decorators import requires_fatal
+from ..logger import global_log
 
 
 class DynamicGeometryActor(ActorBase, g4.GateVActor):
@@ -15,6 +17,11 @@ class DynamicGeometryActor(ActorBase, g4.GateVActor):
         kwargs["attached_to"] = __world_name__
         ActorBase.__init__(self, *args, **kwargs)
         self.geometry_changers = []
+        # physical volumes given to the geometry manager to open/close
+        # (None means the whole geometry)
+        self.g4_reoptimised_physical_volumes = None
+        # time (in sec) to change and rebuild the geometry, for each run
+        self.geometry_rebuild_times = []
         self.__initcpp__()
 
     def __initcpp__(self):
@@ -25,8 +32,14 @@ class DynamicGeometryActor(ActorBase, g4.GateVActor):
         for c in self.geometry_changers:
             c.close()
         self.geometry_changers = []
+        self.g4_reoptimised_physical_volumes = None
         super().close()
 
+    def __getstate__(self):
+        return_dict = super().__getstate__()
+        return_dict["g4_reoptimised_physical_volumes"] = None
+        return return_dict
+
     def to_dictionary(self):
         return_dict = super().to_dictionary()
         return_dict["geometry_changers"] = dict(
@@ -40,17 +53,65 @@ class DynamicGeometryActor(ActorBase, g4.GateVActor):
             if c.volume_manager is None:
                 c.volume_manager = self.simulation.volume_manager
             c.initialize()
+        self.g4_reoptimised_physical_volumes = (
+            self.find_g4_physical_volumes_to_reoptimise()
+        )
+        self.geometry_rebuild_times = []
+
+    def find_g4_physical_volumes_to_reoptimise(self):
+        """
+        When a physical volume is moved, only the optimisation (smart voxels)
+        of its mother logical volume must be rebuilt. The G4GeometryManager
+        does that when it opens/closes the geometry with this physical volume:
+        the mother is re-optimised, the rest of the geometry (e.g. a CT image)
+        is kept. As all volumes with the same mother lead to the same
+        re-optimisation, only one physical volume per mother is kept.
+        Return None if the whole geometry must be opened/closed, i.e. when a
+        changer does not tell which volumes it changes.
+        """
+        g4_pvs = {}
+        for c in self.geometry_changers:
+            changed = c.get_changed_g4_physical_volumes()
+            if changed is None:
+                return None
+            for pv in changed:
+                mother = pv.GetMotherLogical()
+                if mother is None:
+                    # the world itself is changed
+                    return None
+                g4_pvs.setdefault(str(mother.GetName()), pv)
+        return list(g4_pvs.values())
 
     def BeginOfRunActionMasterThread(self, run_id):
-        if self.simulation.dyn_geom_open_close:
-            gm = g4.G4GeometryManager.GetInstance()
+        t = time.time()
+        g4_pvs = self.g4_reoptimised_physical_volumes
+        gm = g4.G4GeometryManager.GetInstance()
+        if not self.simulation.dyn_geom_open_close:
+            self.apply_changes(run_id)
+        elif g4_pvs is None:
             # OpenGeometry (G4VPhysicalVolume *vol=0)
             gm.OpenGeometry(None)
-        for c in self.geometry_changers:
-            c.apply_change(run_id)
-        if self.simulation.dyn_geom_open_close:
+            self.apply_changes(run_id)
             # CloseGeometry: pOptimise=true, verbose=false, G4VPhysicalVolume *vol=0
             gm.CloseGeometry(self.simulation.dyn_geom_optimise, False, None)
+        else:
+            self.apply_changes(run_id)
+            # the geometry manager only opens/closes one volume at a time:
+            # the mother of each volume is re-optimised in turn
+            for pv in g4_pvs:
+                gm.OpenGeometry(pv)
+                gm.CloseGeometry(self.simulation.dyn_geom_optimise, False, pv)
+        t = time.time() - t
+        self.geometry_rebuild_times.append(t)
+        n = "all" if g4_pvs is None else len(g4_pvs)
+        global_log.debug(
+            f"Dynamic geometry: run {run_id}, geometry changed and "
+            f"re-optimised ({n} mother volumes) in {t:.4f} s"
+        )
+
+    def apply_changes(self, run_id):
+        for c in self.geometry_changers:
+            c.apply_change(run_id)
 
 
 def _setter_hook_attached_to(self, value):
@@ -135,6 +196,14 @@ class GeometryChanger(GateObject):
             f"but it is only available in classes inheriting from it. "
         )
 
+    def get_changed_g4_physical_volumes(self):
+        """
+        List of the G4 physical volumes modified by this changer, used to
+        re-optimise only their mother volumes at each run.
+        None (default) means unknown: the whole geometry is re-optimised.
+        """
+        return None
+
 
 class VolumeImageChanger(GeometryChanger):
 
@@ -163,6 +232,9 @@ class VolumeImageChanger(GeometryChanger):
             self.label_image[self.images[run_id]]
         )
 
+    # the label image changes the content of the voxels:
+    # keep the default (whole geometry re-optimised)
+
 
 class VolumeTranslationChanger(GeometryChanger):
 
@@ -213,6 +285,9 @@ class VolumeTranslationChanger(GeometryChanger):
     def apply_change(self, run_id):
         self.g4_physical_volume.SetTranslation(self.g4_translations[run_id])
 
+    def get_changed_g4_physical_volumes(self):
+        return [self.g4_physical_volume]
+
 
 class VolumeRotationChanger(GeometryChanger):
 
@@ -266,6 +341,9 @@ class VolumeRotationChanger(GeometryChanger):
     def apply_change(self, run_id):
         self.g4_physical_volume.SetRotationHepRep3x3(self.g4_rotations[run_id])
 
+    def get_changed_g4_physical_volumes(self):
+        return [self.g4_physical_volume]
+
 
 process_cls(DynamicGeometryActor)
 process_cls(GeometryChanger)
@@ -87,6 +87,7 @@ class ActorOutputStatisticsActor(ActorOutputBase):
         self.merged_data.sim_stop_time = 0
         self.merged_data.init = 0
         self.merged_data.track_types = {}
+        self.merged_data.profiling = {}
         self.merged_data.nb_threads = 1
 
     @property
@@ -170,6 +171,7 @@ class ActorOutputStatisticsActor(ActorOutputBase):
         d["arch"] = {"value": platform.system(), "unit": None}
         d["python"] = {"value": platform.python_version(), "unit": None}
         d["track_types"] = {"value": self.merged_data.track_types, "unit": None}
+        d["profiling"] = {"value": self.merged_data.profiling, "unit": None}
         return d
 
     def __str__(self):
@@ -180,6 +182,8 @@ class ActorOutputStatisticsActor(ActorOutputBase):
                     s += "track_types\n"
                     for t, n in v["value"].items():
                         s += f"{' ' * 24}{t}: {n}\n"
+            elif k == "profiling":
+                s += self._profiling_str(v["value"])
             else:
                 if v["unit"] is None:
                     unit = ""
@@ -189,6 +193,20 @@ class ActorOutputStatisticsActor(ActorOutputBase):
         # remove last line break
         return s.rstrip("\n")
 
+    @staticmethod
+    def _profiling_str(profiling):
+        s = ""
+        for kind, names in profiling.items():
+            s += f"profiling {kind}\n"
+            for name, callbacks in names.items():
+                for callback, c in callbacks.items():
+                    val, unit = g4_best_unit_tuple(c["duration"], "Time")
+                    s += (
+                        f"{' ' * 24}{name} {callback}: "
+                        f"{c['calls']} calls {val} {unit}\n"
+                    )
+        return s
+
     def write_data(self, **kwargs):
         """Override virtual method from base class."""
         with open(self.get_output_path(which="merged"), "w+") as f:
@@ -201,12 +219,46 @@ class ActorOutputStatisticsActor(ActorOutputBase):
         if self.write_to_disk is True:
             self.write_data(**kwargs)
 
+    def merge_output_from_subprocesses(self, outputs):
+        data = [o.merged_data for o in outputs]
+        m = self.merged_data
+        for k in ("events", "tracks", "steps", "nb_threads"):
+            m[k] = sum(d[k] for d in data)
+        # all processes run the same runs
+        m.runs = data[0].runs
+        # the subprocesses run concurrently
+        m.duration = max(d.duration for d in data)
+        m.init = max(d.init for d in data)
+        m.start_time = data[0].start_time
+        m.stop_time = data[-1].stop_time
+        m.sim_start_time = data[0].sim_start_time
+        m.sim_stop_time = data[0].sim_stop_time
+        track_types = {}
+        profiling = {}
+        for d in data:
+            for t, n in d.track_types.items():
+                track_types[t] = track_types.get(t, 0) + n
+            for kind, names in d.profiling.items():
+                for name, callbacks in names.items():
+                    for callback, c in callbacks.items():
+                        mc = (
+                            profiling.setdefault(kind, {})
+                            .setdefault(name, {})
+                            .setdefault(callback, {"calls": 0, "duration": 0})
+                        )
+                        mc["calls"] += c["calls"]
+                        mc["duration"] += c["duration"]
+        m.track_types = track_types
+        m.profiling = profiling
+        self.write_data_if_requested()
+
 
 class SimulationStatisticsActor(ActorBase, g4.GateSimulationStatisticsActor):
     """Store statistics about a simulation run."""
 
     # hints for IDE
     track_types_flag: bool
+    profiling: bool
 
     user_info_defaults = {
         "track_types_flag": (
@@ -215,6 +267,14 @@ class SimulationStatisticsActor(ActorBase, g4.GateSimulationStatisticsActor):
                 "doc": "Should the type of tracks be counted?",
             },
         ),
+        "profiling": (
+            False,
+            {
+                "doc": "Record the cumulative time and the number of calls of each "
+                "callback of all actors (SteppingAction, EndOfEventAction, ...), "
+                "filters and sources (GeneratePrimaries), for all threads.",
+            },
+        ),
     }
 
     user_output_config = {
@@ -2,7 +2,8 @@
 # -*- coding: utf-8 -*-
 
 import click
-from opengate.data.PhotonAttenuationMixture import *
+from opengate.data.PhotonAttenuation import get_table, ChComposition
+from opengate.data.PhotonAttenuationMixture import PhotonAttenuationMixture
 from opengate import g4_units
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
@@ -44,7 +45,7 @@ def go(mixture, energy, option, verbose):
     [w, El] = ChComposition(mixture)
     if len(w) == 0:
         print(f"Cannot find the mixture {mixture}. ")
-        print(f"Known mixtures are: {PropsMix}")
+        print(f"Known mixtures are: {get_table('PropsMix')}")
     result = PhotonAttenuationMixture(mixture, energy, option)
     if verbose:
         op = {
@@ -1757,3 +1757,104 @@ def set_time_intervals_from_rtplan(sim, rt_plan_parameters, cp_id="all_cp"):
             sim.run_timing_intervals.append(
                 [np.sum(MU[:i]) * sec, np.sum(MU[: i + 1]) * sec]
             )
+
+
+class ControlPointsApertureModel:
+    """
+    Lightweight model of a dynamic (VMAT) delivery for a PhaseSpaceSource.
+    Instead of one run per control point, the whole plan is delivered in a
+    single run: for each particle of the phsp, a control point is sampled
+    (with a probability proportional to its MU), the particle is kept only if
+    its straight line crosses the isocenter plane inside the MLC/jaws aperture
+    of this control point, and it is rotated by the gantry and collimator
+    angles of the control point.
+
+    The phsp must be stored above the jaws, in global coordinates, with the
+    linac at gantry angle 0 and the isocenter at the origin (the beam goes
+    toward -Z). The MLC and jaws volumes must not be in the geometry: the
+    transmission through the leaves and the scatter in the leaves and jaws
+    are not simulated.
+    """
+
+    def __init__(
+        self,
+        rt_plan_parameters,
+        cp_id="all_cp",
+        leaf_width=5 * g4_units.mm,
+        nb_leaf_pairs=80,
+    ):
+        if cp_id == "all_cp":
+            cp_id = np.arange(0, len(rt_plan_parameters["weight"]), 1)
+        cp_id = np.array(cp_id)
+        mu = np.array(rt_plan_parameters["weight"], dtype=float)[cp_id]
+        if np.sum(mu) <= 0:
+            gate.exception.fatal("No MU in the selected control points")
+        self.cp_id = cp_id
+        self.cumulative_weights = np.cumsum(mu) / np.sum(mu)
+        # leaves and jaws positions, projected at the isocenter
+        self.leaves = np.array(rt_plan_parameters["leaves"], dtype=float)[cp_id]
+        self.jaws = np.column_stack(
+            [
+                np.array(rt_plan_parameters["jaws 1"], dtype=float)[cp_id],
+                np.array(rt_plan_parameters["jaws 2"], dtype=float)[cp_id],
+            ]
+        )
+        self.leaf_width = leaf_width
+        self.nb_leaf_pairs = nb_leaf_pairs
+        # same rotation as linac_rotation, around the isocenter
+        gantry = np.array(rt_plan_parameters["gantry angle"], dtype=float)[cp_id]
+        collimation = np.array(rt_plan_parameters["collimation angle"], dtype=float)
+        collimation = collimation[cp_id]
+        self.rotations = Rotation.from_euler(
+            "YZ", np.column_stack([gantry, collimation]), degrees=True
+        ).as_matrix()
+
+    def sample_control_points(self, n, rng):
+        """
+        Index (in cp_id) of the control point of n particles, sampled according to the MU.
+        """
+        cp = np.searchsorted(self.cumulative_weights, rng.random(n), side="right")
+        return np.minimum(cp, len(self.cumulative_weights) - 1)
+
+    def is_in_aperture(self, cp, position, direction):
+        """
+        True for the particles whose straight line crosses the isocenter plane
+        (Z = 0) inside the aperture of their control point.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = -position[2] / direction[2]
+            x = position[0] + t * direction[0]
+            y = position[1] + t * direction[1]
+        row = np.floor(y / self.leaf_width + self.nb_leaf_pairs / 2)
+        ok = (direction[2] < 0) & (row >= 0) & (row < self.nb_leaf_pairs)
+        row = np.where(ok, row, 0).astype(int)
+        ok &= (x > self.leaves[cp, row]) & (
+            x < self.leaves[cp, row + self.nb_leaf_pairs]
+        )
+        ok &= (y > self.jaws[cp, 0]) & (y < self.jaws[cp, 1])
+        return ok
+
+    def __call__(self, batch, pdg, n, rng):
+        position = batch[0:3, :n]
+        direction = batch[3:6, :n]
+        cp = self.sample_control_points(n, rng)
+        kept = np.flatnonzero(self.is_in_aperture(cp, position, direction))
+        m = len(kept)
+        rotations = self.rotations[cp[kept]]
+        # the fancy indexing copies the kept particles before the batch is overwritten
+        batch[0:3, :m] = np.einsum("nij,jn->in", rotations, position[:, kept])
+        batch[3:6, :m] = np.einsum("nij,jn->in", rotations, direction[:, kept])
+        batch[6:, :m] = batch[6:, kept]
+        if pdg is not None:
+            pdg[:m] = pdg[kept]
+        return m
+
+
+def set_control_points_aperture_model(source, rt_plan_parameters, cp_id="all_cp"):
+    """
+    Deliver the control points of the plan in a single run with a phsp
+    source, see ControlPointsApertureModel.
+    """
+    source.global_flag = True
+    source.batch_transform = ControlPointsApertureModel(rt_plan_parameters, cp_id)
+    return source.batch_transform
@@ -772,7 +772,14 @@ class TreatmentPlanSource:
     def set_beamline_model(self, beamline):
         self.beamline_model = beamline
 
-    def initialize_tpsource(self, flat_generation=False, activity=False):
+    def initialize_tpsource(
+        self, flat_generation=False, activity=False, single_source=False
+    ):
+        # with single_source, all spots are simulated by one TreatmentPlanPBSource
+        # that samples the spot of each event, instead of one source per spot
+        if single_source:
+            return self._initialize_single_tpsource(flat_generation, activity)
+
         # some alias
         Bq = gate.g4_units.Bq
         spots_array = self.spots
@@ -860,6 +867,29 @@ class TreatmentPlanSource:
 
         self.actual_sim_particles = tot_sim_particles
 
+    def _initialize_single_tpsource(self, flat_generation=False, activity=False):
+        if activity:
+            raise ValueError(
+                "The activity option is not available with a single source, "
+                "use the number of particles instead."
+            )
+        particles = set(spot.particle_name for spot in self.spots)
+        if len(particles) != 1:
+            raise ValueError(
+                f"A single source needs the same particle for all spots, "
+                f"while the plan contains {particles}"
+            )
+
+        source = self.sim.add_source("TreatmentPlanPBSource", self.name)
+        source.beam_model = self.beamline_model
+        source.beam_data_dict = {"spots": self.spots, "rotation": self.rotation}
+        source.position.translation = self.translation
+        source.flat_generation = flat_generation
+        source.particle = particles.pop()
+        source.n = int(self.n_sim)
+        self.actual_sim_particles = source.n
+        return source
+
     def _sample_n_particles_spots(self, flat_generation=False):
         if flat_generation:
             pdf = [1 / len(self.spots) for spot in self.spots]
@@ -869,11 +899,8 @@ class TreatmentPlanSource:
         # normalize vector, to assure the probabilities sum up to 1
         pdf = pdf / np.sum(pdf)
 
-        n_spots = len(self.spots)
-        n_part_spots_V = np.zeros(n_spots)
-        for i in range(int(self.n_sim)):
-            bin = np.random.choice(np.arange(0, n_spots), p=pdf)
-            n_part_spots_V[bin] += 1
+        # one multinomial draw instead of one draw per particle
+        n_part_spots_V = np.random.multinomial(int(self.n_sim), pdf).astype(float)
 
         return n_part_spots_V
 
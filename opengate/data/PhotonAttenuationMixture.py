@@ -6,10 +6,13 @@ and the linear attenuation coefficient of a mixture for energies in [0.001,20] M
 @author: vilches
 """
 
-from .PhotonAttenuation import *
+import numpy as np
+from .PhotonAttenuation import get_table, PhotonAttenuationEl, ChComposition
 
 
 def PhotonAttenuationMixture(Mixture, E, Option):
+    PropsEl = get_table("PropsEl")
+    PropsMix = get_table("PropsMix")
     [w, El] = ChComposition(
         Mixture
     )  # extract fraction by weight and elements of the mixture
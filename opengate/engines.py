@@ -639,6 +639,9 @@ class ActorEngine(EngineBase):
         # consider the priority value of the actors
         for actor in self.actor_manager.sorted_actors:
             actor.EndSimulationAction()
+        # once all actors are done (e.g. output files closed)
+        for actor in self.actor_manager.sorted_actors:
+            actor.post_simulation_action()
 
 
 class FilterEngine(EngineBase):
@@ -926,12 +929,20 @@ class SimulationOutput:
         self.current_random_seed = None
         self.user_hook_log = []
         self.warnings = None
+        self.profiling = {}
 
     def store_actors(self, simulation_engine):
         self.actors = simulation_engine.simulation.actor_manager.actors
         for actor in self.actors.values():
             actor.close()
 
+    def store_profiling(self, simulation_engine):
+        # the profiling counters are collected by the statistics actor(s)
+        self.profiling = {}
+        for actor in simulation_engine.simulation.actor_manager.actors.values():
+            if actor.type_name == "SimulationStatisticsActor" and actor.profiling:
+                self.profiling = actor.counts.profiling
+
     def store_hook_log(self, simulation_engine):
         self.user_hook_log = simulation_engine.user_hook_log
 
@@ -1183,6 +1194,7 @@ class SimulationEngine(GateSingletonFatal):
         output.store_actors(self)
         output.store_sources(self)
         output.store_hook_log(self)
+        output.store_profiling(self)
         output.current_random_seed = self.current_random_seed
         output.expected_number_of_events = self.source_engine.expected_number_of_events
         output.warnings = self.simulation.warnings
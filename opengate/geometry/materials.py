@@ -289,7 +289,7 @@ def read_tag_with_unit(s, tag):
     return value * u
 
 
-def create_density_img(img_volume, material_database):
+def create_density_img(img_volume, material_database, chunk_size=None):
     """
 
 
@@ -299,24 +299,28 @@ def create_density_img(img_volume, material_database):
         opengate ImageVolume class instance
     material_database : dict
         dictionary with keys: material name, values: G4 material obj
+    chunk_size : int, optional
+        number of slices (along z) processed at once, to bound the memory
 
     Returns
     -------
     rho : itk.Image
         Image of the same size and resolution of the ct. The voxel value is the density of the voxel converted to g/cm3.
+        The density is read in a LUT indexed by the label image of the volume.
 
     """
-    act = itk.GetArrayFromImage(img_volume.itk_image)
-    arho = np.zeros(act.shape, dtype=np.float32)
-
-    for hu0, hu1, mat_name in img_volume.voxel_materials:
-        arho[(act >= hu0) * (act < hu1)] = material_database[mat_name].GetDensity()
-
-    arho *= g4_units.cm3 / g4_units.g
-    rho = itk.GetImageFromArray(arho)
-    rho.CopyInformation(img_volume.itk_image)
-
-    return rho
+    if img_volume.label_image is None:
+        img_volume.label_image = img_volume.create_label_image()
+
+    # LUT label -> density (float32 like the output image)
+    label_to_density = {}
+    for mat_name, label in img_volume.material_to_label_lut.items():
+        rho = np.float32(material_database[mat_name].GetDensity())
+        label_to_density[label] = rho * np.float32(g4_units.cm3 / g4_units.g)
+
+    return img_volume.create_image_from_label_lut(
+        label_to_density, np.float32, chunk_size=chunk_size
+    )
 
 
 def create_mass_img(ct_itk, hu_density_file, overrides=dict()):
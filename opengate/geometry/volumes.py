@@ -16,6 +16,7 @@ from ..utility import ensure_filename_is_str
 from ..exception import fatal, warning
 from ..image import write_itk_image
 from ..image import update_image_py_to_cpp
+from ..image import iterate_slices
 from .utility import (
     vec_np_as_g4,
     rot_np_as_g4,
@@ -1065,7 +1066,7 @@ class ImageVolume(VolumeBase, solids.ImageSolid):
             itk_image = itk.imread(ensure_filename_is_str(path))
         return itk_image
 
-    def create_attenuation_image(self, database, energy):
+    def create_attenuation_image(self, database, energy, chunk_size=None):
         # convert all materials to mu
         label_to_mu = {}
         mu_handler = g4.GateMaterialMuHandler.GetInstance(database, 200)  # max in MeV
@@ -1077,15 +1078,36 @@ class ImageVolume(VolumeBase, solids.ImageSolid):
             mu = mu_handler.GetMu(couple, energy)
             label_to_mu[label] = mu
 
-        arr = itk.GetArrayViewFromImage(self.label_image)
-        mu_arr = arr.copy().astype("float")
-        for label, mu in label_to_mu.items():
-            mu_arr[mu_arr == label] = mu
-        itk_mu_img = itk.GetImageFromArray(mu_arr)
-        itk_mu_img.CopyInformation(self.itk_image)
-        return itk_mu_img
+        return self.create_image_from_label_lut(
+            label_to_mu, np.float64, chunk_size=chunk_size
+        )
+
+    def create_image_from_label_lut(self, label_to_value, dtype, chunk_size=None):
+        """
+        Create an image (same information as the input image) where each voxel
+        is the value of its label, read in a LUT (one gather pass over the label image).
+        The labels not in label_to_value are set to zero.
+        With chunk_size, the image is processed by chunks of chunk_size slices
+        along z, to bound the memory used by the temporary arrays.
+        """
+        if self.label_image is None:
+            self.label_image = self.create_label_image()
+        labels = itk.array_view_from_image(self.label_image)
 
-    def create_label_image(self, itk_image=None):
+        # LUT from label to value, for all possible labels (ushort)
+        lut = np.zeros(np.iinfo(np.ushort).max + 1, dtype=dtype)
+        for label, value in label_to_value.items():
+            lut[label] = value
+
+        arr = np.empty(labels.shape, dtype=dtype)
+        for z in iterate_slices(labels.shape[0], chunk_size):
+            np.take(lut, labels[z], out=arr[z])
+
+        img = itk.image_from_array(arr)
+        img.CopyInformation(self.itk_image)
+        return img
+
+    def create_label_image(self, itk_image=None, chunk_size=None):
         # read image
         if itk_image is None:
             if self.itk_image is None:
@@ -1122,9 +1144,14 @@ class ImageVolume(VolumeBase, solids.ImageSolid):
         # get numpy array view of input itk image
         input_image = itk.array_view_from_image(itk_image)
 
-        label_image_arr = np.array(labels_sorted, dtype=np.ushort)[
-            np.digitize(input_image, bins=bins_sorted)
-        ]
+        # np.digitize builds a temporary (int64) index array: with chunk_size,
+        # it is done by chunks of slices along z
+        labels_lut = np.array(labels_sorted, dtype=np.ushort)
+        label_image_arr = np.empty(input_image.shape, dtype=np.ushort)
+        for z in iterate_slices(input_image.shape[0], chunk_size):
+            label_image_arr[z] = labels_lut[
+                np.digitize(input_image[z], bins=bins_sorted)
+            ]
 
         label_image = itk.image_from_array(label_image_arr)
         label_image.CopyInformation(itk_image)
@@ -1179,9 +1206,11 @@ class ImageVolume(VolumeBase, solids.ImageSolid):
             -(self.size_pix * self.spacing) / 2.0 + self.spacing / 2.0
         )
 
-    def create_density_image(self):
+    def create_density_image(self, chunk_size=None):
         return create_density_img(
-            self, self.volume_manager.material_database.g4_materials
+            self,
+            self.volume_manager.material_database.g4_materials,
+            chunk_size=chunk_size,
         )
 
     def create_changers(self):
@@ -186,6 +186,18 @@ def itk_image_from_array(arr, view=True):
     return image
 
 
+def iterate_slices(n, chunk_size=None):
+    """
+    Iterate over the slices of chunk_size elements of an axis of length n
+    (a single slice if chunk_size is None).
+    """
+    if chunk_size is None:
+        chunk_size = n
+    chunk_size = max(1, int(chunk_size))
+    for start in range(0, n, chunk_size):
+        yield slice(start, min(start + chunk_size, n))
+
+
 def get_image_center(image):
     info = read_image_info(image)
     center = info.size * info.spacing / 2.0  # + info.spacing / 2.0
@@ -298,6 +310,76 @@ def compute_image_3D_CDF(image):
     return cdf_x, cdf_y, cdf_z
 
 
+def compute_alias_table(weights):
+    """
+    Compute the alias table (Walker/Vose) of a 1D array of positive weights.
+    A sample is drawn in O(1): draw a column c uniformly, then keep c with
+    probability probabilities[c], else take aliases[c].
+
+    The table is built without Python loop: the small columns (weight below the
+    mean) are filled, in order, by the large ones (weight above the mean),
+    following the cumulative sums of the deficits and of the excesses.
+    This is the table that the Vose algorithm would build with the same order.
+
+    :param weights: 1D array of weights (>=0, not all zero)
+    :return: probabilities (float64) and aliases (int64) arrays, same size as weights
+    """
+    q = np.asarray(weights, dtype=np.float64)
+    n = len(q)
+    q = q * (n / np.sum(q))
+    probabilities = np.ones(n, dtype=np.float64)
+    aliases = np.arange(n, dtype=np.int64)
+    small = np.flatnonzero(q < 1)
+    large = np.flatnonzero(q >= 1)
+    if len(small) == 0 or len(large) == 0:
+        return probabilities, aliases
+
+    # cumulated deficits of the small columns, and excesses of the large ones
+    deficits = np.cumsum(1 - q[small])
+    excesses = np.cumsum(q[large] - 1)
+    # tolerance for rounding errors, the two sums should be equal
+    eps = 1e-9 * n
+
+    # a small column is filled by the large one that is active when the
+    # column is considered (the first with cumulated excess >= previous deficits)
+    previous_deficits = np.concatenate(([0], deficits[:-1]))
+    j = np.searchsorted(excesses, previous_deficits, side="left")
+    valid = j < len(large)
+    probabilities[small[valid]] = q[small[valid]]
+    aliases[small[valid]] = large[j[valid]]
+
+    # a large column is exhausted at the first small column whose cumulated
+    # deficit exceeds its cumulated excess; its remaining part is kept, and
+    # its column is filled by the next large one
+    s = np.searchsorted(deficits, excesses, side="right")
+    exhausted = (s < len(small)) & (excesses < deficits[-1] - eps)
+    exhausted[-1] = False
+    jj = np.flatnonzero(exhausted)
+    probabilities[large[jj]] = 1 - (deficits[s[jj]] - excesses[jj])
+    aliases[large[jj]] = large[jj + 1]
+
+    return probabilities, aliases
+
+
+def compute_image_3D_alias_table(image):
+    """
+    Compute a flat alias table to sample the voxels of the given image
+    according to their values. Only the voxels with a non-zero value
+    are considered (so they can never be sampled).
+
+    :param image: itk image
+    :return: probabilities, aliases, and the flat indices (numpy order ZYX)
+        of the non-zero voxels. A sampled column c (or its alias) gives the
+        voxel indices[c].
+    """
+    array = itk.array_view_from_image(image).ravel()
+    indices = np.flatnonzero(array).astype(np.int64)
+    if len(indices) == 0:
+        fatal("Cannot compute the alias table: the image is empty (all zero)")
+    probabilities, aliases = compute_alias_table(array[indices])
+    return probabilities, aliases, indices
+
+
 def scale_itk_image(img, scale):
     imgarr = itk.array_view_from_image(img)
     imgarr = imgarr * scale
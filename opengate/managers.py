@@ -6,6 +6,7 @@ from anytree import RenderTree, LoopError
 import shutil
 import os
 import weakref
+import numpy as np
 from pathlib import Path
 
 import opengate_core as g4
@@ -36,7 +37,7 @@ from .physics import (
     translate_particle_name_gate_to_geant4,
 )
 from .serialization import dump_json, dumps_json, loads_json, load_json
-from .processing import dispatch_to_subprocess
+from .processing import dispatch_to_subprocess, dispatch_to_subprocesses
 
 from .sources.generic import SourceBase, GenericSource
 from .sources.phspsources import PhaseSpaceSource
@@ -1747,7 +1748,79 @@ class Simulation(GateObject):
             output = se.run_engine()
         return output
 
-    def run(self, start_new_process=False):
+    def _run_simulation_engine_in_subprocess(self, process_index, number_of_processes):
+        """Run the simulation as one of several independent subprocesses (see run()).
+        This is executed in the subprocess, on its own copy of the simulation:
+        each process gets its own random seed, its own output folder,
+        its share of the primaries of all sources and, for phase-space sources,
+        a disjoint range of entries of the phsp file.
+        """
+        if self.random_seed != "auto":
+            seeds = np.random.SeedSequence(self.random_seed).generate_state(
+                number_of_processes
+            )
+            self.random_seed = int(seeds[process_index])
+        self.output_dir = Path(self.output_dir) / f"process_{process_index}"
+        for source in self.source_manager.sources.values():
+            if source.n > 0:
+                n = int(source.n)
+                source.n = n // number_of_processes + int(
+                    process_index < n % number_of_processes
+                )
+            if source.activity > 0:
+                source.activity = source.activity / number_of_processes
+            # each process reads its own part of the phase-space file
+            if isinstance(source, PhaseSpaceSource):
+                source.process_index = process_index
+                source.number_of_processes = number_of_processes
+        return self._run_simulation_engine(True)
+
+    def _merge_outputs_from_subprocesses(self, outputs):
+        """Combine the outputs of the subprocesses into the actors of this simulation
+        and write the merged data (see run()).
+        """
+        for actor in self.actor_manager.actors.values():
+            sub_actors = [o.get_actor(actor.name) for o in outputs]
+            for k, u in actor.user_output.items():
+                try:
+                    u.merge_output_from_subprocesses(
+                        [a.user_output[k] for a in sub_actors]
+                    )
+                except NotImplementedError:
+                    self.warn_user(
+                        f"The output '{k}' of the actor '{actor.name}' cannot be merged "
+                        f"over several subprocesses. Only the output of the first "
+                        f"process is kept."
+                    )
+                    actor.user_output[k] = sub_actors[0].user_output[k]
+                    actor.user_output[k].simulation = self
+
+        # the first output holds the information of all processes
+        output = outputs[0]
+        output.warnings = list(dict.fromkeys(w for o in outputs for w in o.warnings))
+        output.user_hook_log = [log for o in outputs for log in o.user_hook_log]
+        if output.expected_number_of_events is not None:
+            output.expected_number_of_events = sum(
+                o.expected_number_of_events for o in outputs
+            )
+        output.actors = self.actor_manager.actors
+        output.profiling = {}
+        for actor in self.actor_manager.actors.values():
+            if actor.type_name == "SimulationStatisticsActor" and actor.profiling:
+                output.profiling = actor.counts.profiling
+        return output
+
+    def run(self, start_new_process=False, number_of_sub_processes=0):
+        """Run the simulation.
+
+        If start_new_process is True, the simulation is run in a subprocess.
+        If number_of_sub_processes is larger than 1, the simulation is split into
+        as many independent subprocesses, run concurrently. Each one has its own
+        random seed, a share of the primaries (source.n or source.activity is divided)
+        and writes in a sub-folder process_<i> of the output folder.
+        The actor outputs are then merged (images, statistics, ROOT files)
+        and written in the output folder.
+        """
         # if windows and MT -> fail
         if os.name == "nt" and self.multithreaded:
             fatal(
@@ -1756,7 +1829,17 @@ class Simulation(GateObject):
             )
 
         # prepare sub process
-        if start_new_process is True:
+        if number_of_sub_processes > 1:
+            global_log.info(
+                f"Dispatching simulation to {number_of_sub_processes} subprocesses ..."
+            )
+            outputs = dispatch_to_subprocesses(
+                self._run_simulation_engine_in_subprocess,
+                [(i, number_of_sub_processes) for i in range(number_of_sub_processes)],
+            )
+            output = self._merge_outputs_from_subprocesses(outputs)
+
+        elif start_new_process is True:
             """Important: put:
                 if __name__ == '__main__':
                 at the beginning of the script
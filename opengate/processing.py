@@ -28,3 +28,37 @@ def dispatch_to_subprocess(func, *args, **kwargs):
         return q.get(block=False)
     except queue.Empty:
         fatal("The queue is empty. The spawned process probably died.")
+
+
+def dispatch_to_subprocesses(func, list_of_args, **kwargs):
+    """Run func(*args, **kwargs) in one subprocess for each args of the list.
+    All processes are started before waiting for any of them.
+    The outputs are returned in the order of list_of_args.
+    """
+    try:
+        multiprocessing.set_start_method("spawn")
+    except RuntimeError:
+        pass
+
+    manager = multiprocessing.Manager()
+    queues = [manager.Queue() for _ in list_of_args]
+    processes = [
+        multiprocessing.Process(
+            target=target_func, args=(q, func, *args), kwargs=kwargs
+        )
+        for q, args in zip(queues, list_of_args)
+    ]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+
+    outputs = []
+    for i, q in enumerate(queues):
+        try:
+            outputs.append(q.get(block=False))
+        except queue.Empty:
+            fatal(
+                f"The queue of the subprocess {i} is empty. The process probably died."
+            )
+    return outputs
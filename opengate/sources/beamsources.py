@@ -145,6 +145,7 @@ class TreatmentPlanPBSource(SourceBase, g4.GateTreatmentPlanPBSource):
         plan_path = self.plan_path
         gantry_rot_axis = self.gantry_rot_axis
         gantry_angle = None
+        rotation = None
 
         # get data from plan if provided
         if plan_path:
@@ -162,10 +163,15 @@ class TreatmentPlanPBSource(SourceBase, g4.GateTreatmentPlanPBSource):
                 )
         elif self.beam_data_dict:
             self.spots = self.beam_data_dict["spots"]
-            gantry_angle = self.beam_data_dict["gantry_angle"]
+            # the gantry rotation may also be given directly (scipy Rotation)
+            rotation = self.beam_data_dict.get("rotation", None)
+            if rotation is None:
+                gantry_angle = self.beam_data_dict["gantry_angle"]
 
         # set variables for spots, to initialize pbs sources on the cpp side
-        self.rotation = Rotation.from_euler(gantry_rot_axis, gantry_angle, degrees=True)
+        if rotation is None:
+            rotation = Rotation.from_euler(gantry_rot_axis, gantry_angle, degrees=True)
+        self.rotation = rotation
         self.translation = self.position.translation
         beamline = self.beam_model
         self.d_nozzle_to_iso = beamline.distance_nozzle_iso
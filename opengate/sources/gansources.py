@@ -4,6 +4,8 @@ import scipy
 from scipy.spatial.transform import Rotation
 import numpy as np
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from box import Box
 import itk
 import bisect
@@ -14,7 +16,11 @@ from .phspsources import PhaseSpaceSource
 from ..exception import fatal
 from .generic import GenericSource
 from ..image import get_info_from_image
-from ..image import compute_image_3D_CDF
+from ..image import (
+    compute_image_3D_CDF,
+    compute_image_3D_alias_table,
+    update_image_py_to_cpp,
+)
 from ..utility import LazyModuleLoader
 from ..base import process_cls
 
@@ -58,6 +64,7 @@ class VoxelizedSourcePDFSampler:
     It is needed because the cond voxel source is used on python side.
 
     There are two versions, version 2 is much slower (do not use)
+    Version 1 samples the non-zero voxels with a flat alias table, in O(1).
     """
 
     def __init__(self, itk_image, version=1):
@@ -65,33 +72,12 @@ class VoxelizedSourcePDFSampler:
         self.version = version
         # get image in np array
         self.imga = itk.array_view_from_image(itk_image)
-        imga = self.imga
 
-        # image sizes
-        lx = self.imga.shape[0]
-        ly = self.imga.shape[1]
-        lz = self.imga.shape[2]
-        m = lx * ly * lz
-
-        # normalized pdf
-        pdf = imga.ravel(order="F")
-        self.pdf = pdf / pdf.sum()
-
-        # create grid of indices
-        [x_grid, y_grid, z_grid] = np.meshgrid(
-            np.arange(lx), np.arange(ly), np.arange(lz), indexing="ij"
+        # alias table of the non-zero voxels (flat indices, numpy order)
+        self.probabilities, self.aliases, self.indices = compute_image_3D_alias_table(
+            itk_image
         )
 
-        # list of indices
-        self.xi, self.yi, self.zi = (
-            x_grid.ravel(order="F"),
-            y_grid.ravel(order="F"),
-            z_grid.ravel(order="F"),
-        )
-
-        # 1D indices
-        self.linear_indices = np.arange(int(m))
-
         if version == 2:
             self.init_cdf()
 
@@ -178,20 +164,26 @@ class VoxelizedSourcePDFSampler:
         p = np.array([sps.VGenerateOneDebug() for a in range(n)])
         return p[:, 2], p[:, 1], p[:, 0]
 
+    def sample_linear_indices(self, n, rs=np.random):
+        # alias table: one column, then the column or its alias
+        m = len(self.probabilities)
+        c = np.minimum((rs.uniform(0, 1, size=n) * m).astype(np.int64), m - 1)
+        u = rs.uniform(0, 1, size=n)
+        c = np.where(u < self.probabilities[c], c, self.aliases[c])
+        return self.indices[c]
+
     def sample_indices(self, n, rs=np.random):
-        indices = rs.choice(self.linear_indices, size=n, replace=True, p=self.pdf)
-        i = self.xi[indices]
-        j = self.yi[indices]
-        k = self.zi[indices]
+        indices = self.sample_linear_indices(n, rs)
+        i, j, k = np.unravel_index(indices, self.imga.shape)
         return i, j, k
 
-    def sample_indices_phys(self, n, rs=np.random):
-        # TODO (not used yet)
-        indices = rs.choice(self.linear_indices, size=n, replace=True, p=self.pdf)
-        i = self.pxi[indices]
-        j = self.pyi[indices]
-        k = self.pzi[indices]
-        return i, j, k
+    def samples_g4_alias(self, n):
+        # to compare with cpp version (alias table)
+        sps = g4.GateSPSVoxelsPosDistribution()
+        update_image_py_to_cpp(self.image, sps.cpp_edep_image, False)
+        sps.SetAliasTable(self.probabilities, self.aliases, self.indices)
+        p = np.array([sps.VGenerateOneDebug() for a in range(n)])
+        return p[:, 2], p[:, 1], p[:, 0]
 
 
 class VoxelizedSourceConditionGenerator:
@@ -384,6 +376,14 @@ class GANSource(GenericSource, g4.GateGANSource):
                 "allowed_values": ("auto", "cpu", "gpu"),
             },
         ),
+        "prefetch_batches": (
+            0,
+            {
+                "doc": "Number of batches generated in advance by the GAN, in a background thread, "
+                "while the current batch is tracked. With 0, the batches are generated when "
+                "needed and the tracking waits for the GAN. ",
+            },
+        ),
     }
 
     def __init__(self, *args, **kwargs):
@@ -395,6 +395,11 @@ class GANSource(GenericSource, g4.GateGANSource):
 
     def initialize(self, run_timing_intervals):
         # FIXME -> check input user_info
+        if self.direction.acceptance_angle.forced_direction_flag:
+            fatal(
+                f"The acceptance angle option 'forced_direction_flag' cannot be used "
+                f"with the GAN source {self.name}"
+            )
         # initialize the mother class generic source
         GenericSource.initialize(self, run_timing_intervals)
 
@@ -413,6 +418,12 @@ class GANSource(GenericSource, g4.GateGANSource):
         # set the parameters to the cpp side
         self.SetGeneratorInfo(gen.gan_info)
 
+    def prepare_output(self):
+        GenericSource.prepare_output(self)
+        # stop the background generation (if any)
+        if isinstance(self.generator, GANSourceDefaultGenerator):
+            self.generator.close()
+
     def set_default_generator(self):
         # non-conditional generator
         if self.cond_image is None:
@@ -474,6 +485,13 @@ class GANSourceDefaultGenerator:
 
     - 'copy_generated_particle_to_g4' function: copy all the particles (pos, dir, time, energy) to the cpp part.
 
+    - 'generate_batch' function: run the GAN to create a batch of particles. With the option
+    'prefetch_batches', it is called in a background thread (one per G4 thread), while G4 tracks
+    the current batch.
+
+    The time spent by the GAN (generation), by G4 waiting for a batch (wait) and by G4 tracking
+    the batches (tracking) are accumulated in 'timing'.
+
     """
 
     def __init__(self, user_info):
@@ -485,11 +503,15 @@ class GANSourceDefaultGenerator:
         self.keys_output = None
         self.gan_info = None
         self.gpu_mode = None
+        # background generation, one state per G4 thread
+        self.thread_data = {}
+        self.timing = Box(batches=0, generation=0, wait=0, tracking=0)
 
     def __getstate__(self):
         self.lock = None
         # self.gaga = None
         self.gan_info = None
+        self.thread_data = {}
         return self.__dict__
 
     def initialize(self):
@@ -645,8 +667,8 @@ class GANSourceDefaultGenerator:
         """
         Main function that will be called from the cpp side every time a batch
         of particles should be created.
-        Once created here, the particles are copied to cpp.
-        (Yes maybe the copy could be avoided, but I did not manage to do it)
+        Once created here, the particles are copied to cpp: every column of the
+        batch is contiguous, so it is copied at once.
         """
         # get the info
         g = self.gan_info
@@ -658,6 +680,25 @@ class GANSourceDefaultGenerator:
             start = time.time()
             print(f"Generate {n} particles from GAN ", end="")
 
+        # get the batch, generated now or in advance
+        columns = self.get_next_batch()
+
+        # copy to cpp
+        self.copy_generated_particle_to_g4(source, g, columns)
+
+        # verbose
+        if self.user_info.verbose_generator:
+            end = time.time()
+            print(f"in {end - start:0.1f} sec (GPU={g.params.current_gpu_mode})")
+
+    def generate_batch(self):
+        """
+        Generate a batch of particles with the GAN and move them backward if needed.
+        Return an array with one particle per row.
+        """
+        g = self.gan_info
+        n = self.user_info.batch_size
+
         # generate samples (this is the most time-consuming part)
         fake = gaga.generate_samples_non_cond(
             g.params,
@@ -675,15 +716,76 @@ class GANSourceDefaultGenerator:
         # move particle backward ?
         self.move_backward(g, fake)
 
-        # copy to cpp
-        self.copy_generated_particle_to_g4(source, g, fake)
+        return fake
 
-        # verbose
+    def generate_columns(self):
+        # generate a batch and transpose it: one contiguous row per key,
+        # given as is to the cpp side
+        start = time.time()
+        columns = np.ascontiguousarray(self.generate_batch().T, dtype=np.float64)
+        self.add_timing("generation", time.time() - start)
+        return columns
+
+    def get_next_batch(self):
+        """
+        Return the next batch of particles (one row per key). With prefetch_batches > 0,
+        the batches are generated in a background thread and kept in a queue, and the
+        next one is submitted as soon as one is taken.
+        """
+        tid = g4.G4GetThreadId()
+        if tid not in self.thread_data:
+            self.thread_data[tid] = Box(
+                executor=None, futures=deque(), end_of_last_batch=None
+            )
+        data = self.thread_data[tid]
+
+        # time spent by G4 to track the previous batch
+        start = time.time()
+        if data.end_of_last_batch is not None:
+            self.add_timing("tracking", start - data.end_of_last_batch)
+
+        depth = self.user_info.prefetch_batches
+        if depth < 1:
+            columns = self.generate_columns()
+        else:
+            if data.executor is None:
+                data.executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix=f"{self.user_info.name}_{tid}"
+                )
+            while len(data.futures) < depth:
+                data.futures.append(data.executor.submit(self.generate_columns))
+            columns = data.futures.popleft().result()
+            data.futures.append(data.executor.submit(self.generate_columns))
+
+        # time spent by G4 waiting for the batch
+        self.add_timing("wait", time.time() - start)
+        data.end_of_last_batch = time.time()
+        with self.lock:
+            self.timing.batches += 1
+        return columns
+
+    def add_timing(self, key, t):
+        with self.lock:
+            self.timing[key] += t
+
+    def close(self):
+        # stop the background threads, the batches not yet used are dropped
+        for data in self.thread_data.values():
+            for future in data.futures:
+                future.cancel()
+            data.futures.clear()
+            if data.executor is not None:
+                data.executor.shutdown(wait=True)
+                data.executor = None
         if self.user_info.verbose_generator:
-            end = time.time()
-            print(f"in {end - start:0.1f} sec (GPU={g.params.current_gpu_mode})")
+            t = self.timing
+            print(
+                f"GAN source {self.user_info.name}: {t.batches} batches, "
+                f"generation {t.generation:0.1f} sec, "
+                f"G4 waiting {t.wait:0.1f} sec, tracking {t.tracking:0.1f} sec"
+            )
 
-    def copy_generated_particle_to_g4(self, source, g, fake):
+    def copy_generated_particle_to_g4(self, source, g, columns):
         # get the index of from the GAN vector
         # (or some fixed values)
 
@@ -693,7 +795,7 @@ class GANSourceDefaultGenerator:
             dim = len(g.position_gan_index)
             for i in range(dim):
                 if g.position_use_index[i]:
-                    pos.append(fake[:, g.position_gan_index[i]])
+                    pos.append(columns[g.position_gan_index[i]])
                 else:
                     pos.append(g.position_gan_index[i])
             # copy to c++
@@ -707,7 +809,7 @@ class GANSourceDefaultGenerator:
             dim = len(g.direction_gan_index)
             for i in range(dim):
                 if g.direction_use_index[i]:
-                    dir.append(fake[:, g.direction_gan_index[i]])
+                    dir.append(columns[g.direction_gan_index[i]])
                 else:
                     dir.append(g.direction_gan_index[i])
             # copy to c++
@@ -718,17 +820,17 @@ class GANSourceDefaultGenerator:
         # energy
         if g.energy_is_set_by_GAN:
             # copy to c++
-            source.fEnergy = fake[:, g.energy_gan_index]
+            source.fEnergy = columns[g.energy_gan_index]
 
         # time
         if g.time_is_set_by_GAN:
             # copy to c++
-            source.fTime = fake[:, g.time_gan_index]
+            source.fTime = columns[g.time_gan_index]
 
         # weight
         if g.weight_is_set_by_GAN:
             # copy to c++
-            source.fWeight = fake[:, g.weight_gan_index]
+            source.fWeight = columns[g.weight_gan_index]
 
     def move_backward(self, g, fake):
         # move particle backward ?
@@ -768,6 +870,7 @@ class GANSourceDefaultPairsGenerator(GANSourceDefaultGenerator):
     def __getstate__(self):
         self.lock = None
         self.gan_info = None
+        self.thread_data = {}
         return self.__dict__
 
     def check_parameters(self, g):
@@ -810,56 +913,14 @@ class GANSourceDefaultPairsGenerator(GANSourceDefaultGenerator):
             self.fatal(f"you must provide 2 values for weight, while it was {dim}")
         g.weight_gan_index = [the_keys.index(ek[0]), the_keys.index(ek[1])]
 
-    def generator(self, source):
-        """
-        Main function that will be called from the cpp side every time a batch
-        of particles should be created.
-        Once created here, the particles are copied to cpp.
-        (Yes maybe the copy could be avoided, but I did not manage to do it)
-        """
-        # get the info
-        g = self.gan_info
-        n = self.user_info.batch_size
-        start = None
-
-        # verbose and timing ?
-        if self.user_info.verbose_generator:
-            start = time.time()
-            print(f"Generate {n} particles from GAN ", end="")
-
-        # generate samples (this is the most time-consuming part)
-        fake = gaga.generate_samples_non_cond(
-            g.params,
-            g.G,
-            n=n,
-            batch_size=n,
-            normalize=False,
-            to_numpy=True,
-            silence=True,
-        )
-
-        # consider the names of the output keys position/direction/energy/time/weight
-        self.get_output_keys()
-
-        # move particle backward ?
-        self.move_backward(g, fake)
-
-        # copy to cpp
-        self.copy_generated_particle_to_g4(source, g, fake)
-
-        # verbose
-        if self.user_info.verbose_generator:
-            end = time.time()
-            print(f"in {end - start:0.1f} sec (device={g.params.current_gpu_device})")
-
-    def copy_generated_particle_to_g4(self, source, g, fake):
+    def copy_generated_particle_to_g4(self, source, g, columns):
         # position
         if g.position_is_set_by_GAN:
             pos = []
             dim = len(g.position_gan_index)
             for i in range(dim):
                 if g.position_use_index[i]:
-                    pos.append(fake[:, g.position_gan_index[i]])
+                    pos.append(columns[g.position_gan_index[i]])
                 else:
                     pos.append(g.position_gan_index[i])
             # copy to c++
@@ -876,7 +937,7 @@ class GANSourceDefaultPairsGenerator(GANSourceDefaultGenerator):
             dim = len(g.direction_gan_index)
             for i in range(dim):
                 if g.direction_use_index[i]:
-                    dir.append(fake[:, g.direction_gan_index[i]])
+                    dir.append(columns[g.direction_gan_index[i]])
                 else:
                     dir.append(g.direction_gan_index[i])
             # copy to c++
@@ -890,20 +951,20 @@ class GANSourceDefaultPairsGenerator(GANSourceDefaultGenerator):
         # energy
         if g.energy_is_set_by_GAN:
             # copy to c++
-            source.fEnergy = fake[:, g.energy_gan_index[0]]
-            source.fEnergy2 = fake[:, g.energy_gan_index[1]]
+            source.fEnergy = columns[g.energy_gan_index[0]]
+            source.fEnergy2 = columns[g.energy_gan_index[1]]
 
         # time
         if g.time_is_set_by_GAN:
             # copy to c++
-            source.fTime = fake[:, g.time_gan_index[0]]
-            source.fTime2 = fake[:, g.time_gan_index[1]]
+            source.fTime = columns[g.time_gan_index[0]]
+            source.fTime2 = columns[g.time_gan_index[1]]
 
         # weight
         if g.weight_is_set_by_GAN:
             # copy to c++
-            source.fWeight = fake[:, g.weight_gan_index[0]]
-            source.fWeight2 = fake[:, g.weight_gan_index[1]]
+            source.fWeight = columns[g.weight_gan_index[0]]
+            source.fWeight2 = columns[g.weight_gan_index[1]]
 
     def move_backward(self, g, fake):
         # move particle backward ?
@@ -952,7 +1013,7 @@ class GANSourceConditionalGenerator(GANSourceDefaultGenerator):
         )
         return None
 
-    def generator(self, source):
+    def generate_batch(self):
         """
         Generate particles with a GAN, considering conditional vectors.
         """
@@ -960,12 +1021,6 @@ class GANSourceConditionalGenerator(GANSourceDefaultGenerator):
         # get the info
         g = self.gan_info
         n = self.user_info.batch_size
-        start = None
-
-        # verbose and timing ?
-        if self.user_info.verbose_generator:
-            start = time.time()
-            print(f"Generate {n} particles from GAN ", end="")
 
         # generate cond
         cond = self.generate_condition(n)
@@ -996,13 +1051,7 @@ class GANSourceConditionalGenerator(GANSourceDefaultGenerator):
         # move particle backward ?
         self.move_backward(g, fake)
 
-        # copy to cpp (g4)
-        self.copy_generated_particle_to_g4(source, g, fake)
-
-        # verbose
-        if self.user_info.verbose_generator:
-            end = time.time()
-            print(f"in {end - start:0.2f} sec (GPU={g.params.current_gpu_mode})")
+        return fake
 
 
 class GANSourceConditionalPairsGenerator(GANSourceDefaultPairsGenerator):
@@ -1024,6 +1073,7 @@ class GANSourceConditionalPairsGenerator(GANSourceDefaultPairsGenerator):
         self.gan = None
         self.generate_condition = None
         self.lock = None
+        self.thread_data = {}
         return self.__dict__
 
     def generate_condition(self, n):
@@ -1034,16 +1084,10 @@ class GANSourceConditionalPairsGenerator(GANSourceDefaultPairsGenerator):
         )
         return None
 
-    def generator(self, source):
+    def generate_batch(self):
         # get the info
         g = self.gan_info
         n = self.user_info.batch_size
-        start_time = None
-
-        # verbose and timing ?
-        if self.user_info.verbose_generator:
-            start_time = time.time()
-            print(f"Generate {n} particles from GAN ", end="")
 
         # generate cond
         cond = self.generate_condition(n)
@@ -1073,17 +1117,7 @@ class GANSourceConditionalPairsGenerator(GANSourceDefaultPairsGenerator):
         self.move_backward(g, fake)
 
         # back from torch to numpy
-        fake = fake.cpu().data.numpy()
-
-        # copy to cpp
-        self.copy_generated_particle_to_g4(source, g, fake)
-
-        # verbose
-        if self.user_info.verbose_generator:
-            end = time.time()
-            print(
-                f"in {end - start_time:0.1f} sec (device={g.params.current_gpu_device})"
-            )
+        return fake.cpu().data.numpy()
 
 
 process_cls(GANSource)
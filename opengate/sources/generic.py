@@ -1,5 +1,7 @@
 from box import Box
 from scipy.spatial.transform import Rotation
+import itk
+import numpy as np
 
 import opengate_core as g4
 from .base import (
@@ -9,7 +11,9 @@ from .base import (
     compute_cdf_and_total_yield,
 )
 from ..base import process_cls
-from ..utility import g4_units
+from ..image import get_info_from_image, update_image_py_to_cpp
+from ..image import compute_image_3D_alias_table
+from ..utility import g4_units, ensure_filename_is_str
 from ..exception import fatal, warning
 
 
@@ -24,10 +28,31 @@ def _generic_source_default_position():
             "translation": [0, 0, 0],
             "rotation": Rotation.identity().as_matrix(),
             "confine": None,
+            "image": None,
         }
     )
 
 
+def create_voxel_position_generator(image):
+    """
+    Create the voxelized position distribution (GateSPSVoxelsPosDistribution)
+    of an activity image, sampled with the alias table of the non-zero voxels.
+    The image is centered; the position translation and rotation of the
+    source are applied on the cpp side, like for the other position types.
+    The generator is read only during the simulation: it can be shared by
+    all threads and by several sources.
+    """
+    itk_image = itk.imread(ensure_filename_is_str(image))
+    info = get_info_from_image(itk_image)
+    pg = g4.GateSPSVoxelsPosDistribution()
+    update_image_py_to_cpp(itk_image, pg.cpp_edep_image, False)
+    pg.cpp_edep_image.set_spacing(info.spacing)
+    pg.cpp_edep_image.set_origin(-info.size / 2.0 * info.spacing + info.spacing / 2.0)
+    # the numpy arrays are referenced (not copied) on the cpp side
+    pg.SetAliasTable(*compute_image_3D_alias_table(itk_image))
+    return pg
+
+
 def _generic_source_default_direction():
     return Box(
         {
@@ -58,6 +83,7 @@ def _generic_source_default_aa():
             "normal_flag": False,
             "normal_vector": [0, 0, 1],
             "normal_tolerance": 3 * deg,
+            "forced_direction_flag": False,
         }
     )
 
@@ -183,6 +209,8 @@ class GenericSource(SourceBase, g4.GateGenericSource):
         self.__initcpp__()
         self.total_zero_events = 0
         self.total_skipped_events = 0
+        # voxelized position distribution (position type 'voxels')
+        self.voxel_position_generator = None
         if not self.user_info.particle.startswith("ion"):
             return
         words = self.user_info.particle.split(" ")
@@ -196,6 +224,28 @@ class GenericSource(SourceBase, g4.GateGenericSource):
     def __initcpp__(self):
         g4.GateGenericSource.__init__(self)
 
+    def __getstate__(self):
+        # the cpp voxelized distribution cannot be pickled. It is only removed
+        # from the pickled state: the cpp side still holds a pointer to it
+        return_dict = super().__getstate__().copy()
+        return_dict["voxel_position_generator"] = None
+        return return_dict
+
+    def initialize_voxel_position(self):
+        if self.position.image is None:
+            fatal(
+                f"The source {self.name} has a 'voxels' position: "
+                f"position.image must be set"
+            )
+        if self.position.confine:
+            fatal(f"The source {self.name}: confine cannot be used with 'voxels'")
+        # built only once (first thread), then shared by all threads
+        if self.voxel_position_generator is None:
+            self.voxel_position_generator = create_voxel_position_generator(
+                self.position.image
+            )
+        self.SetSharedVoxelPositionGenerator(self.voxel_position_generator)
+
     def initialize(self, run_timing_intervals):
         if not isinstance(self.position, Box):
             fatal(
@@ -279,6 +329,7 @@ class GenericSource(SourceBase, g4.GateGenericSource):
                 f"Cannot find the direction type {self.direction.type} for the source {self.name}.\n"
                 f"Available types are {l}"
             )
+        self.check_forced_direction()
 
         # logic for half life and user_particle_life_time
         if self.half_life > 0:
@@ -287,6 +338,10 @@ class GenericSource(SourceBase, g4.GateGenericSource):
             if self.user_particle_life_time < 0:
                 self.user_particle_life_time = 0
 
+        # voxelized position distribution
+        if self.position.type == "voxels":
+            self.initialize_voxel_position()
+
         # initialize
         SourceBase.initialize(self, run_timing_intervals)
 
@@ -310,6 +365,21 @@ class GenericSource(SourceBase, g4.GateGenericSource):
                     f"confine is used, while position.type is point ... really ?"
                 )
 
+    def check_forced_direction(self):
+        aa = self.direction.acceptance_angle
+        if not aa.forced_direction_flag or len(aa.volumes) == 0:
+            return
+        deg = g4_units.deg
+        full_sphere = np.allclose(self.direction.theta, [0, 180 * deg]) and np.allclose(
+            self.direction.phi, [0, 360 * deg]
+        )
+        if self.direction.type != "iso" or not full_sphere:
+            fatal(
+                f"In source {self.name}, the acceptance angle option 'forced_direction_flag' "
+                f"requires an isotropic direction (type 'iso') over the full sphere "
+                f"(theta in [0, 180] deg and phi in [0, 360] deg)."
+            )
+
     def check_ui_activity(self, ui):
         # FIXME: This should rather be a function than a method
         # FIXME: self actually holds the parameters n and activity, but the ones from ui are used here.
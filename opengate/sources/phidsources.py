@@ -21,6 +21,7 @@ pandas = LazyModuleLoader("pandas")
 class PhotonFromIonDecaySource(GenericSource):
     """
     Manage a set of GenericSource sub_sources, one for each nuclide gamma lines, for all daughters of the given ion.
+    With a 'voxels' position, all sub_sources share the voxelized distribution of the main source.
     Each sub_sources will have:
     - activity managed by a TAC, corresponding to the Bateman equation during the time range
     - spectrum energy line for isomeric transition
@@ -105,6 +106,12 @@ class PhotonFromIonDecaySource(GenericSource):
             self.check_ui_activity(sub_source)
             self.check_confine(sub_source)
 
+            # the voxelized position distribution (if any) is built once by
+            # the main source and shared (read only) by all sub_sources
+            if sub_source.position.type == "voxels":
+                sub_source.voxel_position_generator = self.voxel_position_generator
+                sub_source.initialize_voxel_position()
+
             # final initialize to cpp side
             sub_source.InitializeUserInfo(sub_source.user_info)
 
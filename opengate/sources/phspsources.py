@@ -1,6 +1,8 @@
 import uproot
 import numpy as np
 import numbers
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from scipy.spatial.transform import Rotation
 from box import Box
 import sys
@@ -15,19 +17,59 @@ class PhaseSpaceSourceGenerator:
     """
     Class that read phase space root file and extract position/direction/energy/weights of particles.
     Particles information will be copied to the c++ side to be used as a source
+
+    The float columns of a batch are decoded into a preallocated contiguous
+    float32 buffer of shape (8, batch_size) (position, direction, energy, weight),
+    which is given as is to the cpp side (no copy). With the prefetch option, the
+    next batch is decoded in a background thread, in a second buffer, while
+    the current one is simulated.
     """
 
     def __init__(self, tid):
         self.phsp_source = None
         self.tid = tid
         self.root_file = None
+        # memory-mapped phsp (structured numpy array, npy format)
+        self.phsp_array = None
         self.num_entries = 0
         self.cycle_count = 0
+        # range of entries used by this thread (all by default)
+        self.entry_first = 0
+        self.entry_last = 0
+        # keys read in the phsp, in the order of the rows of the buffers
+        self.float_keys = None
+        self.pdg_key = None
+        self.rotation_matrix = None
         # used during generation
+        self.buffers = None
+        self.pdg_buffers = None
+        self.buffer_index = 0
         self.batch = None
-        self.points = None
         self.current_index = 0
-        self.w = None
+        # prefetching thread
+        self.prefetch_executor = None
+        self.prefetch_future = None
+        # number of entries that this thread still has to claim from the
+        # shared cursor (None if it is not known in advance)
+        self.remaining_entries = None
+        # random generator for the batch_transform (if any)
+        self.rng = None
+
+    def __getstate__(self):
+        # opened files, buffers and thread cannot be pickled
+        state = self.__dict__.copy()
+        for k in [
+            "root_file",
+            "phsp_array",
+            "buffers",
+            "pdg_buffers",
+            "batch",
+            "prefetch_executor",
+            "prefetch_future",
+            "rng",
+        ]:
+            state[k] = None
+        return state
 
     def initialize(self, phsp_source):
         self.phsp_source = phsp_source
@@ -45,37 +87,145 @@ class PhaseSpaceSourceGenerator:
             # do nothing for master thread
             return
 
-        # open root file and get the first branch
-        # FIXME could have an option to select the branch
-        self.root_file = uproot.open(self.phsp_source.phsp_file)
-        branches = self.root_file.keys()
-        if len(branches) > 0:
-            self.root_file = self.root_file[branches[0]]
+        if str(self.phsp_source.phsp_file).endswith(".npy"):
+            # memory-mapped numpy phsp, the pages are shared by all threads
+            # and by all simulations reading the same file
+            self.phsp_array = np.load(self.phsp_source.phsp_file, mmap_mode="r")
+            if self.phsp_array.dtype.names is None:
+                fatal(
+                    f"PhaseSpaceSourceGenerator: the npy file {self.phsp_source.phsp_file} "
+                    f"must contain a structured array (one field per key). "
+                    f"See convert_phsp_root_to_npy."
+                )
+            keys = list(self.phsp_array.dtype.names)
+            self.num_entries = len(self.phsp_array)
         else:
-            fatal(
-                f"PhaseSpaceSourceGenerator: No usable branches in the root file {self.phsp_source.phsp_file}. Aborting."
-            )
-            sys.exit()
+            # open root file and get the first branch
+            # FIXME could have an option to select the branch
+            self.root_file = uproot.open(self.phsp_source.phsp_file)
+            branches = self.root_file.keys()
+            if len(branches) > 0:
+                self.root_file = self.root_file[branches[0]]
+            else:
+                fatal(
+                    f"PhaseSpaceSourceGenerator: No usable branches in the root file {self.phsp_source.phsp_file}. Aborting."
+                )
+                sys.exit()
+            keys = self.root_file.keys()
+            self.num_entries = int(self.root_file.num_entries)
 
-        self.num_entries = int(self.root_file.num_entries)
+        self.check_keys(keys)
+        self.allocate_buffers()
 
-        # initialize the index to start
-        tid = g4.G4GetThreadId()
-        self.current_index = self.get_entry_start(self.phsp_source.entry_start)
+        # initialize the index to start. When the simulation is split into
+        # subprocesses, each process only reads its own part of the phsp
+        self.entry_first, self.entry_last = self.phsp_source.get_process_slice(
+            self.num_entries
+        )
+        partition = self.phsp_source.entry_partition
+        if partition is None:
+            self.current_index = self.entry_first + self.get_entry_start(
+                self.phsp_source.entry_start
+            )
+        elif partition == "slices":
+            # one contiguous slice of the phsp per thread
+            self.entry_first, self.entry_last = self.get_entry_slice()
+            self.current_index = self.entry_first
 
         # initialize counters
         self.cycle_count = 0
 
+        # with the shared cursor, a thread only claims the entries it will use
+        # (one per event), so that a prefetched batch is never left unused
+        source = self.phsp_source
+        self.remaining_entries = None
+        if (
+            partition == "shared"
+            and source.n > 0
+            and not source.generate_until_next_primary
+            and source.batch_transform is None
+        ):
+            self.remaining_entries = int(source.n)
+
+        # the random generator of the transform is seeded by the Geant4
+        # engine of this thread, so the simulation is reproducible
+        if self.phsp_source.batch_transform is not None:
+            self.rng = np.random.default_rng(int(g4.G4UniformRand() * 2**62))
+
+        # start to read the first batch in the background
+        if self.phsp_source.prefetch:
+            self.prefetch_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{self.name}_{self.tid}"
+            )
+            self.prefetch_future = self.prefetch_executor.submit(
+                self.read_batch, self.buffer_index
+            )
+
+    def check_keys(self, keys):
+        source = self.phsp_source
+        self.float_keys = [
+            source.position_key_x,
+            source.position_key_y,
+            source.position_key_z,
+            source.direction_key_x,
+            source.direction_key_y,
+            source.direction_key_z,
+            source.energy_key,
+        ]
+        for key in self.float_keys:
+            if key not in keys:
+                fatal(f"PhaseSpaceSource: no key {key} in the phsp file.")
+
+        # set weight
+        if source.weight_key != "" and source.weight_key is not None:
+            if source.weight_key not in keys:
+                fatal(
+                    f"PhaseSpaceSource: no Weight key ({source.weight_key}) in the phsp file."
+                )
+            self.float_keys.append(source.weight_key)
+        else:
+            # weight = 1
+            self.float_keys.append(None)
+
+        # set particle type
+        self.pdg_key = source.PDGCode_key if source.PDGCode_key in keys else None
+        if source.particle == "" or source.particle is None:
+            # check if the keys for PDGCode are in the root file
+            if self.pdg_key is None:
+                fatal(
+                    f"PhaseSpaceSource: no PDGCode key ({source.PDGCode_key}) "
+                    f"in the phsp file and no source.particle"
+                )
+
+        if source.rotate_direction:
+            self.rotation_matrix = Rotation.from_matrix(
+                source.position.rotation
+            ).as_matrix()
+
+    def allocate_buffers(self):
+        # two buffers are needed to prefetch the next batch while the cpp side
+        # is using the current one
+        n = 2 if self.phsp_source.prefetch else 1
+        batch_size = self.phsp_source.batch_size
+        self.buffers = [
+            np.empty((len(self.float_keys), batch_size), dtype=np.float32)
+            for _ in range(n)
+        ]
+        if self.pdg_key is not None:
+            self.pdg_buffers = [np.empty(batch_size, dtype=np.int32) for _ in range(n)]
+
     def get_entry_start(self, entry_start):
+        # relative to the first entry of the process
+        num_entries = self.entry_last - self.entry_first
         if not g4.IsMultithreadedApplication():
             if not isinstance(entry_start, numbers.Number):
                 fatal("entry_start must be a simple number is mono-thread mode")
-            n = int(entry_start % self.num_entries)
-            if entry_start > self.num_entries:
+            n = int(entry_start % num_entries)
+            if entry_start > num_entries:
                 warning(
                     f"In source {self.name} "
                     f"entry_start = {entry_start} while "
-                    f"the phsp contains {self.num_entries}. "
+                    f"the phsp contains {num_entries}. "
                     f"We consider {n} instead (modulo)"
                 )
             return n
@@ -92,149 +242,224 @@ class PhaseSpaceSourceGenerator:
                 f"Error: entry_start must be a vector of length the nb of threads, "
                 f"but it is {len(entry_start)} instead of {n_threads}"
             )
-        n = int(entry_start[self.tid] % self.num_entries)
-        if entry_start[tid] > self.num_entries:
+        n = int(entry_start[self.tid] % num_entries)
+        if entry_start[tid] > num_entries:
             warning(
                 f"In source {self.name} "
                 f"entry_start = {entry_start} (thread {tid}) "
-                f"while the phsp contains {self.num_entries}. "
+                f"while the phsp contains {num_entries}. "
                 f"We consider {n} instead (modulo)"
             )
         return n
 
-    def generate(self, source, pid):
+    def get_entry_slice(self):
+        # the slices are taken within the entries of the process
+        if not g4.IsMultithreadedApplication():
+            return self.entry_first, self.entry_last
+        num_entries = self.entry_last - self.entry_first
+        n_threads = g4.GetNumberOfRunningWorkerThreads()
+        if num_entries < n_threads:
+            fatal(
+                f"In source {self.name}, the phsp contains {num_entries} "
+                f"entries, it cannot be split in {n_threads} slices"
+            )
+        first = self.entry_first + self.tid * num_entries // n_threads
+        last = self.entry_first + (self.tid + 1) * num_entries // n_threads
+        return first, last
+
+    def get_next_entries(self):
         """
-        Main function that will be called from the cpp side every time a batch
-        of particles should be created.
-        Once created here, the particles are copied to cpp.
-        (Yes maybe the copy could be avoided, but I did not manage to do it)
+        Return the first entry and the number of entries of the next batch.
         """
-
-        # read data from root tree
-        current_batch_size = source.batch_size
-        if self.current_index + source.batch_size > self.num_entries:
-            current_batch_size = self.num_entries - self.current_index
-
-        if source.verbose_batch:
-            print(
-                f"Thread {g4.G4GetThreadId()} "
-                f"generate {current_batch_size} starting {self.current_index} "
-                f" (phsp as n = {self.num_entries} entries)"
+        batch_size = self.phsp_source.batch_size
+        if self.phsp_source.entry_partition == "shared":
+            # the cursor is shared by all threads
+            if self.remaining_entries:
+                batch_size = min(batch_size, self.remaining_entries)
+            entry_start, n = self.phsp_source.get_next_shared_entries(
+                batch_size, self.entry_last - self.entry_first
             )
+            if self.remaining_entries:
+                self.remaining_entries -= n
+            return self.entry_first + entry_start, n
 
-        # read a batch of particles in the phsp (keep the reference)
-        self.batch = self.root_file.arrays(
-            entry_start=self.current_index,
-            entry_stop=self.current_index + current_batch_size,
-            library="numpy",
-        )
-        batch = self.batch
-
-        # ensure encoding is float32
-        for key in batch:
-            # Convert to float32 if the array contains floating-point values
-            if np.issubdtype(batch[key].dtype, np.floating):
-                batch[key] = batch[key].astype(np.float32)
-            else:
-                if np.issubdtype(batch[key].dtype, np.integer):
-                    batch[key] = batch[key].astype(np.int32)
+        current_batch_size = batch_size
+        if self.current_index + batch_size > self.entry_last:
+            current_batch_size = self.entry_last - self.current_index
+        entry_start = self.current_index
 
-        # update index if end of file
+        # update index if end of file (or end of the slice)
         self.current_index += current_batch_size
-        if self.current_index >= self.num_entries:
+        if self.current_index >= self.entry_last:
             self.cycle_count += 1
             warning(
-                f"End of the phase-space {self.num_entries} elements, "
+                f"End of the phase-space {self.entry_last - self.entry_first} elements, "
                 f"restart from beginning. Cycle count = {self.cycle_count}"
             )
-            self.current_index = 0
+            self.current_index = self.entry_first
+        return entry_start, current_batch_size
+
+    def read_columns(self, entry_start, entry_stop):
+        keys = [k for k in self.float_keys if k is not None]
+        if self.pdg_key is not None:
+            keys.append(self.pdg_key)
+        if self.phsp_array is not None:
+            return {k: self.phsp_array[k][entry_start:entry_stop] for k in keys}
+        return self.root_file.arrays(
+            keys, entry_start=entry_start, entry_stop=entry_stop, library="numpy"
+        )
 
-        # set particle type
-        if source.particle == "" or source.particle is None:
-            # check if the keys for PDGCode are in the root file
-            if source.PDGCode_key not in batch:
-                fatal(
-                    f"PhaseSpaceSource: no PDGCode key ({source.PDGCode_key}) "
-                    f"in the phsp file and no source.particle"
-                )
+    def read_batch(self, buffer_index):
+        """
+        Read the next batch of particles in the phsp and decode it into the
+        buffer buffer_index. May be called in the prefetching thread.
+        If a batch_transform is set, the batch is read again until at least
+        one particle is kept.
+        """
+        transform = self.phsp_source.batch_transform
+        # bound the number of batches without any kept particles
+        max_empty_batches = self.num_entries // self.phsp_source.batch_size + 2
+        for _ in range(max_empty_batches):
+            n = self.read_one_batch(buffer_index)
+            if transform is None:
+                return n
+            pdg = None
+            if self.pdg_key is not None:
+                pdg = self.pdg_buffers[buffer_index]
+            n = transform(self.buffers[buffer_index], pdg, n, self.rng)
+            if n > 0:
+                return n
+        fatal(
+            f"PhaseSpaceSource {self.name}: the batch_transform removed all "
+            f"the particles of the phase-space {self.phsp_source.phsp_file}"
+        )
+
+    def read_one_batch(self, buffer_index):
+        source = self.phsp_source
+
+        entry_start, current_batch_size = self.get_next_entries()
+
+        if source.verbose_batch:
+            print(
+                f"Thread {self.tid} "
+                f"generate {current_batch_size} starting {entry_start} "
+                f" (phsp as n = {self.num_entries} entries)"
+            )
+
+        # read a batch of particles in the phsp
+        data = self.read_columns(entry_start, entry_start + current_batch_size)
+
+        # copy in the float32 buffer (the conversion is done during the copy)
+        n = current_batch_size
+        buffer = self.buffers[buffer_index]
+        for row, key in enumerate(self.float_keys):
+            if key is None:
+                buffer[row, :n] = 1
+            else:
+                buffer[row, :n] = data[key]
+        if self.pdg_key is not None:
+            self.pdg_buffers[buffer_index][:n] = data[self.pdg_key]
 
         # if translate_position is set to True, the position
         # supplied will be added to the phsp file position
         if source.translate_position:
-            batch[source.position_key_x] += float(source.position.translation[0])
-            batch[source.position_key_y] += float(source.position.translation[1])
-            batch[source.position_key_z] += float(source.position.translation[2])
+            t = np.array(source.position.translation, dtype=np.float32)
+            buffer[0:3, :n] += t[:, np.newaxis]
 
         # direction is a rotation of the stored direction
         # if rotate_direction is set to True, the direction
         # in the root file will be rotated based on the supplied rotation matrix
         if source.rotate_direction:
-            # create point vectors
-            self.points = np.column_stack(
-                (
-                    batch[source.direction_key_x],
-                    batch[source.direction_key_y],
-                    batch[source.direction_key_z],
-                )
-            )
-            # create rotation matrix
-            r = Rotation.from_matrix(source.position.rotation)
             if source.verbose:
-                print("Rotation matrix: ", r.as_matrix())
-            # rotate vector with rotation matrix
-            points = r.apply(self.points)
-            # source.fDirectionX, source.fDirectionY, source.fDirectionZ = points.T
-            batch[source.direction_key_x] = points[:, 0].astype(np.float32)
-            batch[source.direction_key_y] = points[:, 1].astype(np.float32)
-            batch[source.direction_key_z] = points[:, 2].astype(np.float32)
+                print("Rotation matrix: ", self.rotation_matrix)
+            buffer[3:6, :n] = self.rotation_matrix @ buffer[3:6, :n]
 
-        # set weight
-        if source.weight_key != "" and source.weight_key is not None:
-            if source.weight_key not in batch:
-                fatal(
-                    f"PhaseSpaceSource: no Weight key ({source.weight_key}) in the phsp file."
+        return current_batch_size
+
+    def generate(self, source, pid):
+        """
+        Main function that will be called from the cpp side every time a batch
+        of particles should be created.
+        The buffer is shared with the cpp side (no copy).
+        """
+        if self.prefetch_future is not None:
+            # wait for the batch read in the background
+            current_batch_size = self.prefetch_future.result()
+            index = self.buffer_index
+            # the other buffer is not used anymore by the cpp side, fill it
+            # (unless this thread has already claimed all its entries)
+            self.buffer_index = 1 - index
+            self.prefetch_future = None
+            if self.remaining_entries != 0:
+                self.prefetch_future = self.prefetch_executor.submit(
+                    self.read_batch, self.buffer_index
                 )
         else:
-            self.w = np.ones(current_batch_size, dtype=np.float32)
-            batch[source.weight_key] = self.w.astype(np.float32)
-
-        # send to cpp
-        # set position
-        source.SetPositionXBatch(batch[source.position_key_x])
-        source.SetPositionYBatch(batch[source.position_key_y])
-        source.SetPositionZBatch(batch[source.position_key_z])
-
-        # set direction
-        source.SetDirectionXBatch(batch[source.direction_key_x])
-        source.SetDirectionYBatch(batch[source.direction_key_y])
-        source.SetDirectionZBatch(batch[source.direction_key_z])
-
-        # set energy
-        source.SetEnergyBatch(batch[source.energy_key])
-
-        # set PDGCode
-        if source.PDGCode_key in batch:
-            source.SetPDGCodeBatch(batch[source.PDGCode_key])
-        # set weight
-        source.SetWeightBatch(batch[source.weight_key])
+            index = self.buffer_index
+            current_batch_size = self.read_batch(index)
+
+        # send to cpp (keep the reference to the buffer)
+        self.batch = self.buffers[index]
+        source.SetBatch(self.batch)
+        if self.pdg_key is not None:
+            source.SetPDGCodeBatch(self.pdg_buffers[index])
 
         if source.verbose:
+            n = current_batch_size
             print("PhaseSpaceSourceGenerator: batch generated: ")
             print("particle name: ", source.particle)
-            if source.PDGCode_key in batch:
-                print("source.fPDGCode: ", batch[source.PDGCode_key])
-            print("source.fEnergy: ", batch[source.energy_key])
-            print("source.fWeight: ", batch[source.weight_key])
-            print("source.fPositionX: ", batch[source.position_key_x])
-            print("source.fPositionY: ", batch[source.position_key_y])
-            print("source.fPositionZ: ", batch[source.position_key_z])
-            print("source.fDirectionX: ", batch[source.direction_key_x])
-            print("source.fDirectionY: ", batch[source.direction_key_y])
-            print("source.fDirectionZ: ", batch[source.direction_key_z])
-            print("source.fEnergy dtype: ", batch[source.energy_key].dtype)
+            if self.pdg_key is not None:
+                print("source.fPDGCode: ", self.pdg_buffers[index][:n])
+            print("source.fEnergy: ", self.batch[6, :n])
+            print("source.fWeight: ", self.batch[7, :n])
+            print("source.fPositionX: ", self.batch[0, :n])
+            print("source.fPositionY: ", self.batch[1, :n])
+            print("source.fPositionZ: ", self.batch[2, :n])
+            print("source.fDirectionX: ", self.batch[3, :n])
+            print("source.fDirectionY: ", self.batch[4, :n])
+            print("source.fDirectionZ: ", self.batch[5, :n])
+            print("source.fEnergy dtype: ", self.batch.dtype)
 
         return current_batch_size
 
+    def close(self):
+        if self.prefetch_executor is not None:
+            self.prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self.prefetch_executor = None
+            self.prefetch_future = None
+
+
+def convert_phsp_root_to_npy(root_filename, npy_filename, keys=None, chunk_size=1e6):
+    """
+    Convert a root phase space into a npy file (structured array, one field per key)
+    that can be memory-mapped by the PhaseSpaceSource. The floating point values
+    are stored as float32 and the integers as int32, like they are used by the source.
+    The conversion is done by chunks, so the phsp does not need to fit in memory.
+    """
+    root_file = uproot.open(root_filename)
+    branches = root_file.keys()
+    if len(branches) == 0:
+        fatal(f"No usable branches in the root file {root_filename}.")
+    tree = root_file[branches[0]]
+    if keys is None:
+        keys = tree.keys()
+    dtypes = []
+    for k, t in tree.arrays(keys, entry_stop=1, library="np").items():
+        dtypes.append(
+            (k, np.float32 if np.issubdtype(t.dtype, np.floating) else np.int32)
+        )
+    phsp = np.lib.format.open_memmap(
+        npy_filename, mode="w+", dtype=dtypes, shape=(int(tree.num_entries),)
+    )
+    start = 0
+    for chunk in tree.iterate(keys, step_size=int(chunk_size), library="np"):
+        n = len(chunk[keys[0]])
+        for k in keys:
+            phsp[k][start : start + n] = chunk[k]
+        start += n
+    phsp.flush()
+    return npy_filename
+
 
 class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
     """
@@ -274,12 +499,32 @@ class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
     user_info_defaults = {
         "phsp_file": (
             None,
-            {"doc": "Filename of the phase-space file (root). This is required"},
+            {
+                "doc": "Filename of the phase-space file (root). This is required. "
+                "A npy file (structured array, see convert_phsp_root_to_npy) is memory-mapped instead of read. "
+            },
         ),
         "entry_start": (
             None,
             {
-                "doc": "Starting particle in the phase-space (for MT, provide a list of entries, one for each thread)"
+                "doc": "Starting particle in the phase-space (for MT, provide a list of entries, one for each thread). "
+                "Ignored if entry_partition is set."
+            },
+        ),
+        "entry_partition": (
+            None,
+            {
+                "doc": "How the entries of the phsp are distributed among threads. "
+                "None: each thread starts at its entry_start. "
+                "'slices': the phsp is split into one contiguous slice per thread. "
+                "'shared': the threads take the next batch from a cursor shared by all threads, "
+                "so each particle is used once before the phsp is recycled. "
+                "With 'shared' and a number of particles n, each thread only claims the "
+                "entries it simulates, also with prefetch. With an activity (or "
+                "generate_until_next_primary or a batch_transform) the number of entries "
+                "used by a thread is not known in advance: the end of its last batch "
+                "(and its prefetched batch) is not used.",
+                "allowed_values": (None, "slices", "shared"),
             },
         ),
         "particle": ("", {"doc": "FIXME"}),
@@ -309,6 +554,25 @@ class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
                 "doc": "Batch size to read the phsp",
             },
         ),
+        "prefetch": (
+            False,
+            {
+                "doc": "If True, the next batch is read and decoded in a background thread "
+                "while the current batch is simulated.",
+            },
+        ),
+        "batch_transform": (
+            None,
+            {
+                "doc": "Function f(batch, pdg, n, rng) applied to each batch read in the phsp, "
+                "e.g. to sample a control point of a treatment plan for each particle "
+                "(see ControlPointsApertureModel in contrib/linacs/elektaversa.py). "
+                "batch is the float32 array (8, batch_size) with the position, direction, energy "
+                "and weight of the n particles, pdg is the array of PDGCode (or None) and rng a "
+                "numpy random generator. The function modifies the arrays in place, moves the "
+                "particles to keep at the beginning, and returns their number.",
+            },
+        ),
         "position_key": (
             "PrePositionLocal",
             {
@@ -427,6 +691,18 @@ class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
         self.particle_generator = {}
         # number of entries in the phsp root file
         self.num_entries = None
+        # cursor shared by all threads (entry_partition = 'shared')
+        self.lock = None
+        self.shared_entry_index = 0
+        self.shared_cycle_count = 0
+        # set when the simulation is split into subprocesses (see Simulation.run)
+        self.process_index = 0
+        self.number_of_processes = 1
+
+    def __getstate__(self):
+        # the lock cannot be pickled, it is created again in initialize
+        self.lock = None
+        return super().__getstate__()
 
     def __initcpp__(self):
         g4.GatePhaseSpaceSource.__init__(self)
@@ -467,8 +743,14 @@ class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
                     "primary_lower_energy_threshold is defined"
                 )
 
+        # the master thread (or the single thread) creates the shared cursor
+        if self.lock is None:
+            self.lock = threading.Lock()
+            self.shared_entry_index = 0
+            self.shared_cycle_count = 0
+
         # if not set, initialize the entry_start to 0 or to a list for multithreading
-        if self.entry_start is None:
+        if self.entry_start is None and self.entry_partition is None:
             if not g4.IsMultithreadedApplication():
                 self.entry_start = 0
             else:
@@ -483,14 +765,55 @@ class PhaseSpaceSource(SourceBase, g4.GatePhaseSpaceSource):
         # initialize the generator (read the phsp file)
         self.particle_generator[tid].initialize(self)
 
-        # keep a copy of the number of entries
-        self.num_entries = self.particle_generator[tid].num_entries
+        # keep a copy of the number of entries (not read by the master thread)
+        if self.particle_generator[tid].num_entries > 0:
+            self.num_entries = self.particle_generator[tid].num_entries
 
         # set the function pointer to the cpp side
         self.SetGeneratorFunction(self.particle_generator[tid].generate)
 
+    def prepare_output(self):
+        # stop the prefetching threads
+        for generator in self.particle_generator.values():
+            generator.close()
+
+    def get_process_slice(self, num_entries):
+        """
+        Return the range of entries read by this process. When the simulation
+        is split into subprocesses, each process reads a disjoint part of the
+        phsp, so that the processes do not replay the same particles.
+        """
+        p = self.process_index
+        n_processes = self.number_of_processes
+        if num_entries < n_processes:
+            fatal(
+                f"In source {self.name}, the phsp contains {num_entries} "
+                f"entries, it cannot be split in {n_processes} processes"
+            )
+        return p * num_entries // n_processes, (p + 1) * num_entries // n_processes
+
+    def get_next_shared_entries(self, batch_size, num_entries):
+        """
+        Return the first entry and the number of entries of the next batch,
+        for any thread. The phsp is recycled when all entries have been used.
+        """
+        with self.lock:
+            entry_start = self.shared_entry_index
+            n = min(batch_size, num_entries - entry_start)
+            self.shared_entry_index += n
+            if self.shared_entry_index >= num_entries:
+                self.shared_cycle_count += 1
+                warning(
+                    f"End of the phase-space {num_entries} elements, "
+                    f"restart from beginning. Cycle count = {self.shared_cycle_count}"
+                )
+                self.shared_entry_index = 0
+        return entry_start, n
+
     @property
     def cycle_count(self):
+        if self.entry_partition == "shared":
+            return self.shared_cycle_count
         if not g4.IsMultithreadedApplication():
             tid = g4.G4GetThreadId()
             return self.particle_generator[tid].cycle_count
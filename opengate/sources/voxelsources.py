@@ -5,7 +5,7 @@ from .generic import GenericSource
 from ..image import (
     read_image_info,
     update_image_py_to_cpp,
-    compute_image_3D_CDF,
+    compute_image_3D_alias_table,
 )
 from ..utility import ensure_filename_is_str
 from ..base import process_cls
@@ -14,7 +14,7 @@ from ..base import process_cls
 class VoxelSource(GenericSource, g4.GateVoxelSource):
     """
     VoxelSource = 3D activity distribution.
-    Sampled with cumulative distribution functions.
+    Sampled with a flat alias table of the non-zero voxels.
     """
 
     # hints for IDE
@@ -36,6 +36,8 @@ class VoxelSource(GenericSource, g4.GateVoxelSource):
         super().__init__(self, *args, **kwargs)
         # the loaded image
         self.itk_image = None
+        # the alias table (probabilities, aliases, voxel indices)
+        self.alias_table_arrays = None
 
     def __initcpp__(self):
         g4.GateVoxelSource.__init__(self)
@@ -57,26 +59,30 @@ class VoxelSource(GenericSource, g4.GateVoxelSource):
         )
         pg.cpp_edep_image.set_origin(c)
 
-    def cumulative_distribution_functions(self):
+    def alias_table(self):
         """
-        Compute the Cumulative Distribution Function of the image
-        Composed of: CDF_Z = 1D, CDF_Y = 2D, CDF_X = 3D
+        Compute the alias table of the non-zero voxels of the image.
+        A voxel is then sampled in O(1). The numpy arrays are given
+        to the position generator without copy, so they are kept here.
         """
-        cdf_x, cdf_y, cdf_z = compute_image_3D_CDF(self.itk_image)
+        self.alias_table_arrays = compute_image_3D_alias_table(self.itk_image)
 
-        # set CDF to the position generator
+        # set the alias table to the position generator
         pg = self.GetSPSVoxelPosDistribution()
-        pg.SetCumulativeDistributionFunction(cdf_z, cdf_y, cdf_x)
+        pg.SetAliasTable(*self.alias_table_arrays)
 
     def initialize(self, run_timing_intervals):
-        # read source image
-        self.itk_image = itk.imread(ensure_filename_is_str(self.image))
+        # the position generator is shared by all threads:
+        # the image and the alias table are only computed once
+        if self.itk_image is None:
+            # read source image
+            self.itk_image = itk.imread(ensure_filename_is_str(self.image))
 
-        # compute position
-        self.set_transform_from_user_info()
+            # compute position
+            self.set_transform_from_user_info()
 
-        # create Cumulative Distribution Function
-        self.cumulative_distribution_functions()
+            # create the alias table to sample the voxels
+            self.alias_table()
 
         # FIXME -> check other option in position not used here
 
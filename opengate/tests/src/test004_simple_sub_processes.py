@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import uproot
+import time
+
+
+def create_simulation(name):
+    sim = gate.Simulation()
+    sim.random_seed = 123654
+    sim.number_of_threads = 1
+    sim.output_dir = paths.output / name
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    MeV = gate.g4_units.MeV
+
+    # world and waterbox
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+    waterbox = sim.add_volume("Box", "waterbox")
+    waterbox.size = [10 * cm, 10 * cm, 20 * cm]
+    waterbox.material = "G4_WATER"
+
+    # plane behind the waterbox (phase space)
+    plane = sim.add_volume("Box", "plane")
+    plane.size = [20 * cm, 20 * cm, 1 * mm]
+    plane.translation = [0, 0, 15 * cm]
+    plane.material = "G4_AIR"
+
+    # source
+    source = sim.add_source("GenericSource", "source")
+    source.particle = "gamma"
+    source.energy.mono = 2 * MeV
+    source.position.type = "disc"
+    source.position.radius = 5 * mm
+    source.position.translation = [0, 0, -15 * cm]
+    source.direction.type = "momentum"
+    source.direction.momentum = [0, 0, 1]
+    source.n = 50000
+
+    # dose, phase space and stats
+    dose = sim.add_actor("DoseActor", "dose")
+    dose.attached_to = waterbox
+    dose.size = [1, 1, 100]
+    dose.spacing = [100 * mm, 100 * mm, 2 * mm]
+    dose.edep_uncertainty.active = True
+    dose.output_filename = "test004_edep.mhd"
+
+    phsp = sim.add_actor("PhaseSpaceActor", "phsp")
+    phsp.attached_to = plane
+    phsp.attributes = ["KineticEnergy", "EventID"]
+    phsp.output_filename = "test004_phsp.root"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+    stats.track_types_flag = True
+
+    return sim
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test004")
+    n = 4
+
+    # reference: a single process
+    sim1 = create_simulation("single")
+    t = time.time()
+    sim1.run(start_new_process=True)
+    t1 = time.time() - t
+
+    # the same simulation split in n independent processes
+    sim2 = create_simulation("sub_processes")
+    t = time.time()
+    sim2.run(number_of_sub_processes=n)
+    t2 = time.time() - t
+    print(f"Time: {t1:.1f} s with 1 process, {t2:.1f} s with {n} processes")
+
+    stats1 = sim1.get_actor("stats")
+    stats2 = sim2.get_actor("stats")
+    print(stats2)
+    print()
+
+    # same number of events, close number of tracks and steps
+    c1 = stats1.counts
+    c2 = stats2.counts
+    is_ok = c2.events == c1.events and c2.runs == c1.runs
+    utility.print_test(is_ok, f"Events {c2.events} vs {c1.events}, runs {c2.runs}")
+    for k in ("tracks", "steps"):
+        d = abs(c2[k] - c1[k]) / c1[k]
+        b = d < 0.03
+        utility.print_test(b, f"{k} {c2[k]} vs {c1[k]} : {d * 100:.2f} %")
+        is_ok = is_ok and b
+
+    # merged dose (edep and uncertainty use the number of events of all processes)
+    dose1 = sim1.get_actor("dose")
+    dose2 = sim2.get_actor("dose")
+    data = dose2.user_output.edep_with_uncertainty.merged_data.data[0]
+    b = data.number_of_samples == c1.events
+    utility.print_test(
+        b, f"Number of samples in the merged edep: {data.number_of_samples}"
+    )
+    is_ok = is_ok and b
+    is_ok = (
+        utility.assert_images(
+            dose1.edep.get_output_path(),
+            dose2.edep.get_output_path(),
+            stats1,
+            tolerance=10,
+            ignore_value_data2=0,
+            axis="z",
+        )
+        and is_ok
+    )
+    is_ok = (
+        utility.assert_images(
+            dose1.edep_uncertainty.get_output_path(),
+            dose2.edep_uncertainty.get_output_path(),
+            stats1,
+            tolerance=10,
+            ignore_value_data2=0,
+            axis="z",
+        )
+        and is_ok
+    )
+
+    # the phase spaces of all processes are concatenated
+    n1 = uproot.open(sim1.get_actor("phsp").get_output_path())["phsp"].num_entries
+    n2 = uproot.open(sim2.get_actor("phsp").get_output_path())["phsp"].num_entries
+    d = abs(n2 - n1) / n1
+    b = d < 0.03
+    utility.print_test(b, f"Phase space entries {n2} vs {n1} : {d * 100:.2f} %")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
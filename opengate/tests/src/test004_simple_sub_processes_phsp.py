@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import numpy as np
+import uproot
+
+
+def create_phsp_file(filename, n):
+    # all particles are different: the energy is the index of the entry (in keV)
+    keV = gate.g4_units.keV
+    MeV = gate.g4_units.MeV
+    cm = gate.g4_units.cm
+    with uproot.recreate(filename) as f:
+        types = {
+            k: np.float32
+            for k in [
+                "PrePosition_X",
+                "PrePosition_Y",
+                "PrePosition_Z",
+                "PreDirection_X",
+                "PreDirection_Y",
+                "PreDirection_Z",
+                "KineticEnergy",
+            ]
+        }
+        f.mktree("phsp", types)
+        zeros = np.zeros(n, dtype=np.float32)
+        f["phsp"].extend(
+            {
+                "PrePosition_X": zeros,
+                "PrePosition_Y": zeros,
+                "PrePosition_Z": zeros - 10 * cm,
+                "PreDirection_X": zeros,
+                "PreDirection_Y": zeros,
+                "PreDirection_Z": zeros + 1,
+                "KineticEnergy": (np.arange(n) + 1) * keV / MeV,
+            }
+        )
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test004_phsp")
+    n = 2
+    n_entries = 1000
+
+    # input phase space
+    paths.output.mkdir(parents=True, exist_ok=True)
+    phsp_filename = paths.output / "test004_input_phsp.root"
+    create_phsp_file(phsp_filename, n_entries)
+
+    sim = gate.Simulation()
+    sim.random_seed = 123654
+    sim.number_of_threads = 1
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    keV = gate.g4_units.keV
+    MeV = gate.g4_units.MeV
+
+    # world and plane (vacuum, the particles are not modified)
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+    sim.world.material = "G4_Galactic"
+    plane = sim.add_volume("Box", "plane")
+    plane.size = [20 * cm, 20 * cm, 1 * mm]
+    plane.translation = [0, 0, 10 * cm]
+    plane.material = "G4_Galactic"
+
+    # source: all the entries of the phsp are used once
+    source = sim.add_source("PhaseSpaceSource", "phsp_source")
+    source.phsp_file = phsp_filename
+    source.position_key = "PrePosition"
+    source.direction_key = "PreDirection"
+    source.weight_key = ""
+    source.global_flag = True
+    source.particle = "gamma"
+    source.batch_size = 100
+    source.n = n_entries
+
+    # output phase space
+    phsp = sim.add_actor("PhaseSpaceActor", "phsp")
+    phsp.attached_to = plane
+    phsp.attributes = ["KineticEnergy", "EventID"]
+    phsp.output_filename = "test004_phsp.root"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    # the simulation is split in n independent processes
+    sim.run(number_of_sub_processes=n)
+    print(stats)
+
+    # each process reads its own part of the phsp: all entries are used once
+    with uproot.open(phsp.get_output_path()) as f:
+        data = f["phsp"].arrays(["KineticEnergy", "EventID"], library="np")
+    energies = np.round(data["KineticEnergy"] * MeV / keV).astype(int)
+    n_distinct = len(np.unique(energies))
+    is_ok = len(energies) == n_entries and n_distinct == n_entries
+    utility.print_test(
+        is_ok,
+        f"Distinct entries in the merged phsp: {n_distinct} / {len(energies)} "
+        f"(expected {n_entries})",
+    )
+
+    # the event ids of the processes are shifted during the merge
+    n_ids = len(np.unique(data["EventID"]))
+    b = n_ids == n_entries
+    utility.print_test(b, f"Distinct EventID in the merged phsp: {n_ids}")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test004")
+
+    # create the simulation
+    sim = gate.Simulation()
+    sim.number_of_threads = 2
+    sim.random_seed = 321654
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    keV = gate.g4_units.keV
+    Bq = gate.g4_units.Bq
+    sec = gate.g4_units.second
+
+    # world and waterbox
+    world = sim.world
+    world.size = [3 * m, 3 * m, 3 * m]
+    waterbox = sim.add_volume("Box", "waterbox")
+    waterbox.size = [40 * cm, 40 * cm, 40 * cm]
+    waterbox.translation = [0 * cm, 0 * cm, 25 * cm]
+    waterbox.material = "G4_WATER"
+
+    # source
+    source = sim.add_source("GenericSource", "source")
+    source.particle = "gamma"
+    source.energy.mono = 140 * keV
+    source.direction.type = "momentum"
+    source.direction.momentum = [0, 0, 1]
+    source.activity = 20000 * Bq / sim.number_of_threads
+
+    # two runs
+    sim.run_timing_intervals = [[0, 0.5 * sec], [0.5 * sec, 1 * sec]]
+
+    # dose actor with a filter
+    f = sim.add_filter("ParticleFilter", "electrons")
+    f.particle = "e-"
+    dose = sim.add_actor("DoseActor", "dose")
+    dose.attached_to = waterbox
+    dose.size = [40, 40, 40]
+    dose.spacing = [1 * cm, 1 * cm, 1 * cm]
+    dose.filters.append(f)
+    dose.output_filename = "test004_profiling_dose.mhd"
+
+    # stats with profiling
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+    stats.profiling = True
+
+    sim.run(start_new_process=True)
+    stats = sim.get_actor("stats")
+    print(stats)
+
+    counts = stats.counts
+    p = counts.profiling
+    print()
+
+    # the statistics actor is called for all steps, tracks and events
+    is_ok = True
+    c = p.actors.stats
+    for callback, n in [
+        ("SteppingAction", counts.steps),
+        ("PreUserTrackingAction", counts.tracks),
+        ("BeginOfEventAction", counts.events),
+        ("BeginOfRunAction", counts.runs),
+        ("EndOfRunAction", counts.runs),
+        ("EndOfSimulationWorkerAction", sim.number_of_threads),
+    ]:
+        b = c[callback].calls == n
+        utility.print_test(b, f"stats {callback}: {c[callback].calls} calls vs {n}")
+        is_ok = is_ok and b
+
+    # one GeneratePrimaries per event
+    n = p.sources.source.GeneratePrimaries.calls
+    b = n == counts.events
+    utility.print_test(b, f"source GeneratePrimaries: {n} calls vs {counts.events}")
+    is_ok = is_ok and b
+
+    # the dose actor is only called for the steps accepted by its filter
+    n_filter = p.filters.electrons.Accept.calls
+    n_dose = p.actors.dose.SteppingAction.calls
+    b = 0 < n_dose < n_filter < counts.steps
+    utility.print_test(
+        b,
+        f"filter Accept: {n_filter} calls, dose SteppingAction: {n_dose} calls "
+        f"(steps {counts.steps})",
+    )
+    is_ok = is_ok and b
+
+    # the cumulated times cannot exceed the time of all threads
+    total = sum(
+        c.duration
+        for names in p.values()
+        for callbacks in names.values()
+        for c in callbacks.values()
+    )
+    b = 0 < total < counts.duration * sim.number_of_threads
+    utility.print_test(
+        b,
+        f"Total profiled time {total / sec:.3f} s vs "
+        f"{counts.duration / sec:.3f} s x {sim.number_of_threads} threads",
+    )
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import numpy as np
+
+
+def simulate(n_sources, total_activity, duration):
+    sim = gate.Simulation()
+    sim.number_of_threads = 1
+    sim.random_seed = 123456
+    sim.output_dir = paths.output
+
+    # useful units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    MeV = gate.g4_units.MeV
+
+    # empty world: the cost of an event is mostly the source selection
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+    sim.world.material = "G4_Galactic"
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option4"
+
+    # many small sources, same total activity
+    for i in range(n_sources):
+        source = sim.add_source("GenericSource", f"s{i}")
+        source.particle = "geantino"
+        source.activity = total_activity / n_sources
+        source.position.type = "point"
+        source.position.translation = [0, 0, (i % 100) * 0.1 * cm]
+        source.direction.type = "iso"
+        source.energy.mono = 1 * MeV
+
+    sim.add_actor("SimulationStatisticsActor", "Stats")
+    sim.run_timing_intervals = [[0, duration]]
+
+    sim.run(start_new_process=True)
+    return sim.get_actor("Stats")
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test010")
+
+    Bq = gate.g4_units.Bq
+    sec = gate.g4_units.second
+    total_activity = 100000 * Bq
+    duration = 1 * sec
+    expected = total_activity / Bq * duration / sec
+
+    # the sources are kept in a min-heap by next time: the cost of an event
+    # must (almost) not depend on the number of sources
+    is_ok = True
+    costs = {}
+    print()
+    for n_sources in [10, 1000, 10000]:
+        stats = simulate(n_sources, total_activity, duration)
+        n = stats.counts.events
+        d = stats.counts.duration / sec
+        costs[n_sources] = d / n * 1e6
+        print(
+            f"{n_sources:6d} sources : {n} events in {d:.2f} s "
+            f"= {costs[n_sources]:.2f} us per event"
+        )
+        # Poisson: the number of events is around activity x duration
+        b = np.fabs(n - expected) < 5 * np.sqrt(expected)
+        utility.print_test(b, f"Number of events {n} vs expected {expected:.0f}")
+        is_ok = is_ok and b
+
+    # with a linear search, 10000 sources would be ~1000 times slower than 10
+    r = costs[10000] / costs[10]
+    b = r < 10
+    utility.print_test(b, f"Cost per event 10000 vs 10 sources: x{r:.2f}")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+import opengate.contrib.linacs.elektaversa as versa
+import opengate.contrib.linacs.dicomrtplan as rtplan
+from opengate.tests import utility
+from scipy.spatial.transform import Rotation
+from test019_linac_elekta_versa_with_mlc_rt_plan import calc_mlc_aperture
+import numpy as np
+import itk
+
+
+def create_phsp(filename, n, x_range, y_range, sad, rng):
+    # alpha from the target (gantry 0, isocenter at the origin), aiming
+    # uniformly at a rectangle of the isocenter plane
+    keys = [f"PrePosition_{c}" for c in "XYZ"]
+    keys += [f"PreDirection_{c}" for c in "XYZ"]
+    keys += ["KineticEnergy", "Weight"]
+    phsp = np.zeros(n, dtype=[(k, np.float32) for k in keys])
+    iso = np.column_stack(
+        [rng.uniform(*x_range, n), rng.uniform(*y_range, n), np.zeros(n)]
+    )
+    d = iso - np.array([0, 0, sad])
+    d /= np.linalg.norm(d, axis=1)[:, np.newaxis]
+    phsp["PrePosition_Z"] = sad
+    for i, c in enumerate("XYZ"):
+        phsp[f"PreDirection_{c}"] = d[:, i]
+    phsp["KineticEnergy"] = 1 * gate.g4_units.MeV
+    phsp["Weight"] = 1
+    np.save(filename, phsp)
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test019_linac")
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+    cm = gate.g4_units.cm
+
+    # choose one control point of the plan
+    rt_plan_parameters = rtplan.read(str(paths.data / "DICOM_RT_plan.dcm"))
+    rng = np.random.default_rng(123456)
+    mu = rt_plan_parameters["weight"]
+    cp = rng.choice(np.flatnonzero(mu > 0))
+    print("Control point: ", cp)
+    leaves = rt_plan_parameters["leaves"][cp]
+    jaws = [rt_plan_parameters["jaws 1"][cp], rt_plan_parameters["jaws 2"][cp]]
+
+    # phsp aiming around the aperture of this control point
+    sad = 1000 * mm
+    phsp_file = paths.output / "test019_aperture_model_phsp.npy"
+    create_phsp(
+        phsp_file,
+        2000000,
+        [np.min(leaves) - 1 * cm, np.max(leaves) + 1 * cm],
+        [jaws[0] - 1 * cm, jaws[1] + 1 * cm],
+        sad,
+        rng,
+    )
+
+    # simulation
+    sim = gate.Simulation()
+    sim.number_of_threads = 1
+    sim.output_dir = paths.output
+    sim.random_seed = 123456789
+    sim.world.size = [3 * m, 3 * m, 3 * m]
+    sim.world.material = "G4_Galactic"
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option3"
+    sim.physics_manager.set_production_cut("world", "all", 1000 * m)
+
+    # no linac head: the MLC and jaws are replaced by the aperture model
+    source = sim.add_source("PhaseSpaceSource", "phsp_source")
+    source.phsp_file = phsp_file
+    source.position_key = "PrePosition"
+    source.direction_key = "PreDirection"
+    source.particle = "alpha"
+    source.batch_size = 100000
+    source.n = 200000
+    model = versa.set_control_points_aperture_model(
+        source, rt_plan_parameters, cp_id=[cp]
+    )
+
+    # water slice at the isocenter, rotated like the gantry (as test019 rt_plan)
+    plane = sim.add_volume("Box", "water_plane")
+    plane.material = "G4_WATER"
+    plane.size = [0.4 * m, 0.4 * m, 2 * cm]
+    rot = Rotation.from_euler("y", rt_plan_parameters["gantry angle"][cp], degrees=True)
+    plane.rotation = rot.as_matrix()
+    plane.translation = rot.apply([0, 0, -1 * cm])
+    dose = sim.add_actor("DoseActor", "dose_water_slice")
+    dose.attached_to = plane
+    dose.edep.output_filename = "dose_actor_versa_aperture_model.mhd"
+    dose.spacing = [1.2 * mm, 1.2 * mm, 2 * cm]
+    dose.size = [int(plane.size[0] / 1.2), int(plane.size[1] / 1.2), 1]
+    dose.hit_type = "random"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+    sim.run()
+    print(stats)
+
+    # the irradiated area is the aperture of the control point
+    arr = itk.GetArrayFromImage(dose.edep.image)
+    simulated_area = np.count_nonzero(arr) * 1.44
+    theoretical_area = calc_mlc_aperture(np.copy(leaves), jaws)
+    diff = (simulated_area - theoretical_area) / theoretical_area
+    print(f"Area theoretical / simulated: {theoretical_area} / {simulated_area} mm2")
+    is_ok = np.fabs(diff) < 0.1
+    utility.print_test(is_ok, f"Aperture area difference: {diff * 100:.2f}%")
+    b = stats.counts.events == source.n and stats.counts.runs == 1
+    utility.print_test(b, f"Events {stats.counts.events}, runs {stats.counts.runs}")
+    is_ok = is_ok and b
+
+    # the control points of a full arc are sampled according to the MU
+    model = versa.ControlPointsApertureModel(rt_plan_parameters)
+    n = 1000000
+    counts = np.bincount(model.sample_control_points(n, rng), minlength=len(mu))
+    p = mu / np.sum(mu)
+    b = np.all(np.fabs(counts - n * p) <= 5 * np.sqrt(n * p * (1 - p)) + 1)
+    utility.print_test(b, "Control points sampled according to the MU")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import test019_linac_phsp_helpers as test019
+
+if __name__ == "__main__":
+    # create sim
+    sim = gate.Simulation()
+    test019.create_simu_test019_phsp_source(sim, "_phsp_src_mt_partition")
+
+    # make it MT
+    sim.number_of_threads = nt = 2
+
+    # each thread reads its own contiguous slice of the phsp
+    sl = sim.source_manager.get_source("phsp_source_local")
+    sl.n /= nt
+    sl.entry_partition = "slices"
+    sl.batch_size = sl.n / 4
+    sl.verbose_batch = False
+
+    # the threads take the next batch from a cursor shared by all threads
+    sg = sim.source_manager.get_source("phsp_source_global")
+    sg.n /= nt
+    sg.entry_partition = "shared"
+    sg.prefetch = True
+    sg.batch_size = sg.n / 4
+    sg.verbose_batch = False
+
+    # start simulation
+    sim.run()
+
+    # analyse: same particles as the reference phsp
+    is_ok = test019.analyse_test019_phsp_source(sim)
+
+    utility.test_ok(is_ok)
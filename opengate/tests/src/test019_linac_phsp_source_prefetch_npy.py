@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from opengate.sources.phspsources import convert_phsp_root_to_npy
+import test019_linac_phsp_helpers as test019
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, "", "test019")
+
+    # create sim
+    sim = gate.Simulation()
+    test019.create_simu_test019_phsp_source(sim, "_phsp_src_prefetch")
+
+    # the local source reads the root file in a background thread
+    # (small batches, so that the two buffers are used several times)
+    sl = sim.source_manager.get_source("phsp_source_local")
+    sl.prefetch = True
+    sl.batch_size = sl.n / 7
+    sl.verbose_batch = False
+
+    # the global source reads the same phsp, converted to a memory-mapped npy file
+    sg = sim.source_manager.get_source("phsp_source_global")
+    sg.phsp_file = convert_phsp_root_to_npy(
+        sg.phsp_file, paths.output / "test019_hits.npy", chunk_size=sg.n / 3
+    )
+    sg.prefetch = True
+    sg.batch_size = sg.n / 5
+    sg.verbose_batch = False
+
+    # start simulation
+    sim.run()
+
+    # analyse: same as the reference root phsp
+    is_ok = test019.analyse_test019_phsp_source(sim)
+
+    utility.test_ok(is_ok)
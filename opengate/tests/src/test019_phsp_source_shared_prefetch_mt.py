@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from test004_simple_sub_processes_phsp import create_phsp_file
+import numpy as np
+import uproot
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(
+        __file__, output_folder="test019_shared_prefetch"
+    )
+    nt = 4
+    n_entries = 1000
+
+    # input phase space: the energy of each entry is its index (in keV)
+    paths.output.mkdir(parents=True, exist_ok=True)
+    phsp_filename = paths.output / "test019_input_phsp.root"
+    create_phsp_file(phsp_filename, n_entries)
+
+    sim = gate.Simulation()
+    sim.random_seed = 123654
+    sim.number_of_threads = nt
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    keV = gate.g4_units.keV
+    MeV = gate.g4_units.MeV
+
+    # world and plane (vacuum, the particles are not modified)
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+    sim.world.material = "G4_Galactic"
+    plane = sim.add_volume("Box", "plane")
+    plane.size = [20 * cm, 20 * cm, 1 * mm]
+    plane.translation = [0, 0, 10 * cm]
+    plane.material = "G4_Galactic"
+
+    # the threads take the next batch from the shared cursor, and the next
+    # batch is prefetched. The batch size does not divide the number of
+    # particles per thread, so the last batch of each thread is smaller.
+    source = sim.add_source("PhaseSpaceSource", "phsp_source")
+    source.phsp_file = phsp_filename
+    source.position_key = "PrePosition"
+    source.direction_key = "PreDirection"
+    source.weight_key = ""
+    source.global_flag = True
+    source.particle = "gamma"
+    source.entry_partition = "shared"
+    source.prefetch = True
+    source.batch_size = 30
+    source.n = n_entries / nt
+
+    # output phase space
+    phsp = sim.add_actor("PhaseSpaceActor", "phsp")
+    phsp.attached_to = plane
+    phsp.attributes = ["KineticEnergy"]
+    phsp.output_filename = "test019_shared_prefetch.root"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    sim.run()
+    print(stats)
+
+    # every entry of the phsp is used exactly once
+    with uproot.open(phsp.get_output_path()) as f:
+        energies = f["phsp"]["KineticEnergy"].array(library="np")
+    indices = np.round(energies * MeV / keV).astype(int) - 1
+    counts = np.bincount(indices, minlength=n_entries)
+    is_ok = len(counts) == n_entries and np.all(counts == 1)
+    utility.print_test(
+        is_ok,
+        f"Entries used once: {np.sum(counts == 1)} / {n_entries}, "
+        f"not used: {np.sum(counts == 0)}, used several times: {np.sum(counts > 1)}",
+    )
+
+    utility.test_ok(is_ok)
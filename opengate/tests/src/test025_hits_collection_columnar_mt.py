@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from opengate.actors.digitizers import get_root_columns_folder
+import test025_hits_collection_helpers as t025
+import uproot
+import numpy as np
+
+
+def simulate(backend):
+    sim = t025.create_simulation(4)
+    sim.random_seed = 321654
+    sim.run_timing_intervals = [[0, 1 * gate.g4_units.second]]
+
+    # same hits, written with the Geant4 ntuples or as column blocks
+    hc = sim.get_actor("Hits")
+    hc.output_filename = f"test025_{backend}_MT.root"
+    hc.root_flush_size = 100000
+    hc.root_output_backend = backend
+    hc2 = sim.get_actor("Hits2")
+    hc2.output_filename = f"test025_hits2_{backend}_MT.root"
+    hc2.root_flush_size = 100000
+    hc2.root_output_backend = backend
+
+    sim.run(start_new_process=True)
+    return sim.get_actor("Stats"), hc
+
+
+if __name__ == "__main__":
+    is_ok = True
+    trees = {}
+    print()
+    for backend in ["geant4", "columnar"]:
+        stats, hc = simulate(backend)
+        tree = uproot.open(hc.get_output_path())["Hits"]
+        n = int(tree.num_entries)
+        duration = stats.counts.duration / gate.g4_units.s
+        print(
+            f"root_output_backend = {backend:8s} : {n} hits in {duration:.2f} s "
+            f"({n / duration:.0f} hits/s, {stats.counts.events} events)"
+        )
+        trees[backend] = tree.arrays(library="np")
+
+        # the column files are removed once converted
+        b = not get_root_columns_folder(hc.get_output_path()).exists()
+        utility.print_test(b, f"No remaining column files for {backend}")
+        is_ok = is_ok and b
+
+    # same seed: same hits, but not in the same order (the threads are
+    # written one after the other in the columnar output)
+    ref = trees["geant4"]
+    b = list(ref.keys()) == list(trees["columnar"].keys())
+    utility.print_test(b, f"Same branches {list(trees['columnar'].keys())}")
+    is_ok = is_ok and b
+    for k in ref.keys():
+        b = np.array_equal(np.sort(ref[k]), np.sort(trees["columnar"][k]))
+        utility.print_test(b, f"Same values for branch {k}")
+        is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
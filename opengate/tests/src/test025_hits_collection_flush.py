@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import test025_hits_collection_helpers as t025
+import uproot
+import numpy as np
+
+
+def simulate(root_flush_size):
+    sim = t025.create_simulation(1)
+    sim.random_seed = 321654
+    sim.run_timing_intervals = [[0, 1 * gate.g4_units.second]]
+
+    # same hits, written every event or in large blocks
+    hc = sim.get_actor("Hits")
+    hc.output_filename = f"test025_flush_{root_flush_size}.root"
+    hc.root_flush_size = root_flush_size
+    hc2 = sim.get_actor("Hits2")
+    hc2.output_filename = f"test025_hits2_flush_{root_flush_size}.root"
+    hc2.root_flush_size = root_flush_size
+
+    sim.run(start_new_process=True)
+    return sim.get_actor("Stats"), hc
+
+
+if __name__ == "__main__":
+    is_ok = True
+    trees = {}
+    print()
+    for flush_size in [0, 100000]:
+        stats, hc = simulate(flush_size)
+        tree = uproot.open(hc.get_output_path())["Hits"]
+        n = int(tree.num_entries)
+        duration = stats.counts.duration / gate.g4_units.s
+        print(
+            f"root_flush_size = {flush_size:7d} : {n} hits in {duration:.2f} s "
+            f"({n / duration:.0f} hits/s, {stats.counts.events} events)"
+        )
+        trees[flush_size] = tree.arrays(library="np")
+
+    # same seed: the root files must be strictly identical
+    ref = trees[0]
+    for k in ref.keys():
+        b = np.array_equal(ref[k], trees[100000][k])
+        utility.print_test(b, f"Same branch {k}")
+        is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import test025_hits_collection_helpers as t025
+from opengate.tests import utility
+from opengate.actors.digitizers import get_root_files_per_thread
+
+if __name__ == "__main__":
+    sim = t025.create_simulation(3)
+
+    # each thread writes its own root files, merged at the end
+    for name in ["Hits", "Hits2"]:
+        hc = sim.get_actor(name)
+        hc.output_filename = f"test025_{name}_per_thread.root"
+        hc.root_output_per_thread = True
+    sim.run()
+
+    # the thread files have been merged and removed
+    is_ok = True
+    for name in ["Hits", "Hits2"]:
+        f = sim.get_actor(name).get_output_path()
+        thread_files = get_root_files_per_thread(f)
+        b = f.exists() and len(thread_files) == 0
+        utility.print_test(
+            b, f"Merged file {f} (remaining thread files: {thread_files})"
+        )
+        is_ok = is_ok and b
+
+    # same results as the merged root output
+    t025.test_simulation_results(sim)
+    utility.test_ok(is_ok)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import numpy as np
+import itk
+
+
+def simulate(number_of_threads, n):
+    sim = gate.Simulation()
+    sim.number_of_threads = number_of_threads
+    sim.random_seed = 123456
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    keV = gate.g4_units.keV
+    deg = gate.g4_units.deg
+
+    # a bare crystal: (almost) all events give a single in the windows
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+    sim.world.material = "G4_Galactic"
+    crystal = sim.add_volume("Box", "crystal")
+    crystal.size = [50 * cm, 50 * cm, 1 * cm]
+    crystal.translation = [0, 0, -20 * cm]
+    crystal.material = "G4_SODIUM_IODIDE"
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option4"
+    sim.physics_manager.set_production_cut("world", "all", 1 * mm)
+
+    source = sim.add_source("GenericSource", "source")
+    source.particle = "gamma"
+    source.energy.mono = 140.5 * keV
+    source.position.type = "point"
+    source.direction.type = "iso"
+    source.direction.theta = [0, 40 * deg]
+    source.direction.phi = [0, 360 * deg]
+    source.n = n / number_of_threads
+
+    # digitizer with several energy windows
+    hc = sim.add_actor("DigitizerHitsCollectionActor", "Hits")
+    hc.attached_to = crystal
+    hc.output_filename = None
+    hc.attributes = [
+        "PostPosition",
+        "TotalEnergyDeposit",
+        "PreStepUniqueVolumeID",
+        "GlobalTime",
+    ]
+    sc = sim.add_actor("DigitizerAdderActor", "Singles")
+    sc.attached_to = crystal
+    sc.input_digi_collection = hc.name
+    sc.policy = "EnergyWinnerPosition"
+    sc.output_filename = None
+    cc = sim.add_actor("DigitizerEnergyWindowsActor", "EnergyWindows")
+    cc.attached_to = crystal
+    cc.input_digi_collection = sc.name
+    cc.output_filename = None
+    cc.channels = [
+        {"name": "low", "min": 0 * keV, "max": 114 * keV},
+        {"name": "scatter", "min": 114 * keV, "max": 126 * keV},
+        {"name": "peak", "min": 126 * keV, "max": 154.55 * keV},
+    ]
+    proj = sim.add_actor("DigitizerProjectionActor", "Projection")
+    proj.attached_to = crystal
+    proj.input_digi_collections = ["low", "scatter", "peak"]
+    proj.spacing = [4 * mm, 4 * mm]
+    proj.size = [128, 128]
+    proj.output_filename = f"test028_proj_benchmark_{number_of_threads}.mhd"
+
+    sim.add_actor("SimulationStatisticsActor", "Stats")
+
+    sim.run(start_new_process=True)
+    stats = sim.get_actor("Stats")
+    img = itk.imread(sim.get_actor("Projection").get_output_path())
+    return stats, itk.array_from_image(img)
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test028")
+
+    # the projection of each thread is accumulated without any lock and
+    # merged at the end of the run
+    sec = gate.g4_units.second
+    n = 2e6
+    is_ok = True
+    counts = {}
+    print()
+    for nt in [1, 8]:
+        stats, arr = simulate(nt, n)
+        events = stats.counts.events
+        d = stats.counts.duration / sec
+        counts[nt] = arr.sum(axis=(1, 2)) / events
+        print(
+            f"{nt:3d} threads : {events} events in {d:.2f} s "
+            f"= {events / d:.0f} events/s, counts per event and window {counts[nt]}"
+        )
+        b = events == n
+        utility.print_test(b, f"Number of events {events}")
+        is_ok = is_ok and b
+
+    # same number of counts per event in each window
+    for c1, c8 in zip(counts[1], counts[8]):
+        sigma = np.sqrt(c1 / n + c8 / n)
+        b = np.fabs(c1 - c8) < 5 * sigma
+        utility.print_test(b, f"Counts per event 1 vs 8 threads: {c1:.5f} {c8:.5f}")
+        is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
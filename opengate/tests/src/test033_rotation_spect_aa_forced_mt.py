@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+import test033_rotation_spect_aa_helpers as test033
+from opengate.tests import utility
+
+if __name__ == "__main__":
+    # create the simulation
+    sim = gate.Simulation()
+    sources = test033.create_test(sim, nb_thread=2)
+
+    # AA mode: the directions are sampled toward the heads (weighted)
+    for source in sources:
+        source.direction.acceptance_angle.skip_policy = "SkipEvents"
+        source.direction.acceptance_angle.forced_direction_flag = True
+
+    # the weights are needed in the projections
+    proj_filenames = []
+    for i in [1, 2]:
+        hc = sim.get_actor(f"Hits_spect{i}_crystal")
+        hc.attributes.append("Weight")
+        proj = sim.get_actor(f"Projection_spect{i}_crystal")
+        proj.use_weights = True
+        proj.output_filename = f"test033_proj_forced_{i}.mhd"
+        proj_filenames.append(proj.output_filename)
+
+    # go
+    sim.run()
+
+    # Same checks as the rejection method (test033_rotation_spect_aa_se_mt):
+    # - the emissions outside the cones are skipped: their number is drawn at
+    #   once for each event (geometric distribution), it follows the same
+    #   distribution as the number of rejected directions (ref 5913808, 1%)
+    # - the events + skipped events are the same as the reference without AA
+    #   (i.e. the time of the events follows the activity)
+    # - the weighted projections are the same as the reference ones
+    is_ok = test033.evaluate_test(sim, sources, 10, 5913808, proj_filenames)
+
+    utility.test_ok(is_ok)
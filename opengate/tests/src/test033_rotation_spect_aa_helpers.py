@@ -132,7 +132,9 @@ def create_test(sim, nb_thread=1):
     return sources
 
 
-def evaluate_test(sim, sources, itol, ref_skipped):
+def evaluate_test(sim, sources, itol, ref_skipped, proj_filenames=None):
+    if proj_filenames is None:
+        proj_filenames = ["test033_proj_1.mhd", "test033_proj_2.mhd"]
     stats = sim.get_actor("Stats")
     print(stats)
     # ref with _noaa
@@ -182,7 +184,7 @@ def evaluate_test(sim, sources, itol, ref_skipped):
     is_ok = (
         utility.assert_images(
             paths.output_ref / "test033_proj_1.mhd",
-            paths.output / "test033_proj_1.mhd",
+            paths.output / proj_filenames[0],
             stats,
             tolerance=68,
             axis="x",
@@ -195,7 +197,7 @@ def evaluate_test(sim, sources, itol, ref_skipped):
     is_ok = (
         utility.assert_images(
             paths.output_ref / "test033_proj_2.mhd",
-            paths.output / "test033_proj_2.mhd",
+            paths.output / proj_filenames[1],
             stats,
             tolerance=75,
             axis="x",
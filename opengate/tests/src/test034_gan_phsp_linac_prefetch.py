@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+
+
+def simulate(paths, prefetch_batches):
+    # create the simulation
+    sim = gate.Simulation()
+
+    # main options
+    sim.g4_verbose = False
+    sim.visu = False
+    sim.number_of_threads = 1
+    sim.random_seed = 321654
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+    cm = gate.g4_units.cm
+
+    #  adapt world size
+    world = sim.world
+    world.size = [2 * m, 2 * m, 2 * m]
+    world.material = "G4_AIR"
+
+    # add a waterbox
+    waterbox = sim.add_volume("Box", "waterbox")
+    waterbox.size = [30 * cm, 30 * cm, 30 * cm]
+    waterbox.translation = [0 * cm, 0 * cm, 52.2 * cm]
+    waterbox.material = "G4_WATER"
+
+    # origin of the coordinate system of the GAN source
+    plane = sim.add_volume("Box", "phase_space_plane")
+    plane.material = "G4_AIR"
+    plane.size = [3 * cm, 4 * cm, 5 * cm]
+
+    # GAN source, the batches are generated while the previous ones are tracked
+    gsource = sim.add_source("GANSource", "gaga")
+    gsource.particle = "gamma"
+    gsource.attached_to = plane.name
+    gsource.n = 2e5
+    gsource.pth_filename = paths.data / "003_v3_40k.pth"
+    gsource.position_keys = ["X", "Y", 271.1 * mm]
+    gsource.direction_keys = ["dX", "dY", "dZ"]
+    gsource.energy_key = "Ekine"
+    gsource.weight_key = None
+    gsource.time_key = None
+    gsource.batch_size = 2e4
+    gsource.prefetch_batches = prefetch_batches
+    gsource.verbose_generator = True
+    gsource.gpu_mode = utility.get_gpu_mode_for_tests()
+
+    # stats
+    stats = sim.add_actor("SimulationStatisticsActor", "Stats")
+    stats.track_types_flag = True
+
+    # phys
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option4"
+    sim.physics_manager.set_production_cut("world", "all", 1000 * m)
+    sim.physics_manager.set_production_cut("waterbox", "all", 1 * mm)
+
+    # go
+    sim.run(start_new_process=True)
+
+    return stats
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(
+        __file__, "gate_test034_gan_phsp_linac", "test034"
+    )
+
+    # the same simulation, with the GAN run in the tracking thread or in advance
+    stats_ref = simulate(paths, 0)
+    stats = simulate(paths, 2)
+    print(stats)
+
+    # the particles are the same: the batches are generated in the same order
+    is_ok = utility.assert_stats(stats, stats_ref, 0.05)
+
+    utility.test_ok(is_ok)
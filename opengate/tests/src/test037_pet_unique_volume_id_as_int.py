@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+import test037_pet_hits_singles_helpers as t37
+from opengate.tests import utility
+import numpy as np
+import uproot
+
+
+def group_edep(event_ids, volume_ids, edep):
+    # sum of the edep per event and per volume, sorted by key
+    keys = [f"{e} {v}" for e, v in zip(event_ids, volume_ids)]
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, np.bincount(inverse, weights=edep)
+
+
+def truncate_id(volume_id, depth):
+    # string ID up to the given depth: "name-0_0_1_2" -> "0_0_1" (depth 2)
+    copy_numbers = volume_id.split("-")[-1].split("_")
+    return "_".join(copy_numbers[: depth + 1])
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, "gate_test037_pet", "test037")
+
+    # create the simulation
+    sim = gate.Simulation()
+    crystal = t37.create_pet_simulation(sim, paths, create_mat=True)
+    stack = sim.volume_manager.volumes["pet_stack"]
+
+    # digitizer hits, with the string and the integer volume IDs
+    hc = sim.add_actor("DigitizerHitsCollectionActor", "Hits")
+    hc.attached_to = crystal.name
+    hc.authorize_repeated_volumes = True
+    hc.output_filename = "test037_uid_as_int.root"
+    hc.attributes = [
+        "EventID",
+        "PostPosition",
+        "TotalEnergyDeposit",
+        "PreStepUniqueVolumeID",
+        "PreStepUniqueVolumeIDAsInt",
+        "GlobalTime",
+    ]
+
+    # adder: grouped per crystal (with the integer IDs)
+    sc = sim.add_actor("DigitizerAdderActor", "Singles")
+    sc.authorize_repeated_volumes = True
+    sc.output_filename = "test037_uid_as_int.root"
+    sc.input_digi_collection = "Hits"
+    sc.policy = "EnergyWeightedCentroidPosition"
+
+    # readout: grouped per stack
+    ro = sim.add_actor("DigitizerReadoutActor", "Readout")
+    ro.authorize_repeated_volumes = True
+    ro.output_filename = "test037_uid_as_int.root"
+    ro.input_digi_collection = "Hits"
+    ro.group_volume = stack.name
+    ro.discretize_volume = crystal.name
+    ro.policy = "EnergyWeightedCentroidPosition"
+
+    # timing
+    sec = gate.g4_units.second
+    sim.run_timing_intervals = [[0, 0.00005 * sec]]
+
+    # start simulation
+    sim.run()
+    stats = sim.get_actor("Stats")
+    print(stats)
+
+    # ----------------------------------------------------------------------------------------------------------
+    f = uproot.open(hc.get_output_path())
+    hits = f["Hits"].arrays(library="np")
+    hits_mask = hits["TotalEnergyDeposit"] > 0
+    print(f"Number of hits: {len(hits['EventID'])} ({np.sum(hits_mask)} with edep>0)")
+
+    # one integer ID for each string ID (and vice versa)
+    str_ids = hits["PreStepUniqueVolumeID"]
+    int_ids = hits["PreStepUniqueVolumeIDAsInt"]
+    n_str = len(np.unique(str_ids))
+    n_int = len(np.unique(int_ids))
+    n_pairs = len(np.unique([f"{s} {i}" for s, i in zip(str_ids, int_ids)]))
+    is_ok = n_str == n_int == n_pairs and np.all(int_ids >= 0)
+    utility.print_test(
+        is_ok,
+        f"Volume IDs: {n_str} strings, {n_int} integers, {n_pairs} pairs",
+    )
+
+    # adder: same grouping as the string IDs (per event and per crystal)
+    ref_keys, ref_edep = group_edep(
+        hits["EventID"][hits_mask],
+        str_ids[hits_mask],
+        hits["TotalEnergyDeposit"][hits_mask],
+    )
+    singles = f["Singles"].arrays(library="np")
+    keys, edep = group_edep(
+        singles["EventID"],
+        singles["PreStepUniqueVolumeID"],
+        singles["TotalEnergyDeposit"],
+    )
+    b = (
+        len(keys) == len(singles["EventID"])
+        and np.array_equal(ref_keys, keys)
+        and np.allclose(ref_edep, edep)
+    )
+    utility.print_test(
+        b,
+        f"Adder: {len(singles['EventID'])} singles, "
+        f"{len(ref_keys)} groups with the string IDs",
+    )
+    is_ok = is_ok and b
+
+    # readout: same grouping as the string IDs truncated at the stack depth
+    depth = stack.volume_depth_in_tree
+    ref_keys, ref_edep = group_edep(
+        hits["EventID"][hits_mask],
+        [truncate_id(s, depth) for s in str_ids[hits_mask]],
+        hits["TotalEnergyDeposit"][hits_mask],
+    )
+    readout = f["Readout"].arrays(library="np")
+    keys, edep = group_edep(
+        readout["EventID"],
+        [truncate_id(s, depth) for s in readout["PreStepUniqueVolumeID"]],
+        readout["TotalEnergyDeposit"],
+    )
+    b = (
+        len(keys) == len(readout["EventID"])
+        and np.array_equal(ref_keys, keys)
+        and np.allclose(ref_edep, edep)
+    )
+    utility.print_test(
+        b,
+        f"Readout: {len(readout['EventID'])} singles, "
+        f"{len(ref_keys)} groups with the string IDs (depth {depth})",
+    )
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from scipy.spatial.transform import Rotation
+import numpy as np
+import itk
+
+
+def simulate(stopping_power_table):
+    sim = gate.Simulation()
+    sim.random_seed = 123456
+    sim.number_of_threads = 1
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    cm = gate.g4_units.cm
+    mm = gate.g4_units.mm
+    km = gate.g4_units.km
+    MeV = gate.g4_units.MeV
+
+    world = sim.world
+    world.size = [2 * m, 2 * m, 2 * m]
+
+    # water phantom with slabs of several materials along the beam
+    phantom = sim.add_volume("Box", "phantom")
+    phantom.size = [20 * cm, 10 * cm, 10 * cm]
+    phantom.material = "G4_WATER"
+    for i, mat in enumerate(["G4_Si", "G4_BONE_COMPACT_ICRU", "G4_LUNG_ICRP"]):
+        slab = sim.add_volume("Box", f"slab_{i}")
+        slab.mother = phantom
+        slab.size = [1 * cm, 10 * cm, 10 * cm]
+        slab.translation = [(6 - 3 * i) * cm, 0, 0]
+        slab.material = mat
+
+    sim.physics_manager.physics_list_name = "QGSP_BIC_EMY"
+    sim.physics_manager.global_production_cuts.all = 1000 * km
+
+    source = sim.add_source("GenericSource", "source")
+    source.energy.mono = 150 * MeV
+    source.particle = "proton"
+    source.position.type = "disc"
+    source.position.rotation = Rotation.from_euler("y", 90, degrees=True).as_matrix()
+    source.position.sigma_x = 2 * mm
+    source.position.sigma_y = 2 * mm
+    source.position.translation = [10 * cm + 1 * mm, 0, 0]
+    source.direction.type = "momentum"
+    source.direction.momentum = [-1, 0, 0]
+    source.n = 2000
+
+    # "middle" hit type: the same voxels in both simulations
+    name = "table" if stopping_power_table else "calculator"
+    dose = sim.add_actor("DoseActor", f"dose_{name}")
+    dose.attached_to = phantom
+    dose.size = [200, 1, 1]
+    dose.spacing = [1 * mm, 100 * mm, 100 * mm]
+    dose.hit_type = "middle"
+    dose.score_in = "G4_WATER"
+    dose.dose.active = True
+    dose.stopping_power_table = stopping_power_table
+    dose.output_filename = f"test041_{name}.mhd"
+
+    let = sim.add_actor("LETActor", f"let_{name}")
+    let.attached_to = phantom
+    let.size = dose.size
+    let.spacing = dose.spacing
+    let.hit_type = "middle"
+    let.score_in = "G4_WATER"
+    let.averaging_method = "dose_average"
+    let.stopping_power_table = stopping_power_table
+    let.output_filename = f"test041_let_{name}.mhd"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    sim.run(start_new_process=True)
+    print(stats)
+    return sim.get_actor(dose.name), sim.get_actor(let.name), sim.get_actor("stats")
+
+
+def max_rel_diff(f1, f2):
+    a1 = itk.GetArrayFromImage(itk.imread(str(f1)))
+    a2 = itk.GetArrayFromImage(itk.imread(str(f2)))
+    mask = np.fabs(a2) > 0.01 * np.fabs(a2).max()
+    return np.max(np.fabs(a1[mask] - a2[mask]) / np.fabs(a2[mask]))
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test041")
+    sec = gate.g4_units.second
+
+    # tabulated stopping powers vs G4EmCalculator at each step
+    dose1, let1, stats1 = simulate(True)
+    dose2, let2, stats2 = simulate(False)
+
+    # accuracy: same steps, only the stopping powers differ
+    print()
+    tol = 1e-3
+    r = max_rel_diff(dose1.dose.get_output_path(), dose2.dose.get_output_path())
+    is_ok = r < tol
+    utility.print_test(is_ok, f"Dose to water: max relative difference {r:.2e}")
+    r = max_rel_diff(let1.let.get_output_path(), let2.let.get_output_path())
+    b = r < tol
+    utility.print_test(b, f"LET to water: max relative difference {r:.2e}")
+    is_ok = is_ok and b
+
+    # speed (information only, it depends on the machine)
+    t1 = stats1.counts.duration / sec
+    t2 = stats2.counts.duration / sec
+    print(f"Tables:     {t1:.2f} s")
+    print(f"Calculator: {t2:.2f} s")
+    print(f"Speedup:    x{t2 / t1:.2f}")
+
+    utility.test_ok(is_ok)
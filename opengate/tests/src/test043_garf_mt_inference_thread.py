@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate.contrib.spect.ge_discovery_nm670 as gate_spect
+import opengate as gate
+import test043_garf_helpers as test43
+from opengate.tests import utility
+
+
+def simulate(number_of_threads, inference_thread):
+    # create the simulation
+    sim = gate.Simulation()
+
+    # main options
+    sim.g4_verbose = False
+    sim.number_of_threads = number_of_threads
+    sim.visu = False
+    sim.random_seed = 321654987
+    sim.output_dir = test43.paths.output
+
+    # units
+    nm = gate.g4_units.nm
+    mm = gate.g4_units.mm
+    cm = gate.g4_units.cm
+    Bq = gate.g4_units.Bq
+
+    # the total activity does not depend on the nb of threads
+    activity = 1e6 * Bq / number_of_threads
+
+    # add a material database
+    sim.volume_manager.add_material_database(
+        test43.paths.gate_data / "GateMaterials.db"
+    )
+
+    # init world
+    test43.sim_set_world(sim)
+
+    # fake spect head
+    head = gate_spect.add_fake_spect_head(sim, "spect")
+    head.translation = [0, 0, -15 * cm]
+
+    # detector input plane (+ 1nm to avoid overlap)
+    pos, crystal_dist, psd = gate_spect.get_plane_position_and_distance_to_crystal(
+        "lehr"
+    )
+    pos += 1 * nm
+    detPlane = test43.sim_add_detector_plane(sim, head.name, pos)
+
+    # physics
+    test43.sim_phys(sim)
+
+    # sources
+    test43.sim_source_test(sim, activity)
+
+    # arf actor
+    mode = "thread" if inference_thread else "lock"
+    arf = sim.add_actor("ARFActor", "arf")
+    arf.attached_to = detPlane.name
+    arf.output_filename = f"test043_projection_garf_{mode}_{number_of_threads}.mhd"
+    arf.batch_size = 2e4
+    arf.image_size = [128, 128]
+    arf.image_spacing = [4.41806 * mm, 4.41806 * mm]
+    arf.distance_to_crystal = 74.625 * mm
+    arf.pth_filename = test43.paths.gate_data / "pth" / "arf_Tc99m_v034.pth"
+    arf.enable_hit_slice = True
+    arf.flip_plane = True  # because the training was backside
+    arf.gpu_mode = utility.get_gpu_mode_for_tests()
+    arf.inference_thread = inference_thread
+    arf.inference_batch_size = 4e5
+
+    # add stat actor
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    # start simulation
+    sim.run(start_new_process=True)
+
+    return stats, arf
+
+
+def events_per_second(stats):
+    return stats.counts.events / (stats.counts.duration / gate.g4_units.s)
+
+
+if __name__ == "__main__":
+    # compare the throughput with the ARF applied by the tracking threads (lock)
+    # or by the inference thread
+    is_ok = True
+    print()
+    for n in [1, 16]:
+        stats_lock, arf_lock = simulate(n, False)
+        stats_thread, arf_thread = simulate(n, True)
+        pps_lock = events_per_second(stats_lock)
+        pps_thread = events_per_second(stats_thread)
+        print(
+            f"Threads {n:3d}   events/s  lock = {pps_lock:10.1f}  "
+            f"inference thread = {pps_thread:10.1f}  (x{pps_thread / pps_lock:.2f})"
+        )
+
+        # the network is applied once per batch by the tracking threads, while
+        # the inference thread merges the queued batches
+        print(
+            f"Batches lock = {arf_lock.batch_nb} ({arf_lock.inference_nb} inferences)  "
+            f"inference thread = {arf_thread.batch_nb} ({arf_thread.inference_nb} inferences)"
+        )
+        b = (
+            arf_lock.inference_nb == arf_lock.batch_nb
+            and 0 < arf_thread.inference_nb <= arf_thread.batch_nb
+        )
+        utility.print_test(b, "Number of batched inferences")
+        is_ok = is_ok and b
+
+        # same seed, same particles: only the batches given to the network differ
+        is_ok = (
+            utility.assert_images(
+                arf_lock.get_output_path(),
+                arf_thread.get_output_path(),
+                stats_thread,
+                tolerance=1,
+                ignore_value_data2=0,
+                axis="x",
+                sum_tolerance=1,
+            )
+            and is_ok
+        )
+        print()
+
+    utility.test_ok(is_ok)
@@ -14,6 +14,8 @@ def test_voxelized(img, version):
     start = time.time()
     if version == 1:
         i, j, k = v.sample_indices(n)
+    elif version == "g4_alias":
+        i, j, k = v.samples_g4_alias(n)
     else:
         i, j, k = v.sample_indices_slower(n)
     end = time.time()
@@ -53,5 +55,18 @@ if __name__ == "__main__":
     is_ok = test_voxelized(img, 1)
     is_ok = test_voxelized(img, 2) and is_ok
     is_ok = test_voxelized(img, 3) and is_ok
+    # same alias table, sampled on the cpp side (GateSPSVoxelsPosDistribution)
+    is_ok = test_voxelized(img, "g4_alias") and is_ok
+
+    # the alias table is a valid probability distribution of the image
+    v = gate.sources.gansources.VoxelizedSourcePDFSampler(img)
+    imga = itk.array_view_from_image(img).ravel()
+    pdf = np.copy(v.probabilities)
+    np.add.at(pdf, v.aliases, 1 - v.probabilities)
+    pdf = pdf / len(pdf)
+    ref = imga[v.indices] / imga.sum()
+    b = np.allclose(pdf, ref, atol=1e-12) and np.all(imga[v.indices] != 0)
+    utility.print_test(b, f"Alias table of {len(v.indices)} non-zero voxels")
+    is_ok = is_ok and b
 
     utility.test_ok(is_ok)
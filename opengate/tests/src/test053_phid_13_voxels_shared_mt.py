@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from test053_phid_helpers1 import *
+import opengate as gate
+from opengate.image import create_3d_image
+import numpy as np
+import uproot
+import itk
+
+
+def create_activity_image(filename, spacing):
+    # three voxels with different activities, all others are zero
+    img = create_3d_image([10, 8, 6], [spacing] * 3, pixel_type="float")
+    arr = itk.array_view_from_image(img)
+    arr[1, 2, 3] = 1
+    arr[3, 5, 1] = 2
+    arr[4, 7, 8] = 5
+    itk.imwrite(img, str(filename))
+    return np.copy(arr)
+
+
+if __name__ == "__main__":
+    paths = get_default_test_paths(__file__, "", output_folder="test053")
+
+    # units
+    m = g4_units.m
+    mm = g4_units.mm
+    Bq = g4_units.Bq
+    sec = g4_units.second
+
+    sim = gate.Simulation()
+    sim.number_of_threads = 2
+    sim.random_seed = 123654
+    sim.output_dir = paths.output
+
+    # no interaction: the vertex of each gamma is the sampled position
+    sim.world.size = [2 * m, 2 * m, 2 * m]
+    sim.world.material = "G4_Galactic"
+    sphere = sim.add_volume("Sphere", "detector")
+    sphere.rmin = 0.5 * m
+    sphere.rmax = 0.6 * m
+    sphere.material = "G4_Galactic"
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option4"
+
+    # Lu177 voxelized source: all sub-sources share the same distribution
+    spacing = 4 * mm
+    image_filename = paths.output / "test053_phid_13_activity.mhd"
+    activity = create_activity_image(image_filename, spacing)
+    z, a = 71, 177
+    nuclide, _ = get_nuclide_and_direct_progeny(z, a)
+    source = sim.add_source("PhotonFromIonDecaySource", nuclide.nuclide)
+    source.particle = f"ion {z} {a}"
+    source.position.type = "voxels"
+    source.position.image = image_filename
+    source.direction.type = "iso"
+    source.activity = 100000 * Bq / sim.number_of_threads
+
+    phsp = sim.add_actor("PhaseSpaceActor", "phsp")
+    phsp.attached_to = "detector"
+    phsp.attributes = ["EventPosition", "KineticEnergy"]
+    phsp.output_filename = "test053_phid_13_voxels.root"
+    phsp.steps_to_store = "entering"
+
+    sim.add_actor("SimulationStatisticsActor", "stats")
+    sim.run_timing_intervals = [[0, 1 * sec]]
+    sim.run()
+
+    stats = sim.get_actor("stats")
+    print(stats)
+
+    # all sub-sources use the same (single) voxelized distribution
+    g = source.voxel_position_generator
+    b = g is not None and len(source.sub_sources) > 1
+    for s in source.sub_sources:
+        b = b and s.voxel_position_generator is g
+    print(f"Number of sub-sources: {len(source.sub_sources)}")
+    print_test(b, "All sub-sources share the same voxelized distribution")
+    is_ok = b
+
+    # histogram of the event positions in the voxels
+    tree = uproot.open(phsp.get_output_path())["phsp"]
+    pos = np.column_stack([tree[f"EventPosition_{c}"].array() for c in "XYZ"])
+    shape = np.array(activity.shape[::-1])  # X Y Z
+    index = np.floor(pos / spacing + shape / 2.0).astype(int)
+    counts = np.zeros_like(activity)
+    np.add.at(counts, (index[:, 2], index[:, 1], index[:, 0]), 1)
+    n = len(pos)
+
+    # no event outside the active voxels
+    outside = counts[activity == 0].sum()
+    b = outside == 0 and n > 0
+    print_test(b, f"Events outside active voxels: {outside} / {n}")
+    is_ok = is_ok and b
+
+    # the fractions follow the activity
+    ref = activity[activity != 0] / activity.sum()
+    frac = counts[activity != 0] / n
+    for r, f in zip(ref, frac):
+        b = np.fabs(r - f) < 5 * np.sqrt(r * (1 - r) / n)
+        print_test(b, f"Voxel fraction {f:.4f} vs {r:.4f}")
+        is_ok = is_ok and b
+
+    test_ok(is_ok)
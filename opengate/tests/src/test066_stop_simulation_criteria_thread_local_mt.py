@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from scipy.spatial.transform import Rotation
+from opengate.tests import utility
+from opengate.tests.src.test066_stop_simulation_criteria_mt import calculate_mean_unc
+import numpy as np
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test066")
+
+    n_planned = 650000
+    n_threads = 4
+
+    # goal uncertainty, calculated over the voxels whose value is > 0.7 * max edep
+    unc_goal = 0.05
+    thresh_voxel_edep_for_unc_calc = 0.7
+
+    # create the simulation
+    sim = gate.Simulation()
+    sim.random_seed = 983456
+    sim.number_of_threads = n_threads
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+    cm = gate.g4_units.cm
+    um = gate.g4_units.um
+    MeV = gate.g4_units.MeV
+    Bq = gate.g4_units.Bq
+    sec = gate.g4_units.second
+
+    sim.world.size = [1 * m, 1 * m, 1 * m]
+
+    # waterbox
+    waterbox = sim.add_volume("Box", "waterbox")
+    waterbox.size = [10 * cm, 10 * cm, 10 * cm]
+    waterbox.rotation = Rotation.from_euler("y", -20, degrees=True).as_matrix()
+    waterbox.material = "G4_WATER"
+
+    # physics
+    sim.physics_manager.set_production_cut("world", "all", 700 * um)
+
+    # source
+    source = sim.add_source("GenericSource", "mysource")
+    source.energy.mono = 90 * MeV
+    source.particle = "proton"
+    source.position.type = "disc"
+    source.position.radius = 5 * mm
+    source.position.translation = [0, 0, -10 * cm]
+    source.direction.type = "momentum"
+    source.direction.momentum = [0, 0, 1]
+    source.activity = n_planned * Bq
+
+    # dose actor: stop when the goal is reached. The check is done at the
+    # estimated number of events, or every 0.5 s
+    dose = sim.add_actor("DoseActor", "dose")
+    dose.output_filename = "test066-thread-local-edep.mhd"
+    dose.attached_to = waterbox
+    dose.size = [40, 40, 40]
+    dose.spacing = [2.5 * mm, 2.5 * mm, 2.5 * mm]
+    dose.edep_uncertainty.active = True
+    dose.uncertainty_goal = unc_goal
+    dose.uncertainty_first_check_after_n_events = 1000
+    dose.uncertainty_voxel_edep_threshold = thresh_voxel_edep_for_unc_calc
+    dose.uncertainty_check_interval_seconds = 0.5
+
+    stat = sim.add_actor("SimulationStatisticsActor", "Stats")
+
+    sim.run()
+    print(stat)
+
+    # the uncertainty goal implies thread local scoring
+    ok = dose.thread_local_scoring is True
+    utility.print_test(ok, f"Thread local scoring: {dose.thread_local_scoring}")
+
+    # the goal is reached in the final image
+    edep_arr = np.asarray(dose.edep.image)
+    unc_array = np.asarray(dose.edep_uncertainty.image)
+    unc_mean = calculate_mean_unc(
+        edep_arr, unc_array, edep_thresh_rel=thresh_voxel_edep_for_unc_calc
+    )
+    b = unc_mean < unc_goal
+    utility.print_test(b, f"Mean uncertainty {unc_mean:.4f} (goal {unc_goal})")
+    ok = ok and b
+
+    # the simulation stopped because of the goal
+    n_effective = stat.counts.events
+    b = n_effective < n_planned
+    utility.print_test(b, f"Number of events {n_effective} < {n_planned}")
+    ok = ok and b
+
+    # all the events simulated by the threads are in the image
+    b = dose.NbOfEvent == n_effective
+    utility.print_test(b, f"Events in the image {dose.NbOfEvent} vs {n_effective}")
+    ok = ok and b
+
+    utility.test_ok(ok)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+import numpy as np
+import itk
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test067")
+
+    sim = gate.Simulation()
+    sim.random_seed = 654321
+    sim.number_of_threads = 1
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+    MeV = gate.g4_units.MeV
+
+    # world
+    world = sim.world
+    world.size = [1 * m, 1 * m, 1 * m]
+    world.material = "G4_Galactic"
+
+    # empty box: each geantino crosses it in a single step
+    box = sim.add_volume("Box", "box")
+    box.size = [205 * mm, 205 * mm, 205 * mm]
+    box.material = "G4_Galactic"
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option4"
+
+    # isotropic point source in the center
+    source = sim.add_source("GenericSource", "source")
+    source.particle = "geantino"
+    source.energy.mono = 1 * MeV
+    source.position.type = "point"
+    source.direction.type = "iso"
+    source.n = 500000
+
+    # track-length fluence
+    fluence = sim.add_actor("FluenceActor", "fluence")
+    fluence.attached_to = box
+    fluence.output_filename = "test067_fluence_track_length.mhd"
+    fluence.size = [41, 41, 41]
+    fluence.spacing = [5 * mm, 5 * mm, 5 * mm]
+    fluence.hit_type = "track_length"
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    sim.run()
+    print(stats)
+
+    # one step per geantino in the box, but all crossed voxels are scored
+    img = itk.imread(fluence.fluence.get_output_path())
+    arr = itk.GetArrayFromImage(img)
+    b = np.count_nonzero(arr) > 0.9 * arr.size
+    utility.print_test(b, f"Scored voxels {np.count_nonzero(arr)} / {arr.size}")
+    is_ok = b
+
+    # point source: the fluence at distance r is N / (4 pi r^2)
+    c = (np.arange(41) - 20) * 5
+    z, y, x = np.meshgrid(c, c, c, indexing="ij")
+    r = np.sqrt(x**2 + y**2 + z**2)
+    for r1, r2 in [(30, 40), (50, 60), (80, 90)]:
+        mask = (r >= r1) & (r < r2)
+        ratio = np.mean(arr[mask] * 4 * np.pi * r[mask] ** 2 / source.n)
+        b = np.fabs(ratio - 1) < 0.03
+        utility.print_test(
+            b, f"Fluence x 4 pi r^2 / N for r in [{r1}, {r2}] mm = {ratio:.4f}"
+        )
+        is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
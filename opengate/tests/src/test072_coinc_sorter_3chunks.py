@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from opengate.actors.coincidences import (
+    coincidences_sorter,
+    coincidences_sorter_to_root,
+)
+import uproot
+import subprocess
+import os
+import time
+
+
+def main(dependency="test072_coinc_sorter_1.py"):
+    # test paths
+    paths = utility.get_default_test_paths(
+        __file__, output_folder="test072_coinc_sorter"
+    )
+
+    # The test needs the output of test072_coinc_sorter_1.py
+    # If the output of test072_coinc_sorter_1.py does not exist, create it
+    if not os.path.isfile(paths.output / "test72_output_1.root"):
+        print("---------- Begin of test072_coinc_sorter_1.py ----------")
+        subprocess.call(["python", paths.current / dependency])
+        print("----------- End of test072_coinc_sorter_1.py -----------")
+
+    # open root file
+    path_to_rootfile = paths.output / "test72_output_1.root"
+    print(f"Opening {path_to_rootfile} ...")
+    root_file = uproot.open(path_to_rootfile)
+    singles_tree = root_file["Singles_crystal"]
+    n = int(singles_tree.num_entries)
+    print(f"There are {n} singles")
+
+    ns = gate.g4_units.nanosecond
+    time_window = 300 * ns
+    minSecDiff = 1  # NOT YET IMPLEMENTED
+
+    # the number of coincidences must not depend on the chunk size,
+    # the time windows are carried from one chunk to the next
+    is_ok = True
+    for policy in ["keepAll", "removeMultiples", "takeWinnerOfGoods"]:
+        ref = None
+        for chunk_size in [1000000, 4000, 333]:
+            t = time.time()
+            coincidences = coincidences_sorter(
+                singles_tree, time_window, minSecDiff, policy, chunk_size=chunk_size
+            )
+            t = time.time() - t
+            nc = len(coincidences["GlobalTime1"])
+            print(
+                f"Policy {policy:20} chunk size {chunk_size:8} : {nc} coincidences in {t:.3f} sec"
+            )
+            if ref is None:
+                ref = nc
+            b = nc == ref
+            utility.print_test(b, f"Same number of coincidences {nc} vs {ref}")
+            is_ok = is_ok and b
+
+    # takeWinnerOfGoods keeps one pair per event, so less than keepAll
+    keep_all = coincidences_sorter(singles_tree, time_window, minSecDiff, "keepAll")
+    winners = coincidences_sorter(
+        singles_tree, time_window, minSecDiff, "takeWinnerOfGoods"
+    )
+    n_all = len(keep_all["EventID1"])
+    n_winners = len(winners["EventID1"])
+    b = n_winners <= n_all
+    utility.print_test(b, f"takeWinnerOfGoods {n_winners} <= keepAll {n_all}")
+    is_ok = is_ok and b
+
+    # write the coincidences chunk by chunk in a root file
+    output = paths.output / "coinc3keepAll.root"
+    nc = coincidences_sorter_to_root(
+        singles_tree, output, time_window, "keepAll", chunk_size=4000
+    )
+    nc_file = int(uproot.open(output)["Coincidences"].num_entries)
+    b = nc == nc_file == n_all
+    utility.print_test(b, f"Coincidences written in {output}: {nc_file} vs {n_all}")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
+
+
+if __name__ == "__main__":
+    main()
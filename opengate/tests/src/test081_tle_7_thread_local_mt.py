@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from opengate.tests.src.test081_tle_helpers import add_waterbox, add_source
+import numpy as np
+import itk
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test081_tle")
+
+    # create the simulation
+    sim = gate.Simulation()
+
+    # main options
+    sim.random_seed = 321654
+    sim.output_dir = paths.output
+    sim.number_of_threads = 4
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+
+    #  change world size
+    world = sim.world
+    world.size = [1 * m, 1 * m, 1 * m]
+
+    # waterbox with low and high density inserts
+    waterbox = add_waterbox(sim)
+
+    # physics
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option3"
+    sim.physics_manager.global_production_cuts.all = 1 * mm
+
+    # default source for tests
+    source = add_source(sim, n=1e5)
+
+    # TLE actor with the default options: thread-local scoring, 4000 bins
+    tle1 = sim.add_actor("TLEDoseActor", "tle1")
+    tle1.output_filename = "test081_tle_thread_local.mhd"
+    tle1.attached_to = waterbox
+    tle1.size = [50, 50, 50]
+    tle1.spacing = [x / y for x, y in zip(waterbox.size, tle1.size)]
+
+    # same TLE actor, scoring with a mutex and a much finer mu_en table
+    tle2 = sim.add_actor("TLEDoseActor", "tle2")
+    tle2.output_filename = "test081_tle_mutex.mhd"
+    tle2.attached_to = waterbox
+    tle2.size = tle1.size
+    tle2.spacing = tle1.spacing
+    tle2.thread_local_scoring = False
+    tle2.mu_en_table_bins = 200000
+
+    # same TLE actor, with the legacy lookup of mu_en in the database at each step
+    tle3 = sim.add_actor("TLEDoseActor", "tle3")
+    tle3.output_filename = "test081_tle_legacy_mu_en.mhd"
+    tle3.attached_to = waterbox
+    tle3.size = tle1.size
+    tle3.spacing = tle1.spacing
+    tle3.mu_en_table_bins = 0
+
+    # add stat actor
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    # start simulation
+    sim.run()
+    print(stats)
+
+    # the actors score the same steps: only the voxel sampled along the step
+    # and the tabulation of mu_en differ
+    arr1 = itk.GetArrayFromImage(itk.imread(tle1.edep.get_output_path()))
+    arr2 = itk.GetArrayFromImage(itk.imread(tle2.edep.get_output_path()))
+    arr3 = itk.GetArrayFromImage(itk.imread(tle3.edep.get_output_path()))
+    is_ok = True
+    for name, arr in [("200000 bins", arr2), ("legacy mu_en", arr3)]:
+        t1 = arr1.sum()
+        t2 = arr.sum()
+        r = np.fabs(t1 - t2) / t2
+        tol = 1e-3
+        b = r < tol
+        utility.print_test(
+            b,
+            f"Total edep 4000 bins {t1:.4f} vs {name} {t2:.4f} MeV = "
+            f"{r * 100:.3f}% (tol={tol})",
+        )
+        is_ok = is_ok and b
+
+        # depth profiles
+        p1 = arr1.sum(axis=(1, 2))
+        p2 = arr.sum(axis=(1, 2))
+        mask = p2 > 0.05 * p2.max()
+        r = np.fabs(p1[mask] - p2[mask]) / p2[mask]
+        tol = 0.02
+        b = r.max() < tol
+        utility.print_test(
+            b, f"Max relative difference of the profiles with {name} {r.max():.4f}"
+        )
+        is_ok = is_ok and b
+
+    utility.test_ok(is_ok)
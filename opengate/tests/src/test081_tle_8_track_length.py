@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+from opengate.tests.src.test081_tle_helpers import (
+    add_waterbox,
+    add_source,
+    plot_pdd,
+    compare_pdd,
+)
+
+
+def simulate(name, hit_type, max_step_size):
+    # create the simulation
+    sim = gate.Simulation()
+    sim.random_seed = 12356654
+    sim.output_dir = paths.output
+    sim.number_of_threads = 1
+
+    # units
+    m = gate.g4_units.m
+    mm = gate.g4_units.mm
+
+    #  change world size
+    world = sim.world
+    world.size = [1 * m, 1 * m, 1 * m]
+
+    # waterbox with low and high density inserts
+    waterbox = add_waterbox(sim)
+
+    # physics
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option3"
+    sim.physics_manager.global_production_cuts.all = 1 * mm
+    if max_step_size is not None:
+        sim.physics_manager.set_max_step_size("waterbox", max_step_size)
+        sim.physics_manager.set_user_limits_particles("gamma")
+
+    # default source for tests
+    add_source(sim, n=2e5)
+
+    tle = sim.add_actor("TLEDoseActor", name)
+    tle.output_filename = f"test081_{name}.mhd"
+    tle.attached_to = waterbox
+    tle.dose.active = True
+    tle.size = [100, 100, 100]
+    tle.spacing = [x / y for x, y in zip(waterbox.size, tle.size)]
+    tle.hit_type = hit_type
+
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    sim.run(start_new_process=True)
+    print(stats)
+    return sim.get_actor(name), sim.get_actor("stats")
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test081_tle")
+    mm = gate.g4_units.mm
+
+    # reference: the photons are forced to step every 1 mm
+    tle_ref, stats_ref = simulate("tle_ref", "random", 1 * mm)
+
+    # track length distributed over the crossed voxels, no step limit
+    tle, stats = simulate("tle_track_length", "track_length", None)
+
+    # far fewer steps
+    s1 = stats_ref.counts.steps
+    s2 = stats.counts.steps
+    b = s2 < s1 / 2
+    utility.print_test(b, f"Number of steps {s2} vs {s1} with 1 mm steps")
+    is_ok = b
+
+    # same depth dose
+    ax, plt = plot_pdd(tle_ref, tle)
+    f1 = tle_ref.edep.get_output_path()
+    f2 = tle.edep.get_output_path()
+    is_ok = compare_pdd(f1, f2, tle.spacing[2], ax[0], tol=0.05) and is_ok
+
+    print()
+    f1 = tle_ref.dose.get_output_path()
+    f2 = tle.dose.get_output_path()
+    is_ok = compare_pdd(f1, f2, tle.spacing[2], ax[1], tol=0.05) and is_ok
+
+    # output
+    f = paths.output / "pdd_track_length.png"
+    plt.savefig(f)
+    print(f"PDD image saved in {f}")
+
+    utility.test_ok(is_ok)
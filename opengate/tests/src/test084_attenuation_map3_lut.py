@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+import itk
+import numpy as np
+import opengate as gate
+from opengate.tests import utility
+from opengate.sources.base import get_rad_gamma_spectrum
+
+
+def density_image_with_masks(img_volume, material_database):
+    # previous implementation: one full volume mask per interval
+    act = itk.GetArrayFromImage(img_volume.itk_image)
+    arho = np.zeros(act.shape, dtype=np.float32)
+    for hu0, hu1, mat_name in img_volume.voxel_materials:
+        arho[(act >= hu0) * (act < hu1)] = material_database[mat_name].GetDensity()
+    arho *= gate.g4_units.cm3 / gate.g4_units.g
+    return arho
+
+
+def image_from_labels_with_masks(label_image, label_to_value):
+    # previous implementation: one full volume mask per label
+    arr = itk.GetArrayViewFromImage(label_image).copy().astype("float")
+    for label, value in label_to_value.items():
+        arr[arr == label] = value
+    return arr
+
+
+def compare_with_previous_implementation(simulation_engine):
+    sim = simulation_engine.simulation
+    patient = sim.volume_manager.get_volume("patient")
+    materials = sim.volume_manager.material_database.g4_materials
+    is_ok = True
+
+    # density image
+    t = time.time()
+    ref = density_image_with_masks(patient, materials)
+    t_ref = time.time() - t
+    for chunk_size in [None, 7]:
+        t = time.time()
+        rho = patient.create_density_image(chunk_size=chunk_size)
+        t_lut = time.time() - t
+        # the voxels outside all intervals (0 before) now have the density
+        # of the default material, so they are not compared
+        inside = ref != 0
+        b = np.array_equal(itk.array_view_from_image(rho)[inside], ref[inside])
+        utility.print_test(
+            b,
+            f"Density image  (chunk size {chunk_size}): "
+            f"masks {t_ref:.3f} sec  LUT {t_lut:.3f} sec  (x{t_ref / t_lut:.1f})",
+        )
+        is_ok = is_ok and b
+
+    # generic label -> value image (as used for the attenuation image)
+    rng = np.random.default_rng(123)
+    label_to_value = {
+        label: rng.uniform(0.01, 0.5)
+        for label in patient.material_to_label_lut.values()
+    }
+    t = time.time()
+    ref = image_from_labels_with_masks(patient.label_image, label_to_value)
+    t_ref = time.time() - t
+    t = time.time()
+    img = patient.create_image_from_label_lut(label_to_value, np.float64)
+    t_lut = time.time() - t
+    b = np.array_equal(itk.array_view_from_image(img), ref)
+    utility.print_test(
+        b,
+        f"Label LUT image: masks {t_ref:.3f} sec  LUT {t_lut:.3f} sec  "
+        f"(x{t_ref / t_lut:.1f})",
+    )
+    is_ok = is_ok and b
+
+    simulation_engine.user_hook_log.append(is_ok)
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, "", output_folder="test084")
+
+    # create the simulation
+    sim = gate.Simulation()
+
+    # main options
+    sim.output_dir = paths.output
+
+    # units
+    m = gate.g4_units.m
+    keV = gate.g4_units.keV
+    gcm3 = gate.g4_units.g_cm3
+
+    #  change world size
+    world = sim.world
+    world.size = [1 * m, 1 * m, 1 * m]
+
+    # add a material database
+    sim.volume_manager.add_material_database(paths.data / "GateMaterials.db")
+
+    # image, with a large number of materials
+    patient = sim.add_volume("Image", "patient")
+    patient.image = paths.data / "patient-4mm.mhd"
+    patient.material = "G4_AIR"  # material used by default
+    f1 = str(paths.data / "Schneider2000MaterialsTable.txt")
+    f2 = str(paths.data / "Schneider2000DensitiesTable.txt")
+    tol = 0.01 * gcm3
+    patient.voxel_materials, materials = (
+        gate.geometry.materials.HounsfieldUnit_to_material(sim, tol, f1, f2)
+    )
+    print(f"Number of materials: {len(materials)}")
+
+    # mu map actor, like test084_attenuation_map2_hu
+    mumap = sim.add_actor("AttenuationImageActor", "mumap")
+    mumap.image_volume = patient
+    mumap.output_filename = "mumap3.mhd"
+    mumap.energy = get_rad_gamma_spectrum("Lu177").energies[3]
+    mumap.database = "EPDL"
+
+    # compare the density and label images with the previous implementation
+    sim.user_hook_after_init = compare_with_previous_implementation
+
+    sim.run()
+
+    # the attenuation image must be the same as the reference
+    is_ok = all(sim.user_hook_log)
+    is_ok = (
+        utility.assert_images(
+            paths.output_ref / "mumap2.mhd",
+            mumap.get_output_path(),
+            tolerance=1e-5,
+            sum_tolerance=1e-5,
+        )
+        and is_ok
+    )
+
+    utility.test_ok(is_ok)
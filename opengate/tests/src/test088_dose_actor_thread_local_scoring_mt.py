@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import opengate as gate
+from opengate.tests import utility
+
+
+def simulate(paths, number_of_threads, thread_local_scoring):
+    # create the simulation
+    sim = gate.Simulation()
+
+    # main options
+    sim.g4_verbose = False
+    sim.visu = False
+    sim.number_of_threads = number_of_threads
+    sim.random_seed = 123654
+    sim.output_dir = paths.output
+
+    # shortcuts to units
+    mm = gate.g4_units.mm
+    cm = gate.g4_units.cm
+    m = gate.g4_units.m
+    MeV = gate.g4_units.MeV
+    Bq = gate.g4_units.Bq
+
+    #  change world size
+    world = sim.world
+    world.size = [1 * m, 1 * m, 1 * m]
+
+    # waterbox
+    waterbox = sim.add_volume("Box", "waterbox")
+    waterbox.size = [20 * cm, 20 * cm, 20 * cm]
+    waterbox.material = "G4_WATER"
+
+    # physics
+    sim.physics_manager.physics_list_name = "G4EmStandardPhysics_option3"
+    sim.physics_manager.set_production_cut("world", "all", 1 * mm)
+
+    # source, the total number of primaries does not depend on the nb of threads
+    source = sim.add_source("GenericSource", "mysource")
+    source.energy.mono = 120 * MeV
+    source.particle = "proton"
+    source.position.type = "disc"
+    source.position.radius = 5 * mm
+    source.position.translation = [0, 0, -15 * cm]
+    source.direction.type = "momentum"
+    source.direction.momentum = [0, 0, 1]
+    source.n = 20000 / number_of_threads
+
+    # dose actor
+    mode = "tl" if thread_local_scoring else "mutex"
+    dose = sim.add_actor("DoseActor", "dose")
+    dose.output_filename = f"test088_{mode}_{number_of_threads}.mhd"
+    dose.attached_to = waterbox
+    dose.size = [50, 50, 100]
+    dose.spacing = [4 * mm, 4 * mm, 2 * mm]
+    dose.dose.active = True
+    dose.edep_uncertainty.active = True
+    dose.counts.active = True
+    dose.thread_local_scoring = thread_local_scoring
+
+    # stats
+    stats = sim.add_actor("SimulationStatisticsActor", "stats")
+
+    # go
+    sim.run(start_new_process=True)
+
+    return stats, dose
+
+
+def events_per_second(stats):
+    return stats.counts.events / (stats.counts.duration / gate.g4_units.s)
+
+
+if __name__ == "__main__":
+    paths = utility.get_default_test_paths(__file__, output_folder="test088")
+
+    # compare the two scoring modes for several numbers of threads
+    threads = [1, 2, 4, 8]
+    is_ok = True
+    print()
+    for n in threads:
+        stats_mutex, dose_mutex = simulate(paths, n, False)
+        stats_tl, dose_tl = simulate(paths, n, True)
+        pps_mutex = events_per_second(stats_mutex)
+        pps_tl = events_per_second(stats_tl)
+        print(
+            f"Threads {n:3d}   events/s  mutex = {pps_mutex:10.1f}  "
+            f"thread local = {pps_tl:10.1f}  (x{pps_tl / pps_mutex:.2f})"
+        )
+
+        # same seed and same nb of threads: the images must be the same
+        # (up to the order of the float additions)
+        for item in ["edep", "edep_uncertainty", "dose", "counts"]:
+            is_ok = (
+                utility.assert_images(
+                    getattr(dose_mutex, item).get_output_path(),
+                    getattr(dose_tl, item).get_output_path(),
+                    stats_tl,
+                    tolerance=1e-3,
+                    ignore_value_data2=0,
+                    sum_tolerance=1e-3,
+                )
+                and is_ok
+            )
+        print()
+
+    utility.test_ok(is_ok)
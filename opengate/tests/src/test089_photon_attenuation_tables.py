@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import numpy as np
+from opengate.tests import utility
+from opengate.data import PhotonAttenuation as pa
+from opengate.data.PhotonAttenuationMixture import PhotonAttenuationMixture
+
+# dtype, shape and sha256 of the bytes of the tables, computed from the
+# former python module where the tables were written as list literals
+reference_tables = {
+    "energy": (
+        "<f8",
+        (36,),
+        "99a1874381daa803d44ce482dc99d560d065c1f34aef4b86f5ab735bbd60092c",
+    ),
+    "mac": (
+        "<f8",
+        (100, 36),
+        "bff0e57c9495225b8a678c0f4b2bfe00067bba2546d62c7533f8d5babd9805b4",
+    ),
+    "meac": (
+        "<f8",
+        (92, 36),
+        "a26833f47ed17b013d975ee1cafa04d43a41f6bd20c643b13c903aa7a103748e",
+    ),
+    "edges": (
+        "<f8",
+        (568, 6),
+        "543b8e893e2193ae8adb8bbda27c51ea2d58613edd96d064b9941485363a5357",
+    ),
+    "PropsEl": (
+        "<U32",
+        (100, 4),
+        "ccc41a61d6bf1f5ea94efbd054031b1396362906d86db0bd3e670a0fc5d45122",
+    ),
+    "PropsMix": (
+        "<U161",
+        (196, 5),
+        "9b15af04423cd6122d7c751f2251638862455e88e1013efebd48343e86c61dad",
+    ),
+}
+
+
+if __name__ == "__main__":
+    # nothing is read when the module is imported
+    is_ok = pa.get_table.cache_info().currsize == 0
+    utility.print_test(is_ok, "No table loaded at import")
+
+    # the tables are bit-identical to the former ones
+    for name, (dtype, shape, sha) in reference_tables.items():
+        t = pa.get_table(name)
+        h = hashlib.sha256(np.ascontiguousarray(t).tobytes()).hexdigest()
+        b = t.dtype.str == dtype and t.shape == shape and h == sha
+        utility.print_test(b, f"Table {name} {t.dtype.str} {t.shape} {h[:12]}")
+        is_ok = is_ok and b
+
+    # a few values, as written in the former tables
+    b = (
+        pa.energy[0] == 1.000e-3
+        and pa.mac[0, 0] == 7.217
+        and pa.meac[0, 0] == 6.820
+        and list(pa.edges[-1]) == [100, 1.43e-01, 1.09e00, 3.50e00, 0, 0]
+        and list(pa.PropsEl[0]) == ["0.99212", "8.375e-05", "H", "Hydrogen"]
+    )
+    utility.print_test(b, "Values of the tables")
+    is_ok = is_ok and b
+
+    # the numerical tables are memory-mapped and read-only
+    b = isinstance(pa.mac, np.memmap) and not pa.mac.flags.writeable
+    utility.print_test(b, "Memory-mapped tables")
+    is_ok = is_ok and b
+
+    # the functions still work (water, 140.5 keV)
+    mu = PhotonAttenuationMixture("Water", 0.1405, 1)[0]
+    b = 0.14 < mu < 0.16
+    utility.print_test(b, f"Water mass attenuation coefficient {mu:.4f} cm2/g")
+    is_ok = is_ok and b
+
+    utility.test_ok(is_ok)